@@ -0,0 +1,32 @@
+"""
+Feature engine for the features/ library.
+"""
+from .cache import FeatureCache
+from .chunked import compute_features_chunked
+from .context import FeatureContext, as_context
+from .memo import compute_scope, shared
+from .panel import Panel, compute_panel_features
+from .parallel import compute_features_parallel
+from .registry import FeatureRegistry, FeatureVariant, compute_features, default_registry
+from .store import FeatureStore
+from .streaming import StreamingFeature
+from .synthetic import make_consecutive_ohlcv
+
+__all__ = [
+    "FeatureCache",
+    "FeatureContext",
+    "FeatureRegistry",
+    "FeatureStore",
+    "FeatureVariant",
+    "Panel",
+    "StreamingFeature",
+    "as_context",
+    "compute_features",
+    "compute_features_chunked",
+    "compute_features_parallel",
+    "compute_panel_features",
+    "compute_scope",
+    "default_registry",
+    "make_consecutive_ohlcv",
+    "shared",
+]
@@ -0,0 +1,218 @@
+"""
+Per-feature throughput and memory benchmark of the feature library.
+
+Every registered module is run on synthetic OHLCV (make_consecutive_ohlcv)
+at several sizes, each call on a fresh FeatureContext so no module is
+credited with intermediates another one built. The frames use no drift and
+a small per-bar volatility (FRAME_PARAMS): with the notebook defaults the
+close compounds to ~1e230 by a million rows, its square overflows and the
+largest size would time NaN paths. For every (feature, size) the report
+records
+
+    seconds       best wall time of `repeat` calls
+    rows_per_sec  size / seconds
+    peak_mb       peak memory allocated during one call (tracemalloc; numpy
+                  buffers included), measured in a separate untimed call
+
+and per feature the scaling exponent: the log-log slope of seconds against
+rows (about 1 for a linear kernel, clearly above it for hidden quadratic
+work). Every module is called once on the smallest frame beforehand, so
+numba compilation and first imports stay out of the numbers.
+
+Reports are plain JSON. `compare` checks one against a stored baseline and
+lists the (feature, size) pairs that got slower or hungrier than the
+tolerance; `ranking` orders features by time at the largest size, which is
+the list to optimize from.
+
+    python -m feature_engine.benchmark --sizes 10000 100000 1000000 \\
+        --out bench.json --baseline bench_baseline.json
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .context import FeatureContext
+from .registry import FeatureRegistry, default_registry
+from .synthetic import make_consecutive_ohlcv
+
+PathLike = Union[str, Path]
+Report = Dict[str, Any]
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+FRAME_PARAMS: Dict[str, float] = {"drift_per_bar": 0.0, "vol_per_bar": 0.002}
+
+
+def benchmark_frame(n: int, seed: int = 0) -> pd.DataFrame:
+    """The synthetic OHLCV of `n` rows the benchmark times; raises if its prices or their squares overflow."""
+    df = make_consecutive_ohlcv(n, seed=seed, **FRAME_PARAMS)
+    prices = df[["open", "high", "low", "close"]].to_numpy()
+    if not (np.isfinite(df.to_numpy()).all() and np.isfinite(np.square(prices)).all()):
+        raise ValueError(f"Synthetic frame of {n} rows is not finite; lower FRAME_PARAMS.")
+    return df
+
+
+def _run(module, df: pd.DataFrame) -> None:
+    np.asarray(module.compute_feature(FeatureContext(df)), dtype=np.float64)
+
+
+def _seconds(module, df: pd.DataFrame, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        _run(module, df)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _peak_mb(module, df: pd.DataFrame) -> float:
+    tracemalloc.start()
+    try:
+        _run(module, df)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 2**20
+
+
+def scaling_exponent(rows: Sequence[int], seconds: Sequence[float]) -> Optional[float]:
+    """Least-squares slope of log(seconds) on log(rows); None with fewer than two sizes."""
+    x = np.log(np.asarray(rows, dtype=np.float64))
+    y = np.log(np.maximum(np.asarray(seconds, dtype=np.float64), 1e-9))
+    if x.shape[0] < 2 or np.ptp(x) == 0:
+        return None
+    return float(np.polyfit(x, y, 1)[0])
+
+
+def run_benchmark(sizes: Sequence[int] = DEFAULT_SIZES, codes: Optional[Iterable[str]] = None,
+                  repeat: int = 1, memory: bool = True, seed: int = 0,
+                  registry: Optional[FeatureRegistry] = None) -> Report:
+    """Benchmark `codes` (default: all) at every size in `sizes`; returns the report dict."""
+    registry = default_registry if registry is None else registry
+    names = registry.codes if codes is None else list(codes)
+    sizes = sorted(int(n) for n in sizes)
+    frames = {n: benchmark_frame(n, seed) for n in sizes}
+
+    modules = {code: registry.get(code) for code in names}
+    for module in modules.values():
+        _run(module, frames[sizes[0]])  # warm-up: numba compile, lazy imports
+
+    features: Dict[str, Any] = {}
+    for code, module in modules.items():
+        per_size = {}
+        for n in sizes:
+            seconds = _seconds(module, frames[n], repeat)
+            entry = {"seconds": seconds, "rows_per_sec": n / seconds if seconds > 0 else None}
+            if memory:
+                entry["peak_mb"] = _peak_mb(module, frames[n])
+            per_size[str(n)] = entry
+        features[code] = {
+            "sizes": per_size,
+            "exponent": scaling_exponent(sizes, [per_size[str(n)]["seconds"] for n in sizes]),
+        }
+
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "sizes": sizes,
+            "repeat": repeat,
+            "seed": seed,
+            "frame": dict(FRAME_PARAMS),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+        },
+        "features": features,
+    }
+
+
+def ranking(report: Report) -> List[Dict[str, Any]]:
+    """Features by time at the largest size, slowest first, with their share of the total."""
+    size = str(max(report["meta"]["sizes"]))
+    rows = [(code, entry["sizes"][size], entry["exponent"]) for code, entry in report["features"].items()]
+    total = sum(stats["seconds"] for _, stats, _ in rows) or 1.0
+    rows.sort(key=lambda row: -row[1]["seconds"])
+    return [{"code": code, "seconds": stats["seconds"], "share": stats["seconds"] / total,
+             "rows_per_sec": stats["rows_per_sec"], "peak_mb": stats.get("peak_mb"), "exponent": exponent}
+            for code, stats, exponent in rows]
+
+
+def compare(report: Report, baseline: Report, tolerance: float = 0.25,
+            min_seconds: float = 0.005, min_mb: float = 1.0) -> List[Dict[str, Any]]:
+    """
+    Regressions of `report` against `baseline`: (feature, size, metric) pairs
+    more than `tolerance` (relative) worse. Differences under `min_seconds`
+    or `min_mb` are timer/allocator noise and never count.
+    """
+    regressions = []
+    for code, entry in report["features"].items():
+        base = baseline.get("features", {}).get(code)
+        if base is None:
+            continue
+        for size, stats in entry["sizes"].items():
+            ref = base["sizes"].get(size)
+            if ref is None:
+                continue
+            for metric, floor in (("seconds", min_seconds), ("peak_mb", min_mb)):
+                new, old = stats.get(metric), ref.get(metric)
+                if new is None or old is None:
+                    continue
+                if new - old > floor and new > old * (1.0 + tolerance):
+                    regressions.append({"code": code, "size": int(size), "metric": metric,
+                                        "baseline": old, "current": new, "ratio": new / old if old else None})
+    regressions.sort(key=lambda r: -(r["ratio"] or float("inf")))
+    return regressions
+
+
+def save_report(report: Report, path: PathLike) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+
+def load_report(path: PathLike) -> Report:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--codes", nargs="+", default=None, help="feature codes (default: all)")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--out", default="bench.json", help="report JSON to write")
+    parser.add_argument("--baseline", default=None, help="report JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--top", type=int, default=15, help="rows of the optimization list to print")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.sizes, args.codes, repeat=args.repeat, memory=not args.no_memory)
+    save_report(report, args.out)
+
+    size = max(report["meta"]["sizes"])
+    print(f"slowest features at {size:,} rows:")
+    for row in ranking(report)[:args.top]:
+        exponent = "  n/a" if row["exponent"] is None else f"{row['exponent']:5.2f}"
+        peak = "" if row["peak_mb"] is None else f"  {row['peak_mb']:8.1f} MB"
+        print(f"  {row['code']:<40} {row['seconds']:9.4f} s  {row['share']:6.1%}  n^{exponent}{peak}")
+
+    if args.baseline is None:
+        return 0
+    regressions = compare(report, load_report(args.baseline), tolerance=args.tolerance)
+    for r in regressions:
+        print(f"REGRESSION {r['code']} @ {r['size']:,} rows: {r['metric']} "
+              f"{r['baseline']:.4g} -> {r['current']:.4g}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
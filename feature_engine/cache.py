@@ -0,0 +1,134 @@
+"""
+Content-addressed on-disk cache of feature columns.
+
+Every column is stored as one .npy file under
+`root/<feature code>/<key>.npy`, where key hashes
+  - the input: index and numeric columns of the frame (exact bytes),
+  - the code: the feature module's source plus every feature_engine source,
+  - the parameters the caller passes (JSON, sorted keys).
+A changed module, engine or input slice therefore simply misses; nothing is
+ever invalidated in place. Hits are opened with mmap_mode="r", so a rerun
+reads only the columns it asks for and no bytes are parsed.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .context import FeatureContext, FrameLike, as_context
+from .registry import FeatureRegistry, default_registry
+
+ENGINE_DIR = Path(__file__).resolve().parent
+
+PathLike = Union[str, Path]
+
+
+def _digest(parts: Iterable[bytes]) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    for part in parts:
+        h.update(len(part).to_bytes(8, "little"))
+        h.update(part)
+    return h.hexdigest()
+
+
+def input_fingerprint(context: FeatureContext) -> str:
+    """Hash of the index (dtype + bytes) and every numeric column (name + float64 bytes)."""
+    def parts():
+        index = context.index
+        if isinstance(index, pd.DatetimeIndex):
+            yield str(index.tz).encode()
+            yield index.as_unit("ns").asi8.tobytes()
+        else:
+            values = index.to_numpy()
+            yield values.dtype.str.encode()
+            if values.dtype.kind not in "biufcmM":
+                # object / extension labels: their hashes, not the pointers
+                values = pd.util.hash_pandas_object(index, index=False).to_numpy()
+            yield np.ascontiguousarray(values).tobytes()
+        for name in sorted(context.columns):
+            try:
+                values = context.array(name)
+            except (TypeError, ValueError):
+                continue
+            yield name.encode()
+            yield values.tobytes()
+
+    return _digest(parts())
+
+
+def source_fingerprint(module: ModuleType) -> str:
+    """Hash of the module's source file plus all feature_engine sources."""
+    files = [Path(module.__file__)] + sorted(ENGINE_DIR.glob("*.py"))
+    return _digest(f.name.encode() + b"\0" + f.read_bytes() for f in files)
+
+
+class FeatureCache:
+    """Feature columns on disk, keyed by (input, source, parameters)."""
+
+    def __init__(self, root: PathLike, registry: Optional[FeatureRegistry] = None):
+        self.root = Path(root)
+        self.registry = default_registry if registry is None else registry
+        self.hits = 0
+        self.misses = 0
+        self._sources: Dict[str, str] = {}
+
+    def key(self, code: str, input_hash: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        source = self._sources.get(code)
+        if source is None:
+            source = self._sources[code] = source_fingerprint(self.registry.get(code))
+        blob = json.dumps(params or {}, sort_keys=True, default=str).encode()
+        return _digest([input_hash.encode(), source.encode(), blob])
+
+    def path(self, code: str, key: str) -> Path:
+        return self.root / code / f"{key}.npy"
+
+    def columns(self, df: FrameLike, codes: Optional[Iterable[str]] = None,
+                params: Optional[Mapping[str, Mapping[str, Any]]] = None) -> Dict[str, np.ndarray]:
+        """
+        {code: column} for `codes` (default: all), computing only misses.
+
+        Hits come back as read-only memory maps; misses are computed on one
+        shared FeatureContext, written to disk and returned as arrays.
+        `params` optionally maps code -> parameters that are part of its key.
+        """
+        context = as_context(df)
+        names = self.registry.codes if codes is None else list(codes)
+        input_hash = input_fingerprint(context)
+        params = params or {}
+
+        result: Dict[str, np.ndarray] = {}
+        for code in names:
+            path = self.path(code, self.key(code, input_hash, params.get(code)))
+            if path.exists():
+                self.hits += 1
+                result[code] = np.load(path, mmap_mode="r")
+                continue
+            self.misses += 1
+            values = np.asarray(self.registry.get(code).compute_feature(context), dtype=np.float64)
+            self._write(path, values)
+            result[code] = values
+        return result
+
+    def compute(self, df: FrameLike, codes: Optional[Iterable[str]] = None,
+                params: Optional[Mapping[str, Mapping[str, Any]]] = None) -> Tuple[np.ndarray, List[str]]:
+        """Cached counterpart of FeatureRegistry.compute: (float32 matrix, names)."""
+        context = as_context(df)
+        cols = self.columns(context, codes, params)
+        names = list(cols)
+        out = np.empty((len(context), len(names)), dtype=np.float32)
+        for j, code in enumerate(names):
+            out[:, j] = cols[code]
+        return out, names
+
+    @staticmethod
+    def _write(path: Path, values: np.ndarray) -> None:
+        # write-then-rename so a crashed or concurrent run never leaves a torn file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+        np.save(tmp, values)
+        os.replace(tmp, path)
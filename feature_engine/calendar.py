@@ -0,0 +1,223 @@
+"""
+Calendar segmentation and segmented reductions.
+
+Day, week and month boundaries are computed once from the index as offset
+arrays (`Segments`); reductions over those segments (first, last, max, min,
+sum and their expanding within-segment forms) run as compiled loops. This
+replaces per-feature `index.normalize()` + `groupby(date)` passes.
+
+Boundaries follow the index's wall-clock time (what `index.normalize()` uses),
+and the index is expected to be ascending, as every feature assumes.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+NS_PER_DAY = 86_400 * 1_000_000_000
+
+
+@dataclass(frozen=True)
+class Segments:
+    """
+    Contiguous runs of bars sharing one calendar key.
+
+    keys:   int64 key per segment (e.g. days since epoch)
+    starts: int64 offsets, len(keys) + 1; segment k is bars starts[k]:starts[k+1]
+    seg_id: int64 segment number of every bar
+    """
+    keys: np.ndarray
+    starts: np.ndarray
+    seg_id: np.ndarray
+
+    def __len__(self) -> int:
+        return self.keys.shape[0]
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return np.diff(self.starts)
+
+    def position(self) -> np.ndarray:
+        """0-based position of every bar within its segment."""
+        return np.arange(self.seg_id.shape[0]) - self.starts[self.seg_id]
+
+    def broadcast(self, per_segment: np.ndarray) -> np.ndarray:
+        """Per-segment values repeated onto every bar of the segment."""
+        return np.asarray(per_segment)[self.seg_id]
+
+    def shift(self, per_segment: np.ndarray, periods: int = 1) -> np.ndarray:
+        """Per-segment values shifted by whole segments (NaN fill), like Series.shift."""
+        values = np.asarray(per_segment, dtype=np.float64)
+        out = np.full_like(values, np.nan)
+        if periods >= 0:
+            out[periods:] = values[:values.shape[0] - periods]
+        else:
+            out[:periods] = values[-periods:]
+        return out
+
+
+def _wall_clock_ns(index: pd.DatetimeIndex) -> np.ndarray:
+    if not isinstance(index, pd.DatetimeIndex):
+        raise ValueError("Calendar segmentation requires a DatetimeIndex.")
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.as_unit("ns").asi8
+
+
+def segments_from_keys(keys: np.ndarray) -> Segments:
+    """Segments of consecutive equal values in an ascending key array."""
+    keys = np.asarray(keys, dtype=np.int64)
+    n = keys.shape[0]
+    if n and (np.diff(keys) < 0).any():
+        raise ValueError("Calendar segmentation requires an ascending DatetimeIndex.")
+    if n == 0:
+        return Segments(keys[:0], np.zeros(1, np.int64), keys[:0])
+    change = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+    starts = np.concatenate(([0], change, [n])).astype(np.int64)
+    seg_id = np.repeat(np.arange(starts.shape[0] - 1, dtype=np.int64), np.diff(starts))
+    return Segments(keys[starts[:-1]], starts, seg_id)
+
+
+def day_keys(index: pd.DatetimeIndex) -> np.ndarray:
+    """Local calendar day of every bar, as days since 1970-01-01."""
+    return _wall_clock_ns(index) // NS_PER_DAY
+
+
+def day_segments(index: pd.DatetimeIndex) -> Segments:
+    return segments_from_keys(day_keys(index))
+
+
+def week_segments(index: pd.DatetimeIndex) -> Segments:
+    """Monday-based calendar weeks (1970-01-01 was a Thursday)."""
+    return segments_from_keys((day_keys(index) + 3) // 7)
+
+
+def bucket_segments(index: pd.DatetimeIndex, minutes: int) -> Segments:
+    """Fixed intraday buckets of `minutes` (15, 60, 240, ...), aligned to midnight."""
+    return segments_from_keys(_wall_clock_ns(index) // (minutes * 60 * 1_000_000_000))
+
+
+def month_segments(index: pd.DatetimeIndex) -> Segments:
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return segments_from_keys(np.asarray(index.year, np.int64) * 12 + np.asarray(index.month, np.int64))
+
+
+# ---- segmented reductions (NaN-skipping, as in groupby) ----
+
+@njit(cache=True)
+def _seg_first(x, starts, out):
+    for k in range(starts.shape[0] - 1):
+        for i in range(starts[k], starts[k + 1]):
+            if not np.isnan(x[i]):
+                out[k] = x[i]
+                break
+
+
+@njit(cache=True)
+def _seg_last(x, starts, out):
+    for k in range(starts.shape[0] - 1):
+        for i in range(starts[k + 1] - 1, starts[k] - 1, -1):
+            if not np.isnan(x[i]):
+                out[k] = x[i]
+                break
+
+
+@njit(cache=True)
+def _seg_max(x, starts, sign, out):
+    for k in range(starts.shape[0] - 1):
+        best = np.nan
+        for i in range(starts[k], starts[k + 1]):
+            v = sign * x[i]
+            if not np.isnan(v) and (np.isnan(best) or v > best):
+                best = v
+        out[k] = sign * best
+
+
+@njit(cache=True)
+def _seg_sum(x, starts, out):
+    for k in range(starts.shape[0] - 1):
+        acc = 0.0
+        for i in range(starts[k], starts[k + 1]):
+            if not np.isnan(x[i]):
+                acc += x[i]
+        out[k] = acc
+
+
+@njit(cache=True)
+def _seg_cummax(x, starts, sign, out):
+    for k in range(starts.shape[0] - 1):
+        best = np.nan
+        for i in range(starts[k], starts[k + 1]):
+            v = sign * x[i]
+            if not np.isnan(v) and (np.isnan(best) or v > best):
+                best = v
+            out[i] = sign * best
+
+
+@njit(cache=True)
+def _seg_cumsum(x, starts, out):
+    for k in range(starts.shape[0] - 1):
+        acc = 0.0
+        for i in range(starts[k], starts[k + 1]):
+            if not np.isnan(x[i]):
+                acc += x[i]
+            out[i] = acc
+
+
+def _values(x) -> np.ndarray:
+    return np.ascontiguousarray(x, dtype=np.float64)
+
+
+def seg_first(x, seg: Segments) -> np.ndarray:
+    """First non-NaN value per segment (NaN if none)."""
+    out = np.full(len(seg), np.nan)
+    _seg_first(_values(x), seg.starts, out)
+    return out
+
+
+def seg_last(x, seg: Segments) -> np.ndarray:
+    """Last non-NaN value per segment (NaN if none)."""
+    out = np.full(len(seg), np.nan)
+    _seg_last(_values(x), seg.starts, out)
+    return out
+
+
+def seg_max(x, seg: Segments) -> np.ndarray:
+    out = np.empty(len(seg))
+    _seg_max(_values(x), seg.starts, 1.0, out)
+    return out
+
+
+def seg_min(x, seg: Segments) -> np.ndarray:
+    out = np.empty(len(seg))
+    _seg_max(_values(x), seg.starts, -1.0, out)
+    return out
+
+
+def seg_sum(x, seg: Segments) -> np.ndarray:
+    """Sum per segment, NaNs skipped (0.0 for an all-NaN segment)."""
+    out = np.empty(len(seg))
+    _seg_sum(_values(x), seg.starts, out)
+    return out
+
+
+def seg_cummax(x, seg: Segments) -> np.ndarray:
+    """Running max within each segment, per bar (NaN until the first value)."""
+    out = np.empty(seg.seg_id.shape[0])
+    _seg_cummax(_values(x), seg.starts, 1.0, out)
+    return out
+
+
+def seg_cummin(x, seg: Segments) -> np.ndarray:
+    out = np.empty(seg.seg_id.shape[0])
+    _seg_cummax(_values(x), seg.starts, -1.0, out)
+    return out
+
+
+def seg_cumsum(x, seg: Segments) -> np.ndarray:
+    """Running sum within each segment, per bar, NaNs skipped."""
+    out = np.empty(seg.seg_id.shape[0])
+    _seg_cumsum(_values(x), seg.starts, out)
+    return out
@@ -0,0 +1,194 @@
+"""
+Fused scan of the bar-local candle features.
+
+The candle family (engulf, displacement, wick rejection, liquidity grab and
+sweep, void depth, previous-bar break / distance flags, FVG creation) are
+elementwise or short-lookback expressions over O/H/L/C. Written as pandas,
+each allocates a dozen temporary Series. `scan_candles` computes them in one
+compiled pass instead: every bar is read once, its body, wicks and ranges
+are formed in registers, and each column writes straight into its row of
+one preallocated (len(CANDLE_COLUMNS), n) array.
+
+The 10/20/50-bar extremes of high and low come from the RangeExtrema
+tables the rest of the library already shares (primitives.range_extrema);
+the 50-bar deepest void is a monotonic deque in a ring buffer, and the
+10-bar mean true range of displacement comes from RollingMoments
+(feature_engine.moments). Results equal the pandas formulations they
+replace, bit for bit except displacement, whose rolling mean agrees with
+pandas' to within rounding.
+
+wick_rejection_intensity_10 takes only its per-bar wick / range
+("wick_intensity") from the scan; its 10-bar z-score is computed from that
+column separately (feature_engine.moments). Variants of the two
+parameter families (liquidity_sweep_wick_ratio_*,
+smc_liquidity_void_depth_*) with other windows stay on the shared extrema
+tables; the scan covers their default windows.
+"""
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from numba import njit
+
+from .extrema import RangeExtrema
+from .moments import RollingMoments
+
+CANDLE_COLUMNS: Tuple[str, ...] = (
+    "candle_engulf_strength_5",
+    "displacement_strength_10",
+    "wick_intensity",
+    "liquidity_grab_efficiency_10",
+    "liquidity_sweep_wick_ratio_20",
+    "smc_liquidity_void_depth_50",
+    "break_prev_high_flag_1",
+    "break_prev_low_flag_1",
+    "price_prev_high_dist_1",
+    "price_prev_low_dist_1",
+    "fvg_creation_flag_1",
+)
+ROW: Dict[str, int] = {name: k for k, name in enumerate(CANDLE_COLUMNS)}
+
+# OHLC columns each scan column actually reads
+INPUTS: Dict[str, Tuple[str, ...]] = {
+    "candle_engulf_strength_5": ("open", "high", "low", "close"),
+    "displacement_strength_10": ("high", "low", "close"),
+    "wick_intensity": ("open", "high", "low", "close"),
+    "liquidity_grab_efficiency_10": ("open", "high", "low", "close"),
+    "liquidity_sweep_wick_ratio_20": ("open", "high", "low", "close"),
+    "smc_liquidity_void_depth_50": ("high", "low"),
+    "break_prev_high_flag_1": ("high", "close"),
+    "break_prev_low_flag_1": ("low", "close"),
+    "price_prev_high_dist_1": ("high", "close"),
+    "price_prev_low_dist_1": ("low", "close"),
+    "fvg_creation_flag_1": ("open", "close"),
+}
+
+(ENGULF, DISPLACEMENT, WICK_INTENSITY, GRAB, SWEEP, VOID_DEPTH,
+ BREAK_HIGH, BREAK_LOW, PREV_HIGH_DIST, PREV_LOW_DIST, FVG) = range(len(CANDLE_COLUMNS))
+
+EPS = 1e-9
+DBL_MAX = np.finfo(np.float64).max
+
+
+@njit(cache=True)
+def _finite_or_zero(x):
+    return x if np.isfinite(x) else 0.0
+
+
+# ---- the scan ----
+
+@njit(cache=True, error_model="numpy")
+def _scan_kernel(o, h, l, c, high10, low10, high20, low20, high50, low50, atr10, out):
+    # highN / lowN: rolling(N).max() / min() of high / low (min_periods=N);
+    # atr10: rolling(10, min_periods=1).mean() of the true range
+    n = o.shape[0]
+    # 50-bar max of the void depth: monotonic deque in a ring buffer of 64
+    void_idx = np.empty(64, np.int64)
+    void_val = np.empty(64)
+    head = size = 0
+    for i in range(n):
+        oi, hi, li, ci = o[i], h[i], l[i], c[i]
+        if i > 0:
+            op, hp, lp, cp = o[i - 1], h[i - 1], l[i - 1], c[i - 1]
+            prior_high10, prior_low10 = high10[i - 1], low10[i - 1]
+            prior_high20, prior_low20 = high20[i - 1], low20[i - 1]
+        else:
+            op = hp = lp = cp = np.nan
+            prior_high10 = prior_low10 = prior_high20 = prior_low20 = np.nan
+
+        # candle parts (NaN-propagating max/min, wicks clipped at 0)
+        body_top = np.nan if (oi != oi or ci != ci) else max(oi, ci)
+        body_bot = np.nan if (oi != oi or ci != ci) else min(oi, ci)
+        body = abs(ci - oi)
+        upper_wick = hi - body_top
+        upper_wick = 0.0 if upper_wick < 0.0 else upper_wick
+        lower_wick = body_bot - li
+        lower_wick = 0.0 if lower_wick < 0.0 else lower_wick
+        bar_range = abs(hi - li)
+
+        # engulf: direction flip, outside range, bigger body; / max body of the last 5
+        prev_body = abs(cp - op)
+        engulf = (hi >= hp and li <= lp and np.sign(ci - oi) * np.sign(cp - op) < 0
+                  and body > prev_body)
+        if engulf:
+            max_body5 = body
+            for j in range(max(i - 4, 0), i):
+                b = abs(c[j] - o[j])
+                if b > max_body5:
+                    max_body5 = b
+            out[ENGULF, i] = body / max_body5
+        else:
+            out[ENGULF, i] = 0.0
+
+        # displacement: |close - prev close| / mean true range of the last 10 bars
+        atr = atr10[i]
+        out[DISPLACEMENT, i] = abs(ci - cp) / (atr if atr != 0.0 else np.nan)
+
+        # wick rejection input: wick / range (its 10-bar z-score is taken outside)
+        wick = np.nan if (upper_wick != upper_wick or lower_wick != lower_wick) else max(upper_wick, lower_wick)
+        out[WICK_INTENSITY, i] = _finite_or_zero(wick / (bar_range + EPS))
+
+        # liquidity grab: sweep of the prior 10-bar extreme that closes back inside
+        grab_range = hi - li if hi - li != 0.0 else np.nan
+        eff_up = upper_wick / grab_range if (hi > prior_high10 and ci < prior_high10) else 0.0
+        eff_down = lower_wick / grab_range if (li < prior_low10 and ci > prior_low10) else 0.0
+        eff = eff_up + eff_down
+        if eff != eff:
+            eff = 0.0
+        elif eff == np.inf:
+            eff = DBL_MAX
+        elif eff == -np.inf:
+            eff = -DBL_MAX
+        out[GRAB, i] = eff
+
+        # liquidity sweep: share of the sweeping wick outside the prior 20-bar extreme
+        outside_up = hi - prior_high20 if hi > prior_high20 else 0.0
+        outside_down = prior_low20 - li if li < prior_low20 else 0.0
+        ratio_up = outside_up / upper_wick if upper_wick > 0 else 0.0
+        ratio_down = outside_down / lower_wick if lower_wick > 0 else 0.0
+        out[SWEEP, i] = min(max(ratio_up + ratio_down, 0.0), 1.0)
+
+        # void depth: deepest gap of the last 50 bars / their high-low range
+        gap_up = li - hp if li > hp else 0.0
+        gap_down = lp - hi if hi < lp else 0.0
+        void = max(gap_up, gap_down)
+        while size > 0 and void_idx[head & 63] <= i - 50:
+            head += 1
+            size -= 1
+        while size > 0 and void_val[(head + size - 1) & 63] <= void:
+            size -= 1
+        void_idx[(head + size) & 63] = i
+        void_val[(head + size) & 63] = void
+        size += 1
+        max_void = void_val[head & 63]
+        range50 = high50[i] - low50[i]
+        if i < 49:
+            max_void = np.nan
+        out[VOID_DEPTH, i] = _finite_or_zero(max_void / ((range50 if range50 != 0.0 else np.nan) + EPS))
+
+        # previous-bar flags
+        out[BREAK_HIGH, i] = 1.0 if ci > hp else 0.0
+        out[BREAK_LOW, i] = 1.0 if ci < lp else 0.0
+        out[PREV_HIGH_DIST, i] = 1.0 if abs(ci - hp) / ci <= 0.01 else 0.0
+        out[PREV_LOW_DIST, i] = 1.0 if abs(ci - lp) / ci <= 0.01 else 0.0
+        out[FVG, i] = 1.0 if abs(oi - cp) > 0.01 else 0.0
+
+
+def scan_candles(open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                 high_extrema: Optional[RangeExtrema] = None,
+                 low_extrema: Optional[RangeExtrema] = None) -> np.ndarray:
+    """
+    All CANDLE_COLUMNS in one pass: float64 array (len(CANDLE_COLUMNS), n),
+    row ROW[name]. The 10/20/50-bar extremes of high and low are read from
+    `high_extrema` / `low_extrema` (built here when not given).
+    """
+    o, h, l, c = (np.ascontiguousarray(x, dtype=np.float64) for x in (open_, high, low, close))
+    high_extrema = RangeExtrema(h) if high_extrema is None else high_extrema
+    low_extrema = RangeExtrema(l) if low_extrema is None else low_extrema
+    windows = [(high_extrema.max(w), low_extrema.min(w)) for w in (10, 20, 50)]
+    # true range, NaN wherever a leg is (e.g. the first bar, which has no previous close)
+    prev_close = np.r_[np.nan, c[:-1]]
+    tr = np.maximum(np.maximum(h - l, np.abs(h - prev_close)), np.abs(l - prev_close))
+    atr10 = RollingMoments(tr).mean(10, min_periods=1)
+    out = np.empty((len(CANDLE_COLUMNS), o.shape[0]))
+    _scan_kernel(o, h, l, c, *(x for pair in windows for x in pair), atr10, out)
+    return out
@@ -0,0 +1,133 @@
+"""
+Out-of-core, chunked feature build with warm-up halos.
+
+Every feature module declares how much history a bar's value depends on:
+
+    LOOKBACK = 49       # the previous 49 bars
+    LOOKBACK = "1D"     # back to the start of the previous calendar day
+    LOOKBACK = "0D"     # the whole current day (e.g. bars-to-close)
+    LOOKBACK = "1W"     # back to the start of the previous calendar week
+    LOOKBACK = None     # unbounded state: carried across chunks by FeatureStream
+
+Recursive (EWM) features declare a warm-up long enough that the dropped
+history no longer moves the result.
+
+The series is cut into blocks of about `chunk_rows` bars. With a DatetimeIndex
+the cuts are snapped to day starts, so a day is never split. Each block is
+computed once on a FeatureContext that starts at the earliest bar any
+requested feature needs (the halo), and only the block's own rows are kept.
+Stateful features instead continue their stream over the block. Results go
+straight into a float32 .npy memory map, so peak memory follows the block
+size and not the history length.
+
+The results equal a full in-memory run. The exceptions are pandas' running
+window sums and the regression's anchored sums, which restart inside the
+halo and can differ in the last bits.
+"""
+import re
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from . import calendar
+from .context import FeatureContext
+from .registry import FeatureRegistry, default_registry
+
+_CALENDAR_LOOKBACK = re.compile(r"^(\d+)([DW])$")
+
+Lookback = Union[int, str, None]
+
+
+def lookback(module: ModuleType) -> Lookback:
+    """The module's LOOKBACK declaration (validated)."""
+    if not hasattr(module, "LOOKBACK"):
+        raise ValueError(f"Feature {module.FEATURE_CODE!r} does not declare LOOKBACK.")
+    value = module.LOOKBACK
+    if value is None:
+        if not hasattr(module, "FeatureStream"):
+            raise ValueError(f"Feature {module.FEATURE_CODE!r} has unbounded LOOKBACK but no FeatureStream.")
+        return None
+    if isinstance(value, str):
+        if not _CALENDAR_LOOKBACK.match(value):
+            raise ValueError(f"Feature {module.FEATURE_CODE!r}: bad LOOKBACK {value!r}.")
+        return value
+    if int(value) < 0:
+        raise ValueError(f"Feature {module.FEATURE_CODE!r}: LOOKBACK must be >= 0.")
+    return int(value)
+
+
+def chunk_bounds(index: pd.Index, chunk_rows: int) -> List[Tuple[int, int]]:
+    """[start, stop) row ranges of about `chunk_rows`, cut at day starts for a DatetimeIndex."""
+    n = len(index)
+    if n == 0:
+        return []
+    if not isinstance(index, pd.DatetimeIndex):
+        cuts = list(range(chunk_rows, n, chunk_rows))
+    else:
+        day_starts = calendar.day_segments(index).starts[1:-1]
+        cuts = []
+        for target in range(chunk_rows, n, chunk_rows):
+            k = np.searchsorted(day_starts, target)  # first day start at or after target
+            if k < day_starts.shape[0] and (not cuts or day_starts[k] > cuts[-1]):
+                cuts.append(int(day_starts[k]))
+    edges = [0] + cuts + [n]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def _halo_start(start: int, lookbacks: Iterable[Lookback],
+                calendars: Optional[Dict[str, calendar.Segments]]) -> int:
+    first = start
+    for lb in lookbacks:
+        if lb is None:
+            continue
+        if isinstance(lb, str):
+            if calendars is None:
+                raise ValueError(f"Calendar LOOKBACK {lb!r} requires a DatetimeIndex.")
+            count, unit = _CALENDAR_LOOKBACK.match(lb).groups()
+            periods = calendars[unit]
+            seg = max(int(periods.seg_id[start]) - int(count), 0) if start < periods.seg_id.shape[0] else 0
+            first = min(first, int(periods.starts[seg]))
+        else:
+            first = min(first, max(start - lb, 0))
+    return first
+
+
+def compute_features_chunked(df: pd.DataFrame, out_path: Union[str, Path],
+                             codes: Optional[Iterable[str]] = None, chunk_rows: int = 1_000_000,
+                             registry: Optional[FeatureRegistry] = None) -> Tuple[np.memmap, List[str]]:
+    """
+    Compute `codes` (default: all) on `df` block by block into `out_path`.
+
+    Returns (matrix, names): matrix is the float32 (len(df), len(names)) .npy
+    memory map at `out_path` (reopen with np.load(out_path, mmap_mode="r")).
+    """
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be positive.")
+    registry = default_registry if registry is None else registry
+    names = registry.codes if codes is None else list(codes)
+    modules = [registry.get(code) for code in names]
+    lookbacks = [lookback(module) for module in modules]
+
+    index = df.index
+    calendars = None
+    if isinstance(index, pd.DatetimeIndex):
+        calendars = {"D": calendar.day_segments(index), "W": calendar.week_segments(index)}
+    streams: Dict[int, object] = {j: registry.stream(names[j]) for j, lb in enumerate(lookbacks) if lb is None}
+    windowed = [j for j, lb in enumerate(lookbacks) if lb is not None]
+
+    out = np.lib.format.open_memmap(out_path, mode="w+", dtype=np.float32, shape=(len(df), len(names)))
+    for start, stop in chunk_bounds(index, chunk_rows):
+        first = _halo_start(start, (lookbacks[j] for j in windowed), calendars)
+        context = FeatureContext(df.iloc[first:stop])
+        for j in windowed:
+            values = np.asarray(modules[j].compute_feature(context), dtype=np.float64)
+            out[start:stop, j] = values[start - first:]
+        if streams:
+            block = df.iloc[start:stop]
+            for j, stream in streams.items():
+                out[start:stop, j] = stream.extend(block)
+    out.flush()
+    return out, names
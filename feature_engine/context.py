@@ -0,0 +1,111 @@
+"""
+Read-only, zero-copy input shared by every feature of one build.
+
+A `FeatureContext` is built once from the OHLCV frame: column names are
+lower-cased once, each column is exposed as a contiguous float64 array (a
+view of the frame's own data whenever it already is one) and calendar
+fields of the index are derived on first use. Feature modules take it in
+place of the per-feature `df.copy()` + lower-casing; a plain DataFrame goes
+through `as_context`, so `compute_feature(df)` keeps working on its own.
+
+`g[name]` returns a pandas Series over the shared array; the arrays are
+marked read-only, so features must build new objects (pandas arithmetic
+always does) rather than write into them.
+"""
+from typing import Dict, List, Union
+
+import numpy as np
+import pandas as pd
+
+from .memo import IntermediateCache, active_cache
+
+
+class FeatureContext:
+    """Lower-cased float64 columns, index and calendar fields of one frame."""
+
+    def __init__(self, df: pd.DataFrame, memo: IntermediateCache = None):
+        if isinstance(df, FeatureContext):
+            raise TypeError("FeatureContext expects a DataFrame; use as_context() to pass either.")
+        self.frame = df
+        self.index = df.index
+        # later duplicates win, as with the old per-feature lower-casing + g[name]
+        self._names: Dict[str, object] = {str(c).lower(): c for c in df.columns}
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._series: Dict[str, pd.Series] = {}
+        self._calendar: Dict[str, np.ndarray] = {}
+        self.memo = IntermediateCache(df) if memo is None else memo
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._names)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def array(self, name: str) -> np.ndarray:
+        """Column `name` as a read-only, C-contiguous float64 array."""
+        arr = self._arrays.get(name)
+        if arr is None:
+            try:
+                column = self._names[name]
+            except KeyError:
+                raise KeyError(name) from None
+            arr = np.ascontiguousarray(self.frame[column].to_numpy(dtype=np.float64))
+            arr.flags.writeable = False
+            self._arrays[name] = arr
+        return arr
+
+    def __getitem__(self, name: str) -> pd.Series:
+        s = self._series.get(name)
+        if s is None:
+            s = pd.Series(self.array(name), index=self.index, name=name, copy=False)
+            self._series[name] = s
+        return s
+
+    # ---- calendar fields of the index (wall-clock, like index.hour) ----
+
+    def _field(self, name: str, factory) -> np.ndarray:
+        values = self._calendar.get(name)
+        if values is None:
+            if not isinstance(self.index, pd.DatetimeIndex):
+                raise ValueError(f"Calendar field {name!r} requires a DatetimeIndex.")
+            values = np.asarray(factory(self.index))
+            values.flags.writeable = False
+            self._calendar[name] = values
+        return values
+
+    @property
+    def wall_clock_ns(self) -> np.ndarray:
+        """Index as int64 ns of local wall-clock time (timezone dropped)."""
+        return self._field("wall_clock_ns", lambda ix: (ix.tz_localize(None) if ix.tz is not None else ix)
+                           .as_unit("ns").asi8)
+
+    @property
+    def hour(self) -> np.ndarray:
+        return self._field("hour", lambda ix: ix.hour.to_numpy(np.int64))
+
+    @property
+    def dayofweek(self) -> np.ndarray:
+        """Monday=0 .. Sunday=6."""
+        return self._field("dayofweek", lambda ix: ix.dayofweek.to_numpy(np.int64))
+
+
+FrameLike = Union[pd.DataFrame, FeatureContext]
+
+
+def as_context(df: FrameLike) -> FeatureContext:
+    """
+    `df` itself if it already is a FeatureContext, else a context over it.
+
+    Inside a `compute_scope(df)` the context is created once per frame and
+    shares the scope's memo, so repeated legacy calls stay cheap.
+    """
+    if isinstance(df, FeatureContext):
+        return df
+    cache = active_cache(df)
+    if cache is None:
+        return FeatureContext(df)
+    return cache.get_or_compute(("context", id(df)), lambda: FeatureContext(df, memo=cache))
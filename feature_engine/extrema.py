@@ -0,0 +1,89 @@
+"""
+Rolling max/min over windows of any length from one shared structure.
+
+`RangeExtrema` is a sparse table: level k holds, for every bar, the max
+(min) of the 2**k bars ending there. The extreme of any window is then the
+max of two overlapping power-of-two blocks, so once the levels up to
+log2(window) are built (each one O(n) vectorized pass, built on demand and
+kept), every further window length costs a single O(n) pass. Built once per
+column and shared through the memo, one table serves all the rolling
+max/min windows of a build, every variant of a feature family included.
+
+NaNs are skipped as in pandas' rolling (fmax/fmin) and a prefix count of
+valid values implements min_periods, so results equal
+`rolling(window, min_periods).max()` / `.min()` exactly. Arrays may be 1-D
+or 2-D (time along axis 0, e.g. a (T x S) panel frame).
+"""
+from typing import Dict, List, Optional
+
+import numpy as np
+
+_UFUNCS = {"max": np.fmax, "min": np.fmin}
+
+
+class RangeExtrema:
+    """Sparse tables of rolling max and min over `values` (time along axis 0)."""
+
+    def __init__(self, values):
+        self.values = np.asarray(values, dtype=np.float64)
+        self._levels: Dict[str, List[np.ndarray]] = {"max": [self.values], "min": [self.values]}
+        self._valid: Optional[np.ndarray] = None
+        self._has_nan = bool(np.isnan(self.values).any())
+
+    def __len__(self) -> int:
+        return self.values.shape[0]
+
+    def _level(self, op: str, k: int) -> np.ndarray:
+        levels = self._levels[op]
+        ufunc = _UFUNCS[op]
+        while len(levels) <= k:
+            prev = levels[-1]
+            half = 1 << (len(levels) - 1)
+            nxt = prev.copy()
+            ufunc(prev[half:], prev[:-half], out=nxt[half:])
+            levels.append(nxt)
+        return levels[k]
+
+    def _counts(self, window: int) -> np.ndarray:
+        # valid (non-NaN) values per window, from one shared prefix count
+        if self._valid is None:
+            valid = np.zeros((len(self) + 1,) + self.values.shape[1:], dtype=np.int64)
+            np.cumsum(~np.isnan(self.values), axis=0, out=valid[1:])
+            self._valid = valid
+        n, p = len(self), self._valid
+        counts = np.empty_like(p[1:])
+        m = min(window - 1, n)
+        counts[:m] = p[1:m + 1]
+        if n > m:
+            counts[m:] = p[window:] - p[:n - window + 1]
+        return counts
+
+    def query(self, op: str, window: int, min_periods: Optional[int] = None) -> np.ndarray:
+        """Rolling `op` ("max" or "min") of every bar over `window` bars."""
+        if window < 1:
+            raise ValueError("window must be >= 1.")
+        min_periods = window if min_periods is None else min_periods
+        ufunc = _UFUNCS[op]
+        n = len(self)
+        k = window.bit_length() - 1
+        p = 1 << k
+        table = self._level(op, k)
+
+        out = np.empty_like(self.values)
+        m = min(window - 1, n)  # leading bars whose window is cut off at bar 0
+        if m:
+            ufunc(table[:m], table[np.minimum(np.arange(m), p - 1)], out=out[:m])
+        if n > m:
+            ufunc(table[m:], table[p - 1:n - window + p], out=out[m:])
+
+        if self._has_nan:
+            out[self._counts(window) < min_periods] = np.nan
+        elif min_periods > 1:
+            out[:min(min_periods - 1, n)] = np.nan
+        return out
+
+    def max(self, window: int, min_periods: Optional[int] = None) -> np.ndarray:
+        return self.query("max", window, min_periods)
+
+    def min(self, window: int, min_periods: Optional[int] = None) -> np.ndarray:
+        return self.query("min", window, min_periods)
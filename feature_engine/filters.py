@@ -0,0 +1,146 @@
+"""
+Causal FIR filter bank.
+
+Fixed linear filters (Gaussian-weighted averages, causal Savitzky-Golay
+endpoint fits) are reduced to coefficient vectors once, then applied to a
+price array in a single vectorized pass: every full window is one row of a
+sliding-window view, and all filters of the bank are one matrix product.
+Warm-up bars (fewer than `window` observations) use per-length coefficients,
+which reproduces rolling(window, min_periods).apply(fn) with a growing window.
+
+Recursive smoothers (EMA, DEMA, TEMA) are not FIR; they are provided here in
+their recursive form for the same use (compiled kernels of
+feature_engine.indicators).
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from . import indicators
+
+
+@dataclass(frozen=True)
+class FirFilter:
+    """
+    Causal filter: y_t = sum(weights * x[t-window+1 .. t]) (oldest -> newest).
+
+    warmup[L - min_periods] holds the weights applied to the first L bars
+    for min_periods <= L < window; earlier bars are NaN.
+    """
+    name: str
+    weights: np.ndarray
+    min_periods: int
+    warmup: Tuple[np.ndarray, ...]
+
+    @property
+    def window(self) -> int:
+        return self.weights.shape[0]
+
+
+@lru_cache(maxsize=None)
+def gaussian(window: int, sigma: Optional[float] = None, min_periods: int = 3) -> FirFilter:
+    """
+    Backward-looking Gaussian kernel centered on the current bar.
+
+    sigma defaults to window / 4. Weights are normalized over the full window;
+    warm-up bars use the most recent len(x) weights as-is (not renormalized).
+    """
+    sigma = window / 4.0 if sigma is None else sigma
+    idx = np.arange(window)
+    weights = np.exp(-0.5 * (idx / sigma) ** 2)[::-1]
+    weights = weights / weights.sum()
+    warmup = tuple(weights[-n:].copy() for n in range(min_periods, window))
+    return FirFilter(f"gauss_{window}", weights, min_periods, warmup)
+
+
+def _endpoint_fit_weights(n: int, order: int) -> np.ndarray:
+    # Row of the least-squares hat matrix for the last point: the fitted value
+    # at x = n-1 of a degree-`order` polynomial is this vector dotted with y.
+    deg = min(order, n - 1)
+    xs = np.linspace(-1.0, 1.0, n) if n > 1 else np.zeros(1)
+    vander = np.vander(xs, deg + 1)
+    return vander[-1] @ np.linalg.pinv(vander)
+
+
+@lru_cache(maxsize=None)
+def savgol(window: int, order: int, min_periods: Optional[int] = None) -> FirFilter:
+    """
+    Causal Savitzky-Golay: value at the newest bar of a degree-`order` least
+    squares fit over the last `window` bars (growing window during warm-up).
+    min_periods defaults to order + 2.
+    """
+    if order >= window:
+        raise ValueError("savgol order must be smaller than window.")
+    min_periods = order + 2 if min_periods is None else min_periods
+    weights = _endpoint_fit_weights(window, order)
+    warmup = tuple(_endpoint_fit_weights(n, order) for n in range(min_periods, window))
+    return FirFilter(f"savgol_{window}_{order}", weights, min_periods, warmup)
+
+
+def apply_filters(x: Union[np.ndarray, pd.Series], filters: Sequence[FirFilter]) -> np.ndarray:
+    """
+    Apply every filter in `filters` to `x` in one pass.
+
+    Returns a float64 array of shape (len(x), len(filters)). As with
+    rolling().apply(), any NaN inside a filter's window yields NaN.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    n = x.shape[0]
+    k = len(filters)
+    out = np.full((n, k), np.nan)
+    if n == 0 or k == 0:
+        return out
+
+    width = max(f.window for f in filters)
+    # weights left-padded with zeros to the widest window -> one (width, k) matrix
+    bank = np.zeros((width, k))
+    for j, f in enumerate(filters):
+        bank[width - f.window:, j] = f.weights
+
+    nan_mask = np.isnan(x)
+    has_nan = nan_mask.any()
+    clean = np.where(nan_mask, 0.0, x) if has_nan else x
+    if n >= width:
+        out[width - 1:] = sliding_window_view(clean, width) @ bank
+
+    nan_cum = np.concatenate(([0], np.cumsum(nan_mask)))
+    for j, f in enumerate(filters):
+        w = f.window
+        # full windows narrower than the bank width
+        for t in range(w - 1, min(width - 1, n)):
+            out[t, j] = f.weights @ clean[t - w + 1:t + 1]
+        # growing windows during warm-up
+        for t in range(f.min_periods - 1, min(w - 1, n)):
+            out[t, j] = f.warmup[t + 1 - f.min_periods] @ clean[:t + 1]
+        if has_nan:
+            lo = np.maximum(np.arange(n) - w + 1, 0)
+            window_nans = nan_cum[1:] - nan_cum[lo]
+            out[window_nans > 0, j] = np.nan
+    return out
+
+
+def apply_filter(x: Union[np.ndarray, pd.Series], filt: FirFilter) -> np.ndarray:
+    """Single-filter convenience wrapper around apply_filters."""
+    return apply_filters(x, [filt])[:, 0]
+
+
+def ema(x: Union[np.ndarray, pd.Series], span: int) -> np.ndarray:
+    """ewm(span, adjust=False).mean() of x."""
+    return indicators.ema(x, (span,))[:, 0]
+
+
+def dema(x: Union[np.ndarray, pd.Series], span: int) -> np.ndarray:
+    """Double EMA: 2*EMA - EMA(EMA), both EMAs in one compiled pass."""
+    return indicators.dema(x, (span,))[:, 0]
+
+
+def tema(x: Union[np.ndarray, pd.Series], span: int) -> np.ndarray:
+    """Triple EMA: 3*EMA - 3*EMA(EMA) + EMA(EMA(EMA))."""
+    e1 = ema(x, span)
+    e2 = ema(e1, span)
+    e3 = ema(e2, span)
+    return 3.0 * e1 - 3.0 * e2 + e3
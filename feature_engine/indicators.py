@@ -0,0 +1,316 @@
+"""
+Compiled technical indicators: EMA/DEMA, Wilder RSI, ATR, +DI/-DI/ADX and
+Bollinger bands, several periods per pass.
+
+One compiled call computes every requested period, so RSI(7), RSI(14) and
+RSI(21) are a single call over close instead of three chains of pandas
+calls. Each period is one tight loop with its recursion state in local
+variables, and the inputs the recursion reads (deltas, gains and losses,
+directional movement) are derived inside that loop rather than
+materialized as temporary series. Results come back as (n, len(periods))
+float64 arrays, column k for periods[k].
+
+The recursive smoothers reproduce pandas' ewm(adjust=False, ...).mean()
+bit for bit: alpha is rederived from the center of mass as pandas does,
+each update is normalized by (old_wt + new_wt), and a NaN input decays the
+old weight without moving the average. Wilder smoothing is that ewm with
+alpha = 1/period and min_periods = period, so the indicators equal the
+pandas formulations the feature modules used to spell out. Bollinger bands
+are read off the shared rolling moments (feature_engine.moments).
+"""
+from typing import NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+from .moments import RollingMoments
+
+ArrayLike = Union[np.ndarray, pd.Series]
+
+
+class Dmi(NamedTuple):
+    """Wilder directional movement, each (n, len(periods))."""
+    plus_di: np.ndarray
+    minus_di: np.ndarray
+    adx: np.ndarray
+
+
+class BollingerBands(NamedTuple):
+    """Rolling mean and mean +/- num_std * std, each (n, len(periods))."""
+    middle: np.ndarray
+    upper: np.ndarray
+    lower: np.ndarray
+
+
+# ---- kernels ----
+
+@njit(cache=True)
+def _ewm_step(cur, alpha, weighted, old_wt, nobs):
+    # one step of pandas' ewm(adjust=False); returns the new (weighted, old_wt, nobs)
+    if weighted == weighted:
+        old_wt *= 1.0 - alpha
+        if cur == cur:
+            nobs += 1
+            if weighted != cur:
+                weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+            old_wt = 1.0
+    elif cur == cur:
+        nobs += 1
+        weighted = cur
+    return weighted, old_wt, nobs
+
+
+@njit(cache=True)
+def _fmax(a, b):
+    # np.fmax: a NaN operand yields the other one
+    if a != a:
+        return b
+    if b != b:
+        return a
+    return a if a >= b else b
+
+
+@njit(cache=True)
+def _ewm_kernel(x, alphas, min_periods, out):
+    for k in range(alphas.shape[0]):
+        alpha, minp = alphas[k], min_periods[k]
+        w, ow, nobs = np.nan, 1.0, 0
+        for i in range(x.shape[0]):
+            w, ow, nobs = _ewm_step(x[i], alpha, w, ow, nobs)
+            out[i, k] = w if nobs >= minp else np.nan
+
+
+@njit(cache=True)
+def _dema_kernel(x, alphas, out):
+    for k in range(alphas.shape[0]):
+        alpha = alphas[k]
+        w1, ow1, n1 = np.nan, 1.0, 0
+        w2, ow2, n2 = np.nan, 1.0, 0
+        for i in range(x.shape[0]):
+            w1, ow1, n1 = _ewm_step(x[i], alpha, w1, ow1, n1)
+            w2, ow2, n2 = _ewm_step(w1, alpha, w2, ow2, n2)
+            out[i, k] = 2.0 * w1 - w2
+
+
+@njit(cache=True)
+def _rsi_kernel(close, alphas, periods, out):
+    for k in range(alphas.shape[0]):
+        alpha, minp = alphas[k], periods[k]
+        wg, owg, ng = np.nan, 1.0, 0
+        wl, owl, nl = np.nan, 1.0, 0
+        for i in range(close.shape[0]):
+            delta = close[i] - close[i - 1] if i > 0 else np.nan
+            gain = delta if delta > 0.0 else (np.nan if delta != delta else 0.0)
+            loss = -delta if delta < 0.0 else (np.nan if delta != delta else 0.0)
+            wg, owg, ng = _ewm_step(gain, alpha, wg, owg, ng)
+            wl, owl, nl = _ewm_step(loss, alpha, wl, owl, nl)
+            avg_gain = wg if ng >= minp else np.nan
+            avg_loss = wl if nl >= minp and wl != 0.0 else np.nan
+            rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+            out[i, k] = min(max(rsi, 0.0), 100.0) if rsi == rsi else np.nan
+
+
+@njit(cache=True)
+def _true_range_kernel(high, low, close, out):
+    prev_c = np.nan
+    for i in range(high.shape[0]):
+        h, l = high[i], low[i]
+        out[i] = _fmax(_fmax(h - l, abs(h - prev_c)), abs(l - prev_c))
+        prev_c = close[i]
+
+
+@njit(cache=True, error_model="numpy")
+def _dmi_kernel(high, low, atr, alphas, periods, plus_di, minus_di, adx):
+    for k in range(alphas.shape[0]):
+        alpha, minp = alphas[k], periods[k]
+        wp, owp, n_p = np.nan, 1.0, 0
+        wm, owm, n_m = np.nan, 1.0, 0
+        wa, owa, n_a = np.nan, 1.0, 0
+        for i in range(high.shape[0]):
+            up_move = high[i] - high[i - 1] if i > 0 else np.nan
+            down_move = -(low[i] - low[i - 1]) if i > 0 else np.nan
+            plus_dm = up_move if (up_move > down_move and up_move > 0) else 0.0
+            minus_dm = down_move if (down_move > up_move and down_move > 0) else 0.0
+            wp, owp, n_p = _ewm_step(plus_dm, alpha, wp, owp, n_p)
+            wm, owm, n_m = _ewm_step(minus_dm, alpha, wm, owm, n_m)
+            plus_sm = wp if n_p >= minp else np.nan
+            minus_sm = wm if n_m >= minp else np.nan
+            tr_sm = atr[i, k] if atr[i, k] != 0.0 else np.nan
+            pdi = 100.0 * (plus_sm / tr_sm)
+            mdi = 100.0 * (minus_sm / tr_sm)
+            total = pdi + mdi if pdi + mdi != 0.0 else np.nan
+            dx = 100.0 * abs(pdi - mdi) / total
+            wa, owa, n_a = _ewm_step(dx, alpha, wa, owa, n_a)
+            plus_di[i, k] = pdi
+            minus_di[i, k] = mdi
+            adx[i, k] = wa if n_a >= minp else np.nan
+
+
+@njit(cache=True)
+def _neumaier_add(s, c, x):
+    # s + x, with the rounding error accumulated into c
+    t = s + x
+    if abs(s) >= abs(x):
+        c += (s - t) + x
+    else:
+        c += (x - t) + s
+    return t, c
+
+
+@njit(cache=True, error_model="numpy")
+def _net_change_rsi_kernel(close, periods, out):
+    n = close.shape[0]
+    for k in range(periods.shape[0]):
+        w = periods[k]
+        run = 0  # consecutive non-NaN closes ending at i
+        # running sum of the window's positive diffs, with its Neumaier compensation
+        gain = 0.0
+        comp = 0.0
+        for i in range(n):
+            if close[i] != close[i]:
+                run = 0
+                gain = comp = 0.0
+                out[i, k] = np.nan
+                continue
+            run += 1
+            if run >= 2:
+                d = close[i] - close[i - 1]  # the diff entering the window
+                if d > 0.0:
+                    gain, comp = _neumaier_add(gain, comp, d)
+            if run > w:
+                d = close[i - w + 1] - close[i - w]  # the diff leaving it
+                if d > 0.0:
+                    gain, comp = _neumaier_add(gain, comp, -d)
+            if run < w:
+                out[i, k] = np.nan
+                continue
+            # the window's diffs telescope: their sum is the net change of its closes
+            change = close[i] - close[i - w + 1]
+            out[i, k] = 100.0 - (100.0 / (1.0 + ((gain + comp) / change)))
+
+
+# ---- public API ----
+
+def _as_array(x: ArrayLike) -> np.ndarray:
+    return np.ascontiguousarray(x, dtype=np.float64)
+
+
+def _periods(periods: Sequence[int]) -> np.ndarray:
+    periods = np.asarray(periods, dtype=np.int64).reshape(-1)
+    if periods.shape[0] == 0 or (periods < 1).any():
+        raise ValueError("periods must be a non-empty sequence of integers >= 1.")
+    return periods
+
+
+def _alpha(alpha: float) -> float:
+    # pandas turns alpha into a center of mass and back
+    com = (1.0 - alpha) / alpha
+    return 1.0 / (1.0 + com)
+
+
+def _wilder_alphas(periods: np.ndarray) -> np.ndarray:
+    return np.array([_alpha(1.0 / p) for p in periods])
+
+
+def _span_alphas(spans: np.ndarray) -> np.ndarray:
+    return np.array([1.0 / (1.0 + (s - 1) / 2.0) for s in spans])
+
+
+def ema(x: ArrayLike, spans: Sequence[int], min_periods: int = 0) -> np.ndarray:
+    """ewm(span, adjust=False, min_periods).mean() of x for every span; (n, len(spans))."""
+    x, spans = _as_array(x), _periods(spans)
+    out = np.empty((x.shape[0], spans.shape[0]))
+    _ewm_kernel(x, _span_alphas(spans), np.full(spans.shape[0], min_periods, np.int64), out)
+    return out
+
+
+def dema(x: ArrayLike, spans: Sequence[int]) -> np.ndarray:
+    """Double EMA, 2*EMA - EMA(EMA), for every span; (n, len(spans))."""
+    x, spans = _as_array(x), _periods(spans)
+    out = np.empty((x.shape[0], spans.shape[0]))
+    _dema_kernel(x, _span_alphas(spans), out)
+    return out
+
+
+def wilder(x: ArrayLike, periods: Sequence[int]) -> np.ndarray:
+    """Wilder smoothing, ewm(alpha=1/period, adjust=False, min_periods=period); (n, len(periods))."""
+    x, periods = _as_array(x), _periods(periods)
+    out = np.empty((x.shape[0], periods.shape[0]))
+    _ewm_kernel(x, _wilder_alphas(periods), periods, out)
+    return out
+
+
+def wilder_rsi(close: ArrayLike, periods: Sequence[int]) -> np.ndarray:
+    """
+    RSI with Wilder smoothing for every period; (n, len(periods)).
+    NaN where either average is undefined or the average loss is 0.
+    """
+    close, periods = _as_array(close), _periods(periods)
+    out = np.empty((close.shape[0], periods.shape[0]))
+    _rsi_kernel(close, _wilder_alphas(periods), periods, out)
+    return out
+
+
+def net_change_rsi(close: ArrayLike, periods: Sequence[int]) -> np.ndarray:
+    """
+    100 - 100 / (1 + mean gain / mean net change) over the `period` closes
+    ending at each bar: the windowed RSI of trendline_break_rsi_14, whose
+    denominator is the mean of all the window's diffs (not of its losses).
+    One pass per period: the gain sum is kept running (compensated) as diffs
+    enter and leave the window, and the diffs' sum is the window's net
+    change, so each bar costs O(1) whatever the period. Agrees with the
+    per-window rolling-apply to within rounding, not bit for bit. Windows
+    with a NaN close are NaN; (n, len(periods)).
+    """
+    close, periods = _as_array(close), _periods(periods)
+    if (periods < 2).any():
+        raise ValueError("net_change_rsi needs periods >= 2.")
+    out = np.empty((close.shape[0], periods.shape[0]))
+    _net_change_rsi_kernel(close, periods, out)
+    return out
+
+
+def true_range(high: ArrayLike, low: ArrayLike, close: ArrayLike) -> np.ndarray:
+    """max(high - low, |high - prev close|, |low - prev close|), NaN legs skipped."""
+    high = _as_array(high)
+    out = np.empty(high.shape[0])
+    _true_range_kernel(high, _as_array(low), _as_array(close), out)
+    return out
+
+
+def atr(high: ArrayLike, low: ArrayLike, close: ArrayLike, periods: Sequence[int]) -> np.ndarray:
+    """Wilder ATR for every period; (n, len(periods))."""
+    return wilder(true_range(high, low, close), periods)
+
+
+def dmi(high: ArrayLike, low: ArrayLike, close: ArrayLike, periods: Sequence[int],
+        atr_values: Optional[np.ndarray] = None) -> Dmi:
+    """
+    +DI, -DI and ADX with Wilder smoothing for every period. `atr_values`
+    ((n, len(periods)), e.g. from `atr`) is computed when not given.
+    """
+    high, low, periods = _as_array(high), _as_array(low), _periods(periods)
+    if atr_values is None:
+        atr_values = atr(high, low, close, periods)
+    atr_values = np.ascontiguousarray(atr_values, dtype=np.float64).reshape(high.shape[0], periods.shape[0])
+    plus_di, minus_di, adx = (np.empty((high.shape[0], periods.shape[0])) for _ in range(3))
+    _dmi_kernel(high, low, atr_values, _wilder_alphas(periods), periods, plus_di, minus_di, adx)
+    return Dmi(plus_di, minus_di, adx)
+
+
+def bollinger(close: Union[ArrayLike, RollingMoments], periods: Sequence[int], num_std: float = 2.0,
+              ddof: int = 0) -> BollingerBands:
+    """
+    Rolling mean and mean +/- num_std * std(ddof) over every period, full
+    windows only (min_periods = period; a window with a NaN is NaN).
+
+    The moments come from compensated prefix sums (feature_engine.moments);
+    pass the RollingMoments of the closes (primitives.rolling_moments) to
+    reuse one already built.
+    """
+    moments = close if isinstance(close, RollingMoments) else RollingMoments(_as_array(close))
+    periods = _periods(periods)
+    middle = np.column_stack([moments.mean(int(p)) for p in periods])
+    sd = np.column_stack([moments.std(int(p), ddof=ddof) for p in periods])
+    return BollingerBands(middle, middle + num_std * sd, middle - num_std * sd)
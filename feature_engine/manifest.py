@@ -0,0 +1,139 @@
+"""
+Manifest of the features/ library, so consumers need not import it.
+
+`features/manifest.json` holds one entry per feature module, in file order:
+
+    {"file": "range_high_dist_50.py", "source_hash": "...",
+     "columns": ["close", "high"], "lookback": 49, "output_kind": "continuous",
+     "stream": true, "panel": true, "depends": [],
+     "variants": {"range_high_dist_10": {"window": 10}, ...}}
+
+`columns` are the OHLCV columns the output actually depends on: the module
+is run on a small synthetic frame with each column dropped in turn, and a
+column counts when dropping it raises or changes the result.
+
+The manifest is written by sepratore.py after extraction (and by
+`write_manifest`). Entries whose source hash is unchanged are kept as they
+are, so re-extraction only re-describes modules that changed.
+`load_manifest` returns it only while it matches the directory (same
+files, same hashes); FeatureRegistry then imports a module only when its
+code is first requested.
+"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+PathLike = Union[str, Path]
+
+MANIFEST_NAME = "manifest.json"
+OHLCV = ("open", "high", "low", "close", "volume")
+
+Manifest = Dict[str, Dict[str, Any]]
+
+
+def source_hash(path: PathLike) -> str:
+    return hashlib.blake2b(Path(path).read_bytes(), digest_size=16).hexdigest()
+
+
+def _probe_frame():
+    from .synthetic import make_consecutive_ohlcv
+    # ten 5-minute days: enough for the previous-day / 3-day calendar features
+    return make_consecutive_ohlcv(2880, vol_per_bar=0.002, seed=7)
+
+
+def required_columns(module, frame=None) -> List[str]:
+    """OHLCV columns whose removal makes `module.compute_feature` fail or change."""
+    # plain frames: modules wrap them with as_context, cells written against a DataFrame still run
+    frame = _probe_frame() if frame is None else frame
+    base = np.asarray(module.compute_feature(frame.copy()), dtype=np.float64)
+    needed = []
+    for name in OHLCV:
+        try:
+            values = module.compute_feature(frame.drop(columns=name))
+            values = np.asarray(values, dtype=np.float64)
+        except Exception:
+            needed.append(name)
+            continue
+        if not np.array_equal(values, base, equal_nan=True):
+            needed.append(name)
+    return needed
+
+
+def describe(module, path: PathLike, frame=None) -> Dict[str, Any]:
+    """Manifest entry of one loaded feature module."""
+    from .chunked import lookback
+    from .registry import _grid_variants
+    from .store import output_kind
+    return {
+        "file": Path(path).name,
+        "source_hash": source_hash(path),
+        "columns": required_columns(module, frame),
+        "lookback": lookback(module),
+        "output_kind": output_kind(module),
+        "stream": hasattr(module, "FeatureStream"),
+        "panel": hasattr(module, "compute_panel"),
+        "depends": list(getattr(module, "DEPENDS", ())),
+        "variants": {v.FEATURE_CODE: v.params for v in _grid_variants(module)},
+    }
+
+
+def _read(features_dir: Path) -> Optional[Manifest]:
+    path = features_dir / MANIFEST_NAME
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def build_manifest(features_dir: PathLike, previous: Optional[Manifest] = None) -> Manifest:
+    """Describe every feature module of `features_dir`, reusing unchanged entries of `previous`."""
+    from .registry import _load_module
+    features_dir = Path(features_dir)
+    reuse = {entry["file"]: (code, entry) for code, entry in (previous or {}).items()}
+    frame = None
+    manifest: Manifest = {}
+    for path in sorted(features_dir.glob("*.py")):
+        old = reuse.get(path.name)
+        if old is not None and old[1]["source_hash"] == source_hash(path):
+            manifest[old[0]] = old[1]
+            continue
+        module = _load_module(path)
+        code = getattr(module, "FEATURE_CODE", None)
+        if code is None or not callable(getattr(module, "compute_feature", None)):
+            continue
+        if frame is None:
+            frame = _probe_frame()
+        manifest[code] = describe(module, path, frame)
+    return manifest
+
+
+def write_manifest(features_dir: PathLike) -> Manifest:
+    """(Re)write features_dir/manifest.json; only changed modules are re-described."""
+    features_dir = Path(features_dir)
+    previous = _read(features_dir)
+    manifest = build_manifest(features_dir, previous)
+    if manifest != previous:
+        with open(features_dir / MANIFEST_NAME, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+            f.write("\n")
+    return manifest
+
+
+def load_manifest(features_dir: PathLike) -> Optional[Manifest]:
+    """The manifest of `features_dir` if it is current (same files, same hashes), else None."""
+    features_dir = Path(features_dir)
+    manifest = _read(features_dir)
+    if manifest is None:
+        return None
+    files = {entry["file"] for entry in manifest.values()}
+    for path in features_dir.glob("*.py"):
+        if path.name not in files:
+            return None  # a module the manifest does not know (or a non-feature .py)
+    for entry in manifest.values():
+        path = features_dir / entry["file"]
+        if not path.exists() or source_hash(path) != entry["source_hash"]:
+            return None
+    return manifest
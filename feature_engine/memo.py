@@ -0,0 +1,115 @@
+"""
+Per-call memo for intermediates shared between feature modules.
+
+A FeatureContext (feature_engine.context) carries its own memo, so every
+feature handed the same context shares intermediates. For plain frames a
+`compute_scope(frame)` plays that role: while it is active, `shared()`
+returns the cached value for a key instead of recomputing it. Outside a
+scope `shared()` simply calls the factory, so every feature module keeps
+working when `compute_feature(df)` is called on its own.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _buffers(frame: pd.DataFrame) -> Tuple[Any, ...]:
+    """The arrays holding `frame`'s index and columns, in column order."""
+    index = frame.index
+    if isinstance(index, pd.RangeIndex):
+        buffers: List[Any] = [(index.start, index.stop, index.step)]
+    else:
+        buffers = [index.asi8 if isinstance(index, pd.DatetimeIndex) else index.to_numpy()]
+    for j in range(frame.shape[1]):
+        column = frame.iloc[:, j]
+        # numpy-backed columns are views of the frame's block; extension arrays are held as-is
+        buffers.append(column.to_numpy() if isinstance(column.dtype, np.dtype) else column.array)
+    return tuple(buffers)
+
+
+def _buffer_key(buffers: Tuple[Any, ...]) -> Tuple[Hashable, ...]:
+    return tuple(b if isinstance(b, tuple) else
+                 (b.__array_interface__["data"][0], b.shape, b.strides) if isinstance(b, np.ndarray) else id(b)
+                 for b in buffers)
+
+
+class IntermediateCache:
+    """
+    Memo bound to one OHLCV frame, identified by the buffers of its index and
+    columns: a shallow view of the frame matches, a copy or another frame of
+    the same length and index endpoints does not.
+    """
+
+    def __init__(self, frame):
+        # the arrays are kept so their addresses cannot be reused while the memo lives;
+        # non-frame owners (a Panel) carry the memo themselves and are never matched
+        self._buffers = _buffers(frame) if isinstance(frame, pd.DataFrame) else None
+        self._key = None if self._buffers is None else _buffer_key(self._buffers)
+        self.n_rows = len(frame)
+        self.hits = 0
+        self.misses = 0
+        self._store: Dict[Hashable, Any] = {}
+
+    def matches(self, frame: pd.DataFrame) -> bool:
+        if self._key is None or len(frame) != self.n_rows:
+            return False
+        return _buffer_key(_buffers(frame)) == self._key
+
+    def get_or_compute(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        if key in self._store:
+            self.hits += 1
+            return self._store[key]
+        self.misses += 1
+        value = factory()
+        self._store[key] = value
+        return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._store
+
+    def discard(self, key: Hashable) -> None:
+        """Drop the value cached under `key` (if any); it is recomputed if asked for again."""
+        self._store.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+
+_ACTIVE: ContextVar[Optional[IntermediateCache]] = ContextVar("feature_engine_memo", default=None)
+
+
+@contextmanager
+def compute_scope(frame: pd.DataFrame) -> Iterator[IntermediateCache]:
+    """Activate a fresh intermediate memo for `frame` until the block exits."""
+    cache = IntermediateCache(frame)
+    token = _ACTIVE.set(cache)
+    try:
+        yield cache
+    finally:
+        _ACTIVE.reset(token)
+
+
+def active_cache(frame: pd.DataFrame) -> Optional[IntermediateCache]:
+    """The active scope's memo if it belongs to `frame`, else None."""
+    cache = _ACTIVE.get()
+    if cache is None or not cache.matches(frame):
+        return None
+    return cache
+
+
+def shared(frame, key: Hashable, factory: Callable[[], Any]) -> Any:
+    """
+    Return `factory()` memoized under `key` for `frame`: in the memo of a
+    FeatureContext, or of the active scope for a plain DataFrame.
+
+    Cached values are shared between features: callers must treat them as
+    read-only (pandas arithmetic always returns new objects, which is fine).
+    """
+    # anything but a DataFrame is a FeatureContext (not imported: it imports us)
+    cache = active_cache(frame) if isinstance(frame, pd.DataFrame) else frame.memo
+    if cache is None:
+        return factory()
+    return cache.get_or_compute(key, factory)
@@ -0,0 +1,192 @@
+"""
+Rolling sum / mean / variance / z-score over windows of any length
+from one shared prefix-sum pass.
+
+`RollingMoments` runs one compiled pass over its input and keeps prefix
+sums of x and x**2 plus a prefix count of the values they hold. The
+moments of any window are then differences of two prefix entries, so every
+further window length, min_periods or ddof costs a single O(n) pass. Built once per array
+(and shared through the memo for OHLCV columns, see
+primitives.rolling_moments), one structure serves the SMA, rolling std,
+z-score and rolling-sum windows of a build.
+
+Plain prefix sums lose precision as they grow, and var = (S2 - S1**2/n) / d
+cancels catastrophically. The prefix sums here are compensated instead:
+each is kept as an unevaluated double-double (hi, lo) pair, accumulated
+with error-free two-sum / two-product steps (Kahan-style), and the window
+differences, S1**2 / n and the final division are done in double-double
+too. The variance keeps about 30 significant digits before its last
+rounding, more than the add/remove recurrences of pandas' rolling
+mean/var, so results agree with them to within rounding; sums and means of
+integer-valued series (flags, signs) are exact and identical.
+
+NaN and min_periods follow pandas' rolling: NaNs (and +/-inf, which
+pandas' rolling aggregations treat as missing) are skipped and counted
+out, sum is NaN below min_periods (0.0 for an empty window with
+min_periods=0), mean and var need at least max(min_periods, 1) values, var
+needs more than ddof and is 0.0 for a single value. min_periods defaults
+to the window, as in pandas. Arrays may be 1-D or 2-D (time along axis 0, e.g. a
+(T x S) panel frame).
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+from numba import njit
+
+_SPLIT = 134217729.0  # 2**27 + 1, Dekker's splitter
+
+_SUM, _MEAN, _VAR, _ZSCORE = range(4)
+_KINDS = {"sum": _SUM, "mean": _MEAN, "var": _VAR, "zscore": _ZSCORE}
+
+
+# ---- double-double arithmetic (error-free transformations) ----
+
+@njit(cache=True)
+def _two_sum(a, b):
+    s = a + b
+    bb = s - a
+    return s, (a - (s - bb)) + (b - bb)
+
+
+@njit(cache=True)
+def _fast_two_sum(a, b):
+    s = a + b
+    return s, b - (s - a)
+
+
+@njit(cache=True)
+def _two_prod(a, b):
+    p = a * b
+    t = _SPLIT * a
+    ah = t - (t - a)
+    al = a - ah
+    t = _SPLIT * b
+    bh = t - (t - b)
+    bl = b - bh
+    return p, ((ah * bh - p) + ah * bl + al * bh) + al * bl
+
+
+@njit(cache=True)
+def _dd_add(ah, al, bh, bl):
+    s, e = _two_sum(ah, bh)
+    return _fast_two_sum(s, e + (al + bl))
+
+
+@njit(cache=True)
+def _dd_mul(ah, al, bh, bl):
+    p, e = _two_prod(ah, bh)
+    return _fast_two_sum(p, e + (ah * bl + al * bh))
+
+
+@njit(cache=True)
+def _dd_div(ah, al, d):
+    """(ah + al) / d for a double d, to double-double precision."""
+    q = ah / d
+    p, e = _two_prod(q, d)
+    r = ((ah - p) - e) + al
+    return _fast_two_sum(q, r / d)
+
+
+# ---- kernels ----
+
+@njit(cache=True)
+def _prefix_kernel(x, s1h, s1l, s2h, s2l, count):
+    # row i + 1 of every prefix holds the totals of x[:i + 1]; columns independent
+    n, k = x.shape
+    for j in range(k):
+        ah = al = bh = bl = 0.0
+        c = 0
+        s1h[0, j] = s1l[0, j] = s2h[0, j] = s2l[0, j] = 0.0
+        count[0, j] = 0
+        for i in range(n):
+            v = x[i, j]
+            if np.isfinite(v):
+                c += 1
+                ah, al = _dd_add(ah, al, v, 0.0)
+                sq, sq_err = _two_prod(v, v)
+                bh, bl = _dd_add(bh, bl, sq, sq_err)
+            s1h[i + 1, j], s1l[i + 1, j] = ah, al
+            s2h[i + 1, j], s2l[i + 1, j] = bh, bl
+            count[i + 1, j] = c
+
+
+@njit(cache=True, error_model="numpy")
+def _window_kernel(x, s1h, s1l, s2h, s2l, count, window, min_periods, ddof, kind, out):
+    n, k = x.shape
+    for j in range(k):
+        for i in range(n):
+            lo = i + 1 - window if i + 1 > window else 0
+            nobs = count[i + 1, j] - count[lo, j]
+            if kind == _SUM:
+                if nobs < min_periods:
+                    out[i, j] = np.nan
+                    continue
+            elif nobs < min_periods or nobs == 0 or (kind != _MEAN and nobs <= ddof):
+                out[i, j] = np.nan
+                continue
+            sh, sl = _dd_add(s1h[i + 1, j], s1l[i + 1, j], -s1h[lo, j], -s1l[lo, j])
+            if kind == _SUM:
+                out[i, j] = sh + sl
+                continue
+            mh, ml = _dd_div(sh, sl, float(nobs))
+            if kind == _MEAN:
+                out[i, j] = mh + ml
+                continue
+            if nobs == 1:
+                var = 0.0
+            else:
+                qh, ql = _dd_add(s2h[i + 1, j], s2l[i + 1, j], -s2h[lo, j], -s2l[lo, j])
+                ph, pl = _dd_mul(mh, ml, sh, sl)  # S1**2 / n
+                dh, dl = _dd_add(qh, ql, -ph, -pl)
+                var = (dh + dl) / (nobs - ddof)
+                var = var if var > 0.0 else 0.0
+            if kind == _VAR:
+                out[i, j] = var
+            else:
+                out[i, j] = (x[i, j] - (mh + ml)) / np.sqrt(var)
+
+
+class RollingMoments:
+    """Compensated prefix sums of `values` (time along axis 0) for rolling moments."""
+
+    def __init__(self, values):
+        self.values = np.asarray(values, dtype=np.float64)
+        x = self._columns(self.values)
+        shape = (x.shape[0] + 1, x.shape[1])
+        self._prefix: Tuple[np.ndarray, ...] = (
+            np.empty(shape), np.empty(shape), np.empty(shape), np.empty(shape), np.empty(shape, np.int64),
+        )
+        _prefix_kernel(x, *self._prefix)
+
+    def __len__(self) -> int:
+        return self.values.shape[0]
+
+    @staticmethod
+    def _columns(values: np.ndarray) -> np.ndarray:
+        return np.ascontiguousarray(values.reshape(values.shape[0], -1))
+
+    def query(self, op: str, window: int, min_periods: Optional[int] = None, ddof: int = 1) -> np.ndarray:
+        """Rolling `op` ("sum", "mean", "var" or "zscore") of every bar over `window` bars."""
+        if window < 1:
+            raise ValueError("window must be >= 1.")
+        min_periods = window if min_periods is None else min_periods
+        x = self._columns(self.values)
+        out = np.empty(x.shape)
+        _window_kernel(x, *self._prefix, window, min_periods, ddof, _KINDS[op], out)
+        return out.reshape(self.values.shape)
+
+    def sum(self, window: int, min_periods: Optional[int] = None) -> np.ndarray:
+        return self.query("sum", window, min_periods)
+
+    def mean(self, window: int, min_periods: Optional[int] = None) -> np.ndarray:
+        return self.query("mean", window, min_periods)
+
+    def var(self, window: int, min_periods: Optional[int] = None, ddof: int = 1) -> np.ndarray:
+        return self.query("var", window, min_periods, ddof)
+
+    def std(self, window: int, min_periods: Optional[int] = None, ddof: int = 1) -> np.ndarray:
+        return np.sqrt(self.var(window, min_periods, ddof))
+
+    def zscore(self, window: int, min_periods: Optional[int] = None, ddof: int = 1) -> np.ndarray:
+        """(x - rolling mean) / rolling std of every bar over `window` bars."""
+        return self.query("zscore", window, min_periods, ddof)
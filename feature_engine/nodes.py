@@ -0,0 +1,208 @@
+"""
+Named primitive nodes (true range, ATR, DMI/ADX, candle parts, ...) and the
+dependency DAG between them.
+
+A node is referenced as "name" or "name:arg[,arg...]" ("true_range",
+"atr:14", "dmi:14"). Its definition lists the nodes it is built from, so
+"dmi:14" depends on "atr:14", which depends on "true_range". `node(g, ref)`
+returns the value, computing its dependencies first; values are memoized in
+the context like every other shared intermediate, so each node is computed
+once per dataset. ATR and DMI run on the compiled kernels of
+feature_engine.indicators.
+
+Feature modules declare the nodes they read:
+
+    DEPENDS = ("dmi:14",)
+
+and FeatureRegistry.compute runs them through a `NodePlan`: features that
+share nodes run next to each other, nodes are computed in topological order
+right before their first consumer, and every node is dropped from the memo
+as soon as its last consumer (a feature or another node) is done, so only
+the intermediates still needed are alive at any point of a full build.
+Undeclared use still works; such values simply live as long as the context.
+"""
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .context import FrameLike
+from .indicators import dmi, wilder
+from .memo import shared
+
+
+@dataclass(frozen=True)
+class Node:
+    """name, dependency templates ("atr:{0}" is filled with the node's args) and compute."""
+    name: str
+    deps: Tuple[str, ...]
+    compute: Callable[..., Any]
+
+
+NODES: Dict[str, Node] = {}
+
+
+def define(name: str, deps: Sequence[str] = ()):
+    """Register `compute(g, *dep_values, *args)` as node `name`."""
+    def register(compute):
+        if name in NODES:
+            raise ValueError(f"Node {name!r} is already defined.")
+        NODES[name] = Node(name, tuple(deps), compute)
+        return compute
+    return register
+
+
+def _arg(text: str):
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse(ref: str) -> Tuple[str, Tuple[Any, ...]]:
+    """"atr:14" -> ("atr", (14,))."""
+    name, _, args = ref.partition(":")
+    if name not in NODES:
+        raise KeyError(f"Unknown node {name!r}.")
+    return name, tuple(_arg(a.strip()) for a in args.split(",")) if args else ()
+
+
+def canonical(ref: str) -> str:
+    name, args = parse(ref)
+    return f"{name}:{','.join(map(str, args))}" if args else name
+
+
+def dependencies(ref: str) -> List[str]:
+    """Direct dependencies of `ref`, canonical."""
+    name, args = parse(ref)
+    return [canonical(dep.format(*args)) for dep in NODES[name].deps]
+
+
+def closure(refs: Iterable[str]) -> List[str]:
+    """`refs` and everything they depend on, dependencies first."""
+    order: List[str] = []
+    seen = set()
+
+    def visit(ref: str, path: Tuple[str, ...]) -> None:
+        if ref in path:
+            raise ValueError(f"Node cycle: {' -> '.join(path + (ref,))}.")
+        if ref in seen:
+            return
+        for dep in dependencies(ref):
+            visit(dep, path + (ref,))
+        seen.add(ref)
+        order.append(ref)
+
+    for ref in refs:
+        visit(canonical(ref), ())
+    return order
+
+
+def node(g: FrameLike, ref: str) -> Any:
+    """Value of node `ref` on `g` (memoized; dependencies computed first)."""
+    ref = canonical(ref)
+
+    def factory():
+        name, args = parse(ref)
+        deps = [node(g, dep) for dep in dependencies(ref)]
+        return NODES[name].compute(g, *deps, *args)
+
+    return shared(g, ("node", ref), factory)
+
+
+class NodePlan:
+    """
+    Execution order and node lifetimes for one build of `modules`.
+
+    for j in plan.order:
+        plan.acquire(g, j); ...compute module j...; plan.release(g, j)
+    """
+
+    def __init__(self, modules: Sequence[Any]):
+        self.uses = [[canonical(ref) for ref in getattr(m, "DEPENDS", ())] for m in modules]
+        self.nodes = closure(ref for uses in self.uses for ref in uses)
+        rank = {ref: k for k, ref in enumerate(self.nodes)}
+        # modules without nodes first, then grouped by the nodes they read
+        self.order = sorted(range(len(modules)),
+                            key=lambda j: (len(self.uses[j]) > 0, sorted(rank[r] for r in self.uses[j])))
+        self.refcount: Counter = Counter()
+        for uses in self.uses:
+            self.refcount.update(uses)
+        for ref in self.nodes:
+            self.refcount.update(dependencies(ref))
+        self._built = set()
+        self.live = 0
+        self.peak = 0
+
+    def acquire(self, g: FrameLike, j: int) -> None:
+        """Compute the nodes module j declares (and their dependencies) in topological order."""
+        for ref in closure(self.uses[j]):
+            if ref in self._built:
+                continue
+            node(g, ref)
+            self._built.add(ref)
+            self.live += 1
+            self.peak = max(self.peak, self.live)
+            for dep in dependencies(ref):
+                self._drop(g, dep)
+
+    def release(self, g: FrameLike, j: int) -> None:
+        """Module j is done with its nodes; free those it was the last consumer of."""
+        for ref in self.uses[j]:
+            self._drop(g, ref)
+
+    def _drop(self, g: FrameLike, ref: str) -> None:
+        self.refcount[ref] -= 1
+        if self.refcount[ref] == 0:
+            g.memo.discard(("node", ref))
+            self.live -= 1
+
+
+# ---- node definitions ----
+
+class CandleParts(NamedTuple):
+    """Per-bar candle decomposition (wicks clipped at 0)."""
+    body: Any        # |close - open|
+    upper_wick: Any  # high - max(open, close)
+    lower_wick: Any  # min(open, close) - low
+
+
+@define("bar_range")
+def _bar_range(g):
+    return (g["high"] - g["low"]).abs()
+
+
+@define("candle_parts")
+def _candle_parts(g):
+    open_, close = g["open"], g["close"]
+    upper_body = np.maximum(open_, close)
+    lower_body = np.minimum(open_, close)
+    return CandleParts(
+        body=(close - open_).abs(),
+        upper_wick=(g["high"] - upper_body).clip(lower=0.0),
+        lower_wick=(lower_body - g["low"]).clip(lower=0.0),
+    )
+
+
+@define("true_range")
+def _true_range(g):
+    # max of the three legs, NaNs skipped (the first bar is high - low)
+    h, l, prev_c = g["high"], g["low"], g["close"].shift(1)
+    return np.fmax(np.fmax(h - l, (h - prev_c).abs()), (l - prev_c).abs())
+
+
+@define("atr", deps=("true_range",))
+def _atr(g, tr, period):
+    """Wilder ATR: ewm(alpha=1/period, adjust=False, min_periods=period) of the true range."""
+    return pd.Series(wilder(tr, (period,))[:, 0], index=tr.index)
+
+
+@define("dmi", deps=("atr:{0}",))
+def _dmi(g, atr, period):
+    """(plus_di, minus_di, adx), Wilder smoothing over `period`."""
+    plus_di, minus_di, adx = dmi(g["high"], g["low"], g["close"], (period,), atr.to_numpy())
+    return tuple(pd.Series(values[:, 0], index=atr.index) for values in (plus_di, minus_di, adx))
@@ -0,0 +1,241 @@
+"""
+Sliding-window order statistics (rolling quantiles, ranks, rank entropy).
+
+Each kernel keeps the finite values of the current window in sorted order,
+updated by one binary insert and one delete per bar, so a window of W bars
+costs O(log W + W) memory moves per step instead of a full sort (or a Python
+callback) per window. Several quantiles are read from the same sorted window
+in one pass.
+"""
+import math
+from typing import Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+
+@njit(cache=True)
+def _insert(sp, m, x):
+    lo, hi = 0, m
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if sp[mid] <= x:
+            lo = mid + 1
+        else:
+            hi = mid
+    for k in range(m, lo, -1):
+        sp[k] = sp[k - 1]
+    sp[lo] = x
+
+
+@njit(cache=True)
+def _delete(sp, m, x):
+    lo, hi = 0, m
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if sp[mid] < x:
+            lo = mid + 1
+        else:
+            hi = mid
+    for k in range(lo, m - 1):
+        sp[k] = sp[k + 1]
+
+
+@njit(cache=True)
+def _rolling_quantile_kernel(x, window, min_periods, qs, out):
+    n = x.shape[0]
+    sp = np.empty(window, np.float64)
+    m = 0
+    for i in range(n):
+        j = i - window
+        if j >= 0 and np.isfinite(x[j]):
+            _delete(sp, m, x[j])
+            m -= 1
+        if np.isfinite(x[i]):
+            _insert(sp, m, x[i])
+            m += 1
+        if m < min_periods or m == 0:
+            continue
+        for k in range(qs.shape[0]):
+            # pandas rolling().quantile(q, interpolation="linear")
+            if m == 1:
+                out[i, k] = sp[0]
+                continue
+            pos = qs[k] * (m - 1)
+            idx = int(pos)
+            if idx == pos:
+                out[i, k] = sp[idx]
+            else:
+                out[i, k] = sp[idx] + (sp[idx + 1] - sp[idx]) * (pos - idx)
+
+
+@njit(cache=True)
+def _rolling_rank_kernel(x, window, min_periods, pct, out):
+    n = x.shape[0]
+    sp = np.empty(window, np.float64)
+    m = 0
+    for i in range(n):
+        j = i - window
+        if j >= 0 and np.isfinite(x[j]):
+            _delete(sp, m, x[j])
+            m -= 1
+        if np.isfinite(x[i]):
+            _insert(sp, m, x[i])
+            m += 1
+        else:
+            continue
+        if m < min_periods:
+            continue
+        less = 0
+        equal = 0
+        for k in range(m):
+            if sp[k] < x[i]:
+                less += 1
+            elif sp[k] == x[i]:
+                equal += 1
+            else:
+                break
+        # average rank of the newest value among the window's ties
+        rank = less + (equal + 1) / 2.0
+        out[i] = rank / m if pct else rank
+
+
+@njit(cache=True)
+def _lerp(a, b, t):
+    # np.quantile's linear interpolation, same branch on t
+    if t >= 0.5:
+        return b - (b - a) * (1.0 - t)
+    return a + (b - a) * t
+
+
+@njit(cache=True)
+def _rank_entropy_kernel(x, window, min_periods, qs, out):
+    n = x.shape[0]
+    n_bins = qs.shape[0] + 1
+    log_bins = math.log(n_bins)
+    sp = np.empty(window, np.float64)
+    ranks = np.empty(window, np.float64)
+    counts = np.empty(n_bins, np.float64)
+    m = 0
+    n_nan = 0
+    for i in range(n):
+        j = i - window
+        if j >= 0:
+            if np.isfinite(x[j]):
+                _delete(sp, m, x[j])
+                m -= 1
+            else:
+                n_nan -= 1
+        if np.isfinite(x[i]):
+            _insert(sp, m, x[i])
+            m += 1
+        else:
+            n_nan += 1
+        if m < min_periods or m + n_nan < 3:
+            continue
+        total = m + n_nan
+
+        if n_nan > 0:
+            # NaN ranks make every quantile edge NaN: the finite values land in
+            # the first bin and the NaNs in the last one
+            acc = 0.0
+            for c in (m, n_nan):
+                p = c / total
+                acc += p * math.log(p)
+            out[i] = -acc / log_bins
+            continue
+
+        # average ranks (1-based) of the sorted window, tie groups averaged
+        a = 0
+        while a < m:
+            b = a + 1
+            while b < m and sp[b] == sp[a]:
+                b += 1
+            r = (a + 1 + b) / 2.0
+            for k in range(a, b):
+                ranks[k] = r
+            a = b
+
+        counts[:] = 0.0
+        lo = 0
+        for k in range(qs.shape[0] + 1):
+            if k < qs.shape[0]:
+                pos = (m - 1) * qs[k]
+                prev = math.floor(pos)
+                if pos >= m - 1:
+                    edge = ranks[m - 1]
+                else:
+                    ip = int(prev)
+                    edge = _lerp(ranks[ip], ranks[ip + 1], pos - prev)
+            else:
+                edge = np.inf
+            # np.digitize: bin k holds ranks in [edge_{k-1}, edge_k)
+            hi = lo
+            while hi < m and ranks[hi] < edge:
+                hi += 1
+            counts[k] = hi - lo
+            lo = hi
+
+        acc = 0.0
+        for k in range(n_bins):
+            if counts[k] > 0:
+                p = counts[k] / m
+                acc += p * math.log(p)
+        out[i] = -acc / log_bins
+
+
+def _as_array(x: Union[np.ndarray, pd.Series]) -> np.ndarray:
+    return np.ascontiguousarray(x, dtype=np.float64)
+
+
+def rolling_quantiles(x: Union[np.ndarray, pd.Series], window: int,
+                      quantiles: Sequence[float], min_periods: Optional[int] = None) -> np.ndarray:
+    """
+    Rolling linear-interpolated quantiles of `x`, shape (len(x), len(quantiles)).
+
+    Matches pandas rolling(window, min_periods).quantile(q): NaNs are skipped
+    and a bar is NaN while the window holds fewer than min_periods values.
+    """
+    x = _as_array(x)
+    min_periods = window if min_periods is None else min_periods
+    qs = np.ascontiguousarray(quantiles, dtype=np.float64)
+    out = np.full((x.shape[0], qs.shape[0]), np.nan)
+    _rolling_quantile_kernel(x, window, max(min_periods, 1), qs, out)
+    return out
+
+
+def rolling_quantile(x: Union[np.ndarray, pd.Series], window: int, quantile: float,
+                     min_periods: Optional[int] = None) -> np.ndarray:
+    """Single-quantile form of rolling_quantiles."""
+    return rolling_quantiles(x, window, [quantile], min_periods)[:, 0]
+
+
+def rolling_rank(x: Union[np.ndarray, pd.Series], window: int, min_periods: Optional[int] = None,
+                 pct: bool = True) -> np.ndarray:
+    """
+    Rank of each value within its trailing window (average method for ties),
+    as pandas rolling(window, min_periods).rank(pct=pct).
+    """
+    x = _as_array(x)
+    min_periods = window if min_periods is None else min_periods
+    out = np.full(x.shape[0], np.nan)
+    _rolling_rank_kernel(x, window, max(min_periods, 1), pct, out)
+    return out
+
+
+def rolling_rank_entropy(x: Union[np.ndarray, pd.Series], window: int, bins: int = 5,
+                         min_periods: Optional[int] = None) -> np.ndarray:
+    """
+    Normalized entropy of the rank distribution within each trailing window.
+
+    Per window: average ranks, bin them with np.digitize at the rank quantiles
+    1/bins .. (bins-1)/bins, and return the Shannon entropy of the bin shares
+    divided by log(bins).
+    """
+    x = _as_array(x)
+    min_periods = window if min_periods is None else min_periods
+    qs = np.arange(1, bins, dtype=np.float64) / bins
+    out = np.full(x.shape[0], np.nan)
+    _rank_entropy_kernel(x, window, max(min_periods, 1), qs, out)
+    return out
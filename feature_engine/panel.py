@@ -0,0 +1,142 @@
+"""
+Multi-symbol feature build on a (symbols x time) panel.
+
+A `Panel` holds aligned OHLCV arrays of shape (S, T) on one shared index
+(symbols missing a bar carry NaN there). `compute_panel_features` fills a
+(S, T, F) float32 tensor one feature at a time:
+
+  - modules that define `compute_panel(panel)` are called once for the whole
+    universe; they work on `panel[name]`, a (T x S) DataFrame with one column
+    per symbol, so each pandas rolling/shift/arithmetic call covers every
+    symbol at once and gives exactly the per-symbol Series result;
+  - any other module runs per symbol on that symbol's FeatureContext, which
+    is built once (zero-copy over the panel row) and reused across features.
+
+Results are those of compute_feature on each symbol's frame reindexed to the
+panel index.
+"""
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .context import FeatureContext
+from .memo import IntermediateCache
+from .registry import FeatureRegistry, default_registry
+
+OHLCV = ("open", "high", "low", "close", "volume")
+
+
+class Panel:
+    """Aligned (S, T) float64 OHLCV arrays of several symbols on one index."""
+
+    def __init__(self, symbols: Sequence[str], index: pd.Index, columns: Mapping[str, np.ndarray]):
+        self.symbols = list(symbols)
+        self.index = index
+        shape = (len(self.symbols), len(index))
+        self._arrays: Dict[str, np.ndarray] = {}
+        for name, values in columns.items():
+            arr = np.ascontiguousarray(values, dtype=np.float64)
+            if arr.shape != shape:
+                raise ValueError(f"Panel column {name!r} has shape {arr.shape}, expected {shape}.")
+            arr.flags.writeable = False
+            self._arrays[str(name).lower()] = arr
+        self._frames: Dict[str, pd.DataFrame] = {}
+        self._contexts: Dict[int, FeatureContext] = {}
+        self.memo = IntermediateCache(self)
+
+    @classmethod
+    def from_frames(cls, frames: Mapping[str, pd.DataFrame],
+                    columns: Sequence[str] = OHLCV) -> "Panel":
+        """Align per-symbol OHLCV frames on the union of their indexes."""
+        symbols = list(frames)
+        if not symbols:
+            raise ValueError("Panel needs at least one symbol.")
+        index = frames[symbols[0]].index
+        for sym in symbols[1:]:
+            index = index.union(frames[sym].index)
+        index = index.sort_values()
+
+        arrays = {name: np.full((len(symbols), len(index)), np.nan) for name in columns}
+        for k, sym in enumerate(symbols):
+            df = frames[sym]
+            lower = {str(c).lower(): c for c in df.columns}
+            aligned = df.reindex(index) if not df.index.equals(index) else df
+            for name in columns:
+                if name in lower:
+                    arrays[name][k] = aligned[lower[name]].to_numpy(dtype=np.float64)
+        return cls(symbols, index, arrays)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def n_symbols(self) -> int:
+        return len(self.symbols)
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._arrays)
+
+    def array(self, name: str) -> np.ndarray:
+        """(S, T) read-only float64 array of column `name`."""
+        return self._arrays[name]
+
+    def frame(self, name: str) -> pd.DataFrame:
+        """(T x S) DataFrame view of column `name`, one column per symbol."""
+        df = self._frames.get(name)
+        if df is None:
+            df = pd.DataFrame(self.array(name).T, index=self.index, columns=self.symbols, copy=False)
+            self._frames[name] = df
+        return df
+
+    # primitives index frames as g[column]; on a panel that is the (T x S) frame
+    __getitem__ = frame
+
+    def context(self, k: int) -> FeatureContext:
+        """FeatureContext of symbol number k (views of the panel rows)."""
+        ctx = self._contexts.get(k)
+        if ctx is None:
+            frame = pd.DataFrame({name: arr[k] for name, arr in self._arrays.items()},
+                                 index=self.index, copy=False)
+            ctx = self._contexts[k] = FeatureContext(frame)
+        return ctx
+
+    def broadcast(self, values) -> np.ndarray:
+        """Per-bar values shared by every symbol (e.g. calendar features) as (S, T)."""
+        values = np.asarray(values, dtype=np.float64)
+        return np.broadcast_to(values, (self.n_symbols, values.shape[0]))
+
+
+def _as_panel_values(values, panel: Panel) -> np.ndarray:
+    if isinstance(values, pd.DataFrame):
+        values = values.to_numpy(dtype=np.float64).T
+    values = np.asarray(values, dtype=np.float64)
+    if values.shape != (panel.n_symbols, len(panel)):
+        raise ValueError(f"compute_panel returned shape {values.shape}, "
+                         f"expected {(panel.n_symbols, len(panel))}.")
+    return values
+
+
+def compute_panel_features(panel: Panel, codes: Optional[Iterable[str]] = None,
+                           registry: Optional[FeatureRegistry] = None
+                           ) -> Tuple[np.ndarray, List[str]]:
+    """
+    Compute `codes` (default: all) for every symbol of `panel`.
+
+    Returns (tensor, names): tensor is a C-contiguous float32 array of shape
+    (n_symbols, len(panel), len(names)); tensor[s, :, j] is feature names[j]
+    of panel.symbols[s].
+    """
+    registry = default_registry if registry is None else registry
+    names = registry.codes if codes is None else list(codes)
+    modules = [registry.get(code) for code in names]
+
+    out = np.empty((panel.n_symbols, len(panel), len(names)), dtype=np.float32)
+    for j, module in enumerate(modules):
+        if hasattr(module, "compute_panel"):
+            out[:, :, j] = _as_panel_values(module.compute_panel(panel), panel)
+            continue
+        for k in range(panel.n_symbols):
+            out[k, :, j] = np.asarray(module.compute_feature(panel.context(k)), dtype=np.float64)
+    return out, names
@@ -0,0 +1,185 @@
+"""
+Process-pool feature build over shared-memory OHLCV.
+
+The parent copies the numeric input columns (and the index, as int64 ns)
+into shared memory once and allocates the float32 output matrix there too.
+Each worker maps both at start-up, builds one FeatureContext over the shared
+columns and then computes whole feature modules, writing every result column
+straight into its slot of the shared output; only (code, seconds) goes back
+over the pipe.
+
+Modules are handed out one at a time, longest first according to recorded
+timings (unknown codes first of all), which keeps the pool busy until the
+end instead of leaving one slow module for last. Timings of every run can be
+saved back to the same JSON file for the next one.
+"""
+import json
+import multiprocessing as mp
+import os
+import time
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .context import FeatureContext, FrameLike, as_context
+from .registry import FEATURES_DIR, FeatureRegistry
+
+PathLike = Union[str, Path]
+
+
+def load_timings(path: Optional[PathLike]) -> Dict[str, float]:
+    """{code: seconds} from a timings JSON file ({} if missing)."""
+    if path is None or not Path(path).exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return {str(k): float(v) for k, v in json.load(f).items()}
+
+
+def save_timings(path: PathLike, timings: Dict[str, float]) -> None:
+    """Merge `timings` into the JSON file at `path`."""
+    merged = load_timings(path)
+    merged.update(timings)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(merged.items())), f, indent=2)
+
+
+def schedule(codes: Iterable[str], timings: Dict[str, float]) -> List[str]:
+    """Longest-first order; codes without a recorded timing go first."""
+    return sorted(codes, key=lambda code: -timings.get(code, float("inf")))
+
+
+def _numeric_columns(context: FeatureContext) -> Dict[str, np.ndarray]:
+    arrays = {}
+    for name in context.columns:
+        try:
+            arrays[name] = context.array(name)
+        except (TypeError, ValueError):
+            continue  # non-numeric columns are of no use to features
+    return arrays
+
+
+class _SharedBlock:
+    """One shared-memory ndarray, created in the parent or attached in a worker."""
+
+    def __init__(self, shape, dtype, name: Optional[str] = None):
+        dtype = np.dtype(dtype)
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.spec = (tuple(shape), dtype.str, self.shm.name)
+        self.array = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf)
+
+    @classmethod
+    def attach(cls, spec) -> "_SharedBlock":
+        shape, dtype, name = spec
+        return cls(shape, dtype, name)
+
+    def close(self, unlink: bool = False) -> None:
+        self.array = None
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+# ---- worker side ----
+
+_WORKER: Dict[str, object] = {}
+
+
+def _init_worker(features_dir: str, columns: List[str], input_spec, output_spec,
+                 index_spec, index_meta) -> None:
+    block = _SharedBlock.attach(input_spec)
+    out = _SharedBlock.attach(output_spec)
+    if index_spec is not None:
+        index_block = _SharedBlock.attach(index_spec)
+        unit, tz, name = index_meta
+        index = pd.DatetimeIndex(index_block.array.view(f"M8[{unit}]"), name=name)
+        if tz is not None:
+            index = index.tz_localize("UTC").tz_convert(tz)
+        _WORKER["index_block"] = index_block
+    else:
+        index = index_meta
+    frame = pd.DataFrame({name: block.array[k] for k, name in enumerate(columns)},
+                         index=index, copy=False)
+    _WORKER.update(registry=FeatureRegistry(Path(features_dir)), context=FeatureContext(frame),
+                   block=block, out=out)
+
+
+def _run_feature(task: Tuple[int, str]) -> Tuple[str, float]:
+    j, code = task
+    t0 = time.perf_counter()
+    values = _WORKER["registry"].get(code).compute_feature(_WORKER["context"])
+    _WORKER["out"].array[:, j] = np.asarray(values, dtype=np.float64)
+    return code, time.perf_counter() - t0
+
+
+# ---- parent side ----
+
+def compute_features_parallel(df: FrameLike, codes: Optional[Iterable[str]] = None,
+                              processes: Optional[int] = None,
+                              timings_path: Optional[PathLike] = None,
+                              features_dir: PathLike = FEATURES_DIR,
+                              start_method: Optional[str] = None
+                              ) -> Tuple[np.ndarray, List[str], Dict[str, float]]:
+    """
+    Compute `codes` (default: all) on `df` across a process pool.
+
+    Returns (matrix, names, timings): matrix and names as in
+    FeatureRegistry.compute, timings = {code: seconds} of this run. With
+    `timings_path`, modules are scheduled longest-first from that file and
+    the new timings are merged back into it.
+    """
+    registry = FeatureRegistry(Path(features_dir))
+    names = registry.codes if codes is None else list(codes)
+    for code in names:
+        registry.get(code)  # unknown codes fail here, before any process starts
+    # a repeated code is computed once and copied into each of its columns
+    unique = list(dict.fromkeys(names))
+    processes = min(processes or os.cpu_count() or 1, max(len(unique), 1))
+
+    context = as_context(df)
+    arrays = _numeric_columns(context)
+    columns = list(arrays)
+    n = len(context)
+
+    blocks = []
+    try:
+        block = _SharedBlock((len(columns), n), np.float64)
+        blocks.append(block)
+        for k, name in enumerate(columns):
+            block.array[k] = arrays[name]
+        out = _SharedBlock((n, len(unique)), np.float32)
+        blocks.append(out)
+
+        index = context.index
+        if isinstance(index, pd.DatetimeIndex):
+            index_block = _SharedBlock((n,), np.int64)
+            blocks.append(index_block)
+            utc = index.tz_convert("UTC").tz_localize(None) if index.tz is not None else index
+            index_block.array[:] = utc.as_unit("ns").asi8
+            index_spec, index_meta = index_block.spec, ("ns", index.tz, index.name)
+        else:
+            index_spec, index_meta = None, index
+
+        timings = load_timings(timings_path)
+        position = {code: j for j, code in enumerate(unique)}
+        tasks = [(position[code], code) for code in schedule(unique, timings)]
+
+        elapsed: Dict[str, float] = {}
+        initargs = (str(features_dir), columns, block.spec, out.spec, index_spec, index_meta)
+        with mp.get_context(start_method).Pool(processes, _init_worker, initargs) as pool:
+            for code, seconds in pool.imap_unordered(_run_feature, tasks, chunksize=1):
+                elapsed[code] = seconds
+        matrix = out.array[:, [position[code] for code in names]]
+    finally:
+        for b in blocks:
+            b.close(unlink=True)
+
+    if timings_path is not None:
+        save_timings(timings_path, elapsed)
+    return matrix, names, elapsed
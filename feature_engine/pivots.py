@@ -0,0 +1,130 @@
+"""
+Pivot-level engine.
+
+Prior-period pivot levels (classic, Camarilla, Woodie, Fibonacci) are
+computed once per period from the period OHLC and kept as a compact
+(n_periods, n_levels) table. Bar-level views (level, distance, confluence)
+index that table through the calendar segmentation instead of building and
+reindexing per-feature DataFrames.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+
+from .calendar import Segments
+
+# level names per method, in table column order
+PIVOT_METHODS: Dict[str, Sequence[str]] = {
+    "classic": ("pp", "r1", "s1", "r2", "s2", "r3", "s3"),
+    "camarilla": ("r1", "s1", "r2", "s2", "r3", "s3", "r4", "s4"),
+    "woodie": ("pp", "r1", "s1", "r2", "s2"),
+    "fibonacci": ("pp", "r1", "s1", "r2", "s2", "r3", "s3"),
+}
+
+
+def pivot_levels(prev_high: np.ndarray, prev_low: np.ndarray, prev_close: np.ndarray,
+                 open_: np.ndarray, method: str = "classic") -> Dict[str, np.ndarray]:
+    """
+    Pivot levels of one method from the prior period's H/L/C.
+
+    `open_` is the current period's open (only Woodie uses it). Arrays are
+    per period; the first period has no prior one and is NaN.
+    """
+    h, l, c = prev_high, prev_low, prev_close
+    rng = h - l
+    if method == "classic":
+        pp = (h + l + c) / 3.0
+        return {"pp": pp, "r1": 2.0 * pp - l, "s1": 2.0 * pp - h,
+                "r2": pp + rng, "s2": pp - rng,
+                "r3": h + 2.0 * (pp - l), "s3": l - 2.0 * (h - pp)}
+    if method == "camarilla":
+        out = {}
+        for k, div in enumerate((12.0, 6.0, 4.0, 2.0), start=1):
+            out[f"r{k}"] = c + rng * 1.1 / div
+            out[f"s{k}"] = c - rng * 1.1 / div
+        return out
+    if method == "woodie":
+        pp = (h + l + 2.0 * open_) / 4.0
+        return {"pp": pp, "r1": 2.0 * pp - l, "s1": 2.0 * pp - h,
+                "r2": pp + rng, "s2": pp - rng}
+    if method == "fibonacci":
+        pp = (h + l + c) / 3.0
+        out = {"pp": pp}
+        for k, ratio in enumerate((0.382, 0.618, 1.0), start=1):
+            out[f"r{k}"] = pp + ratio * rng
+            out[f"s{k}"] = pp - ratio * rng
+        return out
+    raise ValueError(f"Unknown pivot method {method!r}.")
+
+
+@dataclass(frozen=True)
+class PivotTable:
+    """
+    Prior-period pivot levels for one anchor (day, week or month).
+
+    table[k, j] is level names[j] for period k; `prev_range` is the prior
+    period's high - low. Bar-level values are table rows broadcast through
+    `segments`.
+    """
+    segments: Segments
+    names: List[str]
+    table: np.ndarray
+    prev_range: np.ndarray
+
+    def column(self, name: str) -> int:
+        try:
+            return self.names.index(name)
+        except ValueError:
+            raise KeyError(f"Unknown pivot level {name!r}.") from None
+
+    def level(self, name: str) -> np.ndarray:
+        """Level `name` (e.g. "classic.pp") for every bar."""
+        return self.segments.broadcast(self.table[:, self.column(name)])
+
+    def distance(self, close: np.ndarray, name: str) -> np.ndarray:
+        """(close - level) / close for every bar."""
+        close = np.asarray(close, dtype=np.float64)
+        return (close - self.level(name)) / close
+
+    def confluence(self, close: np.ndarray, names: Iterable[str], alpha: float = 5.0,
+                   fill: float = 99.0) -> np.ndarray:
+        """
+        sum_j exp(-alpha * |close - level_j| / prior_range) over `names`.
+
+        Distances that are undefined (no prior period, zero range) count as
+        `fill` prior ranges away.
+        """
+        close = np.asarray(close, dtype=np.float64)
+        prev_range = self.segments.broadcast(np.where(self.prev_range == 0.0, np.nan, self.prev_range))
+        score = np.zeros(close.shape[0])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for name in names:
+                d = np.abs(close - self.level(name)) / prev_range
+                d[~np.isfinite(d)] = fill
+                score = score + np.exp(-alpha * d)
+        return score
+
+
+def build_pivot_table(segments: Segments, open_: np.ndarray, high: np.ndarray, low: np.ndarray,
+                      close: np.ndarray, methods: Sequence[str] = tuple(PIVOT_METHODS)) -> PivotTable:
+    """
+    Pivot table from per-period OHLC arrays (one entry per segment).
+
+    Levels of period k come from period k-1 (no look-ahead); Woodie also uses
+    period k's own open, which is known at its first bar.
+    """
+    prev_high = segments.shift(high)
+    prev_low = segments.shift(low)
+    prev_close = segments.shift(close)
+    open_ = np.asarray(open_, dtype=np.float64)
+
+    names: List[str] = []
+    columns: List[np.ndarray] = []
+    for method in methods:
+        levels = pivot_levels(prev_high, prev_low, prev_close, open_, method)
+        for level in PIVOT_METHODS[method]:
+            names.append(f"{method}.{level}")
+            columns.append(levels[level])
+    table = np.column_stack(columns) if columns else np.empty((len(segments), 0))
+    return PivotTable(segments, names, table, prev_high - prev_low)
@@ -0,0 +1,169 @@
+"""
+Shared rolling primitives used by several feature modules.
+
+Each helper takes the feature context (or an already lower-cased OHLCV frame)
+plus the column name, so the result can be memoized under a stable key during
+a batch build.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from . import calendar, candles, pivots, regression, session, timeframes
+from .context import FrameLike
+from .extrema import RangeExtrema
+from .memo import shared
+from .moments import RollingMoments
+from .volume_profile import volume_profile
+
+
+def range_extrema(g: FrameLike, column: str) -> RangeExtrema:
+    """Sparse-table rolling max/min of g[column], shared by every window size."""
+    return shared(g, ("range_extrema", column), lambda: RangeExtrema(g[column].to_numpy(float)))
+
+
+def rolling_moments(g: FrameLike, column: str) -> RollingMoments:
+    """Compensated prefix sums of g[column] for rolling sum/mean/std of any window."""
+    return shared(g, ("rolling_moments", column), lambda: RollingMoments(g[column].to_numpy(float)))
+
+
+def _like(s, values: np.ndarray):
+    # Series (one symbol) or (T x S) DataFrame (panel) with the layout of `s`
+    if isinstance(s, pd.DataFrame):
+        return pd.DataFrame(values, index=s.index, columns=s.columns)
+    return pd.Series(values, index=s.index, name=s.name)
+
+
+def rolling_max(g: FrameLike, column: str, window: int,
+                min_periods: Optional[int] = None, shift: int = 0) -> pd.Series:
+    """
+    Rolling max of `g[column]` over `window` bars, optionally shifted.
+
+    shift=1 gives the "prior N-bar" extreme that excludes the current bar,
+    i.e. rolling(window).max().shift(1).
+    """
+    min_periods = window if min_periods is None else min_periods
+    key = ("rolling_max", column, window, min_periods, shift)
+
+    def factory() -> pd.Series:
+        s = _like(g[column], range_extrema(g, column).max(window, min_periods))
+        return s.shift(shift) if shift else s
+
+    return shared(g, key, factory)
+
+
+def rolling_min(g: FrameLike, column: str, window: int,
+                min_periods: Optional[int] = None, shift: int = 0) -> pd.Series:
+    """Rolling min of `g[column]`; see `rolling_max`."""
+    min_periods = window if min_periods is None else min_periods
+    key = ("rolling_min", column, window, min_periods, shift)
+
+    def factory() -> pd.Series:
+        s = _like(g[column], range_extrema(g, column).min(window, min_periods))
+        return s.shift(shift) if shift else s
+
+    return shared(g, key, factory)
+
+
+def volume_profile_levels(g: FrameLike, window: int = 100, bins: int = 50,
+                          value_area: Tuple[float, float] = (0.15, 0.85)
+                          ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(poc, val, vah) arrays of the rolling volume profile of close/volume."""
+    key = ("volume_profile", window, bins, tuple(value_area))
+
+    def factory():
+        return volume_profile(g["close"].to_numpy(float), g["volume"].to_numpy(float),
+                              window=window, bins=bins, value_area=value_area)
+
+    return shared(g, key, factory)
+
+
+_SEGMENTERS = {"D": calendar.day_segments, "W": calendar.week_segments, "M": calendar.month_segments}
+_CALENDAR_HTF = {"D": "1d", "W": "1w"}
+
+
+def calendar_segments(g: FrameLike, freq: str = "D") -> calendar.Segments:
+    """Day ("D"), week ("W") or month ("M") segments of g.index."""
+    return shared(g, ("segments", freq), lambda: _SEGMENTERS[freq](g.index))
+
+
+def period_ohlc(g: FrameLike, freq: str = "D") -> pd.DataFrame:
+    """
+    Per-period open/high/low/close (first/max/min/last, NaNs skipped as in
+    groupby), one row per segment of calendar_segments(g, freq).
+    """
+    def factory() -> pd.DataFrame:
+        if freq in _CALENDAR_HTF:
+            # the day / week HTF bars, so the reductions are shared with them
+            bars = htf_bars(g, _CALENDAR_HTF[freq]).frame
+            return pd.DataFrame({c: bars[c].to_numpy() for c in ("open", "high", "low", "close")})
+        seg = calendar_segments(g, freq)
+        return pd.DataFrame({
+            "open": calendar.seg_first(g["open"], seg),
+            "high": calendar.seg_max(g["high"], seg),
+            "low": calendar.seg_min(g["low"], seg),
+            "close": calendar.seg_last(g["close"], seg),
+        })
+
+    return shared(g, ("period_ohlc", freq), factory)
+
+
+_HTF_CALENDAR = {timeframe: freq for freq, timeframe in _CALENDAR_HTF.items()}
+
+
+def htf_bars(g: FrameLike, timeframe: str) -> timeframes.HtfBars:
+    """Higher-timeframe OHLCV bars of g ("15m", "1h", "4h", "1d", "1w"); see feature_engine.timeframes."""
+    def factory() -> timeframes.HtfBars:
+        freq = _HTF_CALENDAR.get(timeframe)
+        segments = calendar_segments(g, freq) if freq is not None else None
+        return timeframes.build_htf_bars(g, timeframe, segments)
+
+    return shared(g, ("htf_bars", timeframe), factory)
+
+
+def candle_column(g: FrameLike, name: str) -> pd.Series:
+    """
+    Column `name` of the fused candle scan (feature_engine.candles). The scan
+    runs once per dataset; a missing OHLC column is read as NaN there, and
+    raises here only for the columns `name` uses.
+
+    On a Panel the result is the (T x S) frame of the per-symbol scans, each
+    run on (and shared with) that symbol's context.
+    """
+    arrays = [g.array(column) for column in candles.INPUTS[name]]
+    if arrays[0].ndim == 2:  # a Panel: (S, T) arrays
+        values = [candle_column(g.context(k), name).to_numpy() for k in range(g.n_symbols)]
+        return pd.DataFrame(np.column_stack(values), index=g.index, columns=g.symbols)
+
+    def factory() -> np.ndarray:
+        o, h, l, c = (g.array(col) if col in g else np.full(len(g.index), np.nan)
+                      for col in ("open", "high", "low", "close"))
+        high = range_extrema(g, "high") if "high" in g else None
+        low = range_extrema(g, "low") if "low" in g else None
+        return candles.scan_candles(o, h, l, c, high, low)
+
+    table = shared(g, ("candle_scan",), factory)
+    return pd.Series(table[candles.ROW[name]], index=g.index, name=name)
+
+
+def session_state(g: FrameLike) -> pd.DataFrame:
+    """Causal intraday session statistics (feature_engine.session.session_stats)."""
+    return shared(g, ("session_stats",), lambda: session.session_stats(g))
+
+
+def pivot_table(g: FrameLike, anchor: str = "D") -> pivots.PivotTable:
+    """All prior-period pivot levels (every method) for a "D"/"W"/"M" anchor."""
+    def factory() -> pivots.PivotTable:
+        ohlc = period_ohlc(g, anchor)
+        return pivots.build_pivot_table(calendar_segments(g, anchor), ohlc["open"].to_numpy(),
+                                        ohlc["high"].to_numpy(), ohlc["low"].to_numpy(),
+                                        ohlc["close"].to_numpy())
+
+    return shared(g, ("pivot_table", anchor), factory)
+
+
+def rolling_regression(g: FrameLike, column: str, window: int) -> regression.RollingOls:
+    """Rolling OLS of g[column] on window-local time (feature_engine.regression)."""
+    return shared(g, ("rolling_ols", column, window),
+                  lambda: regression.rolling_ols(g[column].to_numpy(float), window))
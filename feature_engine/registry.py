@@ -0,0 +1,267 @@
+"""
+Feature registry and batch engine.
+
+Discovers every module in features/ that defines FEATURE_CODE and
+compute_feature(df), and computes the whole library (or a named subset) into
+one contiguous float32 matrix. Every feature receives the same read-only
+FeatureContext, so the input is converted once per call and intermediates
+requested through feature_engine.primitives are computed once and shared.
+Modules declaring the named nodes they read (`DEPENDS`, see
+feature_engine.nodes) are scheduled so that each node is built once, right
+before its first consumer, and freed after its last.
+Modules that also define `FeatureStream` can be run live, one bar at a time (see stream()).
+When features/manifest.json is current, modules are imported only as their
+codes are requested.
+
+A module can declare itself a feature family over a parameter grid:
+
+    FEATURE_CODE = "range_high_dist_50"
+    LOOKBACK = 49
+    PARAM_GRID = {"window": (10, 20, 50, 100, 200)}
+    VARIANT_CODE = "range_high_dist_{window}"
+
+    def variant_lookback(window: int) -> int: ...
+    def compute_feature(df, window: int = 50) -> pd.Series: ...
+
+Every other grid point is registered as a `FeatureVariant` under its own
+code (range_high_dist_10, ...), listed in `variant_codes` and accepted
+anywhere a code is. Variants computed on one context share the family's
+intermediates (sparse tables, per-bar series), so each extra window costs a
+single pass instead of a full recompute.
+Variants declare the module's DEPENDS, or its VARIANT_DEPENDS when the
+other grid points read nodes the default one does not.
+"""
+import importlib.util
+import itertools
+import sys
+from functools import partial
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .context import FrameLike, as_context
+from .manifest import Manifest, load_manifest
+from .nodes import NodePlan
+from .streaming import StreamingFeature
+
+FEATURES_DIR = Path(__file__).resolve().parent.parent / "features"
+
+
+def _load_module(path: Path) -> ModuleType:
+    name = f"features.{path.stem}"
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        del sys.modules[name]
+        raise
+    return module
+
+
+class FeatureVariant:
+    """
+    One grid point of a feature family, usable wherever a feature module is:
+    FEATURE_CODE, LOOKBACK, compute_feature(df) and, when the family has
+    them, compute_panel(panel) and FeatureStream, all bound to `params`.
+    """
+
+    def __init__(self, module: ModuleType, code: str, params: Dict[str, Any]):
+        self.module = module
+        self.params = dict(params)
+        self.FEATURE_CODE = code
+        self.LOOKBACK = module.variant_lookback(**self.params)
+        self.__file__ = module.__file__
+        if hasattr(module, "OUTPUT_KIND"):
+            self.OUTPUT_KIND = module.OUTPUT_KIND
+        # a family whose default grid point reads other nodes than the rest declares VARIANT_DEPENDS
+        depends = getattr(module, "VARIANT_DEPENDS", getattr(module, "DEPENDS", None))
+        if depends is not None:
+            self.DEPENDS = depends
+        if hasattr(module, "compute_panel"):
+            self.compute_panel = partial(module.compute_panel, **self.params)
+        if hasattr(module, "FeatureStream"):
+            self.FeatureStream = partial(module.FeatureStream, **self.params)
+
+    def compute_feature(self, df: FrameLike) -> pd.Series:
+        s = self.module.compute_feature(df, **self.params)
+        s.name = self.FEATURE_CODE
+        return s
+
+    def __repr__(self) -> str:
+        return f"FeatureVariant({self.FEATURE_CODE!r}, {self.params!r})"
+
+
+FeatureLike = Union[ModuleType, FeatureVariant]
+
+
+def _grid_variants(module: ModuleType) -> List[FeatureVariant]:
+    grid = getattr(module, "PARAM_GRID", None)
+    if not grid:
+        return []
+    names = list(grid)
+    variants = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        params = dict(zip(names, values))
+        code = module.VARIANT_CODE.format(**params)
+        if code != module.FEATURE_CODE:  # the default grid point is the module itself
+            variants.append(FeatureVariant(module, code, params))
+    return variants
+
+
+class FeatureRegistry:
+    """
+    Maps FEATURE_CODE -> feature module for one features directory.
+
+    With a current features/manifest.json (feature_engine.manifest) codes are
+    listed from it and each module is imported on first `get`; otherwise, or
+    after an explicit `discover()`, every module is imported up front.
+    """
+
+    def __init__(self, features_dir: Path = FEATURES_DIR, use_manifest: bool = True):
+        self.features_dir = Path(features_dir)
+        self.use_manifest = use_manifest
+        self._modules: Dict[str, ModuleType] = {}
+        self._variants: Dict[str, FeatureVariant] = {}
+        self._manifest: Optional[Manifest] = None
+        self._variant_params: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self._discovered = False
+
+    def discover(self) -> "FeatureRegistry":
+        """Import every features/*.py and index it by FEATURE_CODE."""
+        modules: Dict[str, ModuleType] = {}
+        for path in sorted(self.features_dir.glob("*.py")):
+            module = _load_module(path)
+            code = getattr(module, "FEATURE_CODE", None)
+            if code is None or not callable(getattr(module, "compute_feature", None)):
+                continue
+            if code in modules:
+                raise ValueError(f"Duplicate FEATURE_CODE {code!r} in {path.name}.")
+            modules[code] = module
+        variants: Dict[str, FeatureVariant] = {}
+        for module in modules.values():
+            for variant in _grid_variants(module):
+                if variant.FEATURE_CODE in modules or variant.FEATURE_CODE in variants:
+                    raise ValueError(f"Duplicate FEATURE_CODE {variant.FEATURE_CODE!r} "
+                                     f"from the grid of {module.FEATURE_CODE!r}.")
+                variants[variant.FEATURE_CODE] = variant
+        self._modules = modules
+        self._variants = variants
+        self._manifest = None
+        self._discovered = True
+        return self
+
+    def _ensure(self) -> None:
+        if self._discovered:
+            return
+        manifest = load_manifest(self.features_dir) if self.use_manifest else None
+        if manifest is None:
+            self.discover()
+            return
+        self._manifest = manifest
+        self._variant_params = {variant: (code, params) for code, entry in manifest.items()
+                                for variant, params in entry["variants"].items()}
+        self._discovered = True
+
+    @property
+    def codes(self) -> List[str]:
+        self._ensure()
+        return list(self._modules if self._manifest is None else self._manifest)
+
+    @property
+    def variant_codes(self) -> List[str]:
+        """Codes of the extra grid points of feature families (see FeatureVariant)."""
+        self._ensure()
+        return list(self._variants if self._manifest is None else self._variant_params)
+
+    @property
+    def all_codes(self) -> List[str]:
+        """`codes` followed by `variant_codes`."""
+        return self.codes + self.variant_codes
+
+    def get(self, code: str) -> FeatureLike:
+        self._ensure()
+        module = self._modules.get(code) or self._variants.get(code)
+        if module is not None:
+            return module
+        if self._manifest is not None:
+            if code in self._manifest:
+                module = _load_module(self.features_dir / self._manifest[code]["file"])
+                if getattr(module, "FEATURE_CODE", None) != code:
+                    raise ValueError(f"{self._manifest[code]['file']} no longer defines {code!r}; "
+                                     f"regenerate the manifest.")
+                self._modules[code] = module
+                return module
+            if code in self._variant_params:
+                base, params = self._variant_params[code]
+                variant = self._variants[code] = FeatureVariant(self.get(base), code, params)
+                return variant
+        raise KeyError(f"Unknown feature code {code!r}.")
+
+    def __contains__(self, code: str) -> bool:
+        self._ensure()
+        if self._manifest is not None:
+            return code in self._manifest or code in self._variant_params
+        return code in self._modules or code in self._variants
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def streaming_codes(self) -> List[str]:
+        """Codes whose module provides an incremental FeatureStream."""
+        self._ensure()
+        if self._manifest is not None:
+            return [code for code, entry in self._manifest.items() if entry["stream"]]
+        return [code for code, module in self._modules.items() if hasattr(module, "FeatureStream")]
+
+    def stream(self, code: str, history: Optional[pd.DataFrame] = None) -> StreamingFeature:
+        """
+        New live stream for `code`, optionally primed with `history`.
+
+        Feed further bars with `update(bar)`; each call returns the value the
+        batch compute_feature would give for that bar.
+        """
+        module = self.get(code)
+        if not hasattr(module, "FeatureStream"):
+            raise ValueError(f"Feature {code!r} has no streaming implementation.")
+        stream = module.FeatureStream()
+        if history is not None:
+            stream.init(history)
+        return stream
+
+    def compute(self, df: FrameLike,
+                codes: Optional[Iterable[str]] = None) -> Tuple[np.ndarray, List[str]]:
+        """
+        Compute `codes` (default: all) on `df`.
+
+        Returns (matrix, names): matrix is a C-contiguous float32 array of shape
+        (len(df), len(names)); column j holds feature names[j].
+        """
+        names = self.codes if codes is None else list(codes)
+        modules = [self.get(code) for code in names]
+
+        context = as_context(df)
+        out = np.empty((len(context), len(names)), dtype=np.float32)
+        plan = NodePlan(modules)
+        for j in plan.order:
+            plan.acquire(context, j)
+            values = modules[j].compute_feature(context)
+            out[:, j] = np.asarray(values, dtype=np.float64)
+            plan.release(context, j)
+        return out, names
+
+
+default_registry = FeatureRegistry()
+
+
+def compute_features(df: FrameLike,
+                     codes: Optional[Iterable[str]] = None) -> Tuple[np.ndarray, List[str]]:
+    """Compute features with the default registry; see FeatureRegistry.compute."""
+    return default_registry.compute(df, codes)
@@ -0,0 +1,109 @@
+"""
+Rolling least-squares regression of a series on time.
+
+Each window is fitted on window-local time x = 0..W-1 (not the global bar
+number), with sums kept relative to an anchor value taken from the window.
+Sums are updated in O(1) per bar and rebuilt from the data every W bars, so
+rounding error stays bounded at any series length, unlike the
+`mean(t*t) - mean(t)**2` form on t = arange(n).
+"""
+from typing import Dict, NamedTuple, Sequence, Union
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+SLOPE, INTERCEPT, FITTED, RESID_STD, R2 = range(5)
+
+
+class RollingOls(NamedTuple):
+    """
+    Per-bar results of a rolling OLS fit of y on time (NaN until the window
+    is full or while it holds a NaN).
+
+    slope:     change per bar
+    intercept: fitted value at the oldest bar of the window
+    fitted:    fitted value at the newest (current) bar
+    resid_std: sqrt(var_y * (1 - r2)), population form
+    r2:        squared correlation of y with time
+    """
+    slope: np.ndarray
+    intercept: np.ndarray
+    fitted: np.ndarray
+    resid_std: np.ndarray
+    r2: np.ndarray
+
+
+@njit(cache=True)
+def _rolling_ols_kernel(y, windows, out):
+    n = y.shape[0]
+    for j in range(windows.shape[0]):
+        w = windows[j]
+        x_mean = (w - 1) / 2.0
+        var_x = (w * w - 1) / 12.0
+        n_nan = 0
+        anchor = 0.0
+        sd = 0.0
+        sdd = 0.0
+        sxd = 0.0
+        since = w
+        for i in range(n):
+            if np.isnan(y[i]):
+                n_nan += 1
+            if i >= w and np.isnan(y[i - w]):
+                n_nan -= 1
+            if i < w - 1 or n_nan > 0:
+                since = w
+                continue
+
+            if since >= w:
+                # rebuild the anchored sums from the window itself
+                first = i - w + 1
+                anchor = y[first]
+                sd = 0.0
+                sdd = 0.0
+                sxd = 0.0
+                for k in range(w):
+                    d = y[first + k] - anchor
+                    sd += d
+                    sdd += d * d
+                    sxd += (k - x_mean) * d
+                since = 0
+            else:
+                d_old = y[i - w] - anchor
+                d_new = y[i] - anchor
+                # remaining points shift one step left in local time
+                sxd += x_mean * d_old - (sd - d_old) + x_mean * d_new
+                sd += d_new - d_old
+                sdd += d_new * d_new - d_old * d_old
+            since += 1
+
+            mean_d = sd / w
+            cov = sxd / w
+            var_y = sdd / w - mean_d * mean_d
+            slope = cov / var_x
+            out[j, i, SLOPE] = slope
+            out[j, i, INTERCEPT] = anchor + mean_d - slope * x_mean
+            out[j, i, FITTED] = anchor + mean_d + slope * x_mean
+            if var_y > 0.0:
+                r2 = cov * cov / (var_x * var_y)
+                out[j, i, R2] = r2
+                out[j, i, RESID_STD] = np.sqrt(max(var_y * (1.0 - r2), 0.0))
+
+
+def rolling_ols_multi(y: Union[np.ndarray, pd.Series],
+                      windows: Sequence[int]) -> Dict[int, RollingOls]:
+    """Rolling OLS of y on time for several windows; one result per window."""
+    windows = np.asarray(windows, dtype=np.int64)
+    if (windows < 2).any():
+        raise ValueError("Regression windows must be at least 2 bars.")
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    out = np.full((windows.shape[0], y.shape[0], 5), np.nan)
+    _rolling_ols_kernel(y, windows, out)
+    return {int(w): RollingOls(*(out[j, :, f].copy() for f in range(5)))
+            for j, w in enumerate(windows)}
+
+
+def rolling_ols(y: Union[np.ndarray, pd.Series], window: int) -> RollingOls:
+    """Rolling OLS of y on time over `window` bars; see RollingOls."""
+    return rolling_ols_multi(y, [window])[int(window)]
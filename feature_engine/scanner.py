@@ -0,0 +1,83 @@
+"""
+Compiled state-machine scanners.
+
+Stateful bar-by-bar features (fair value gaps, breaker and order blocks, ...)
+are written as a nopython transition
+
+    step(state, open, high, low, close, volume) -> float
+
+compiled with `@njit(cache=True)`, in the form of session._session_step:
+`state` is a float64 vector whose slots are named by the scanner's `fields`
+(use module-level slot constants; NaN conventionally means "unset"), the
+bar comes in as scalars, and the return value is what the scanner emits for
+that bar. Anything a step needs from earlier bars (a bar counter, the high
+two bars back, ...) is kept in its own state slots, so the same step serves
+the batch loop and live updates.
+
+`Scanner.run` drives the step over a whole series in one compiled loop;
+`ScannerStream` is the matching StreamingFeature.
+"""
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional, Tuple
+
+import numpy as np
+from numba import njit
+
+from .context import FrameLike, as_context
+from .streaming import StreamingFeature
+
+OHLCV = ("open", "high", "low", "close", "volume")
+
+
+@njit(cache=True)
+def _scan(step, state, o, h, l, c, v, out):
+    for i in range(out.shape[0]):
+        out[i] = step(state, o[i], h[i], l[i], c[i], v[i])
+
+
+@dataclass(frozen=True)
+class Scanner:
+    """
+    A stateful scanner: named state slots plus a compiled per-bar `step`.
+
+    fields:  slot names, in state-vector order
+    step:    njit-compiled transition, see the module docstring
+    initial: starting value per field name (others start as NaN)
+    """
+    fields: Tuple[str, ...]
+    step: Any
+    initial: Optional[Mapping[str, float]] = None
+
+    def new_state(self) -> np.ndarray:
+        state = np.full(len(self.fields), np.nan)
+        for name, value in (self.initial or {}).items():
+            state[self.fields.index(name)] = value
+        return state
+
+    def run(self, df: FrameLike, state: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Emitted value of every bar of `df` (columns missing from it are NaN).
+
+        Starts from `state` (default: a new one) and leaves it advanced past
+        the last bar.
+        """
+        g = as_context(df)
+        n = len(g)
+        bars = [g.array(name) if name in g else np.full(n, np.nan) for name in OHLCV]
+        out = np.empty(n)
+        _scan(self.step, self.new_state() if state is None else state, *bars, out)
+        return out
+
+
+class ScannerStream(StreamingFeature):
+    """Live form of a Scanner: subclasses set `scanner`; history is replayed compiled."""
+    scanner: Scanner
+
+    def reset(self) -> None:
+        self.state = self.scanner.new_state()
+
+    def step(self, o: float, h: float, l: float, c: float, v: float) -> float:
+        return self.scanner.step(self.state, o, h, l, c, v)
+
+    def extend(self, history: FrameLike) -> np.ndarray:
+        return self.scanner.run(history, self.state)
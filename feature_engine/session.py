@@ -0,0 +1,167 @@
+"""
+Causal intraday session accumulator.
+
+One state vector per instrument is advanced bar by bar by `_session_step`;
+every field is an expanding statistic of the current calendar day up to and
+including the current bar (or of fully completed earlier days), so nothing
+depends on bars that have not printed yet. The batch path runs the step over
+the whole array in one compiled O(n) pass; live mode (`SessionAccumulator`)
+calls the very same step for each new bar.
+
+Days follow the index's wall-clock time, like `index.normalize()`.
+"""
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+from .calendar import NS_PER_DAY
+
+NS_PER_HOUR = 3_600 * 1_000_000_000
+
+# Killzones (wall-clock hours, [start, end)): London 07-10, New York 13-16
+KILLZONES = ((7, 10), (13, 16))
+# Asian session: 00:00 .. 04:00 inclusive, as between_time('00:00', '04:00')
+ASIAN_END_NS = 4 * NS_PER_HOUR
+# Initial balance: first hour after the day's first bar
+IB_NS = NS_PER_HOUR
+
+SESSION_FIELDS = (
+    "day",                  # day key of the current session
+    "first_tod",            # time of day (ns) of the session's first bar
+    "open",                 # first valid open of the day
+    "first_close",          # first valid close of the day
+    "high",                 # running high of the day
+    "low",                  # running low of the day
+    "range_sum",            # running sum of |high - low|
+    "killzone_range_sum",   # running sum of |high - low| inside killzones
+    "ib_high",              # initial-balance high (frozen once the IB ends)
+    "ib_low",
+    "asian_high",           # today's Asian-session high so far
+    "asian_low",
+    "prev_high",            # previous completed day
+    "prev_low",
+    "prev_asian_high",
+    "prev_asian_low",
+    "shift_score_1",        # ((H - H_prev) + (L - L_prev)) / 2 of the last completed day
+    "shift_score_2",        # ... and of the day before it
+)
+_F = {name: k for k, name in enumerate(SESSION_FIELDS)}
+N_FIELDS = len(SESSION_FIELDS)
+
+DAY, FIRST_TOD, OPEN, FIRST_CLOSE, HIGH, LOW, RANGE_SUM, KZ_RANGE_SUM = range(8)
+IB_HIGH, IB_LOW, ASIAN_HIGH, ASIAN_LOW, PREV_HIGH, PREV_LOW = range(8, 14)
+PREV_ASIAN_HIGH, PREV_ASIAN_LOW, SHIFT_1, SHIFT_2 = range(14, 18)
+
+
+@njit(cache=True)
+def _nanmax(a, b):
+    if np.isnan(b):
+        return a
+    if np.isnan(a) or b > a:
+        return b
+    return a
+
+
+@njit(cache=True)
+def _nanmin(a, b):
+    if np.isnan(b):
+        return a
+    if np.isnan(a) or b < a:
+        return b
+    return a
+
+
+@njit(cache=True)
+def new_state():
+    st = np.full(N_FIELDS, np.nan)
+    return st
+
+
+@njit(cache=True)
+def _session_step(st, now_ns, o, h, l, c):
+    day = now_ns // NS_PER_DAY
+    tod = now_ns - day * NS_PER_DAY
+
+    if st[DAY] != day:
+        if not np.isnan(st[DAY]):
+            # roll the completed day into the "previous" slots
+            st[SHIFT_2] = st[SHIFT_1]
+            st[SHIFT_1] = ((st[HIGH] - st[PREV_HIGH]) + (st[LOW] - st[PREV_LOW])) / 2.0
+            st[PREV_HIGH] = st[HIGH]
+            st[PREV_LOW] = st[LOW]
+            st[PREV_ASIAN_HIGH] = st[ASIAN_HIGH]
+            st[PREV_ASIAN_LOW] = st[ASIAN_LOW]
+        st[DAY] = day
+        st[FIRST_TOD] = tod
+        for k in (OPEN, FIRST_CLOSE, HIGH, LOW, IB_HIGH, IB_LOW, ASIAN_HIGH, ASIAN_LOW):
+            st[k] = np.nan
+        st[RANGE_SUM] = 0.0
+        st[KZ_RANGE_SUM] = 0.0
+
+    if np.isnan(st[OPEN]):
+        st[OPEN] = o
+    if np.isnan(st[FIRST_CLOSE]):
+        st[FIRST_CLOSE] = c
+    st[HIGH] = _nanmax(st[HIGH], h)
+    st[LOW] = _nanmin(st[LOW], l)
+
+    rng = abs(h - l)
+    if not np.isnan(rng):
+        st[RANGE_SUM] += rng
+        hour = tod // NS_PER_HOUR
+        for k in range(len(KILLZONES)):
+            if KILLZONES[k][0] <= hour < KILLZONES[k][1]:
+                st[KZ_RANGE_SUM] += rng
+                break
+
+    if tod - st[FIRST_TOD] < IB_NS:
+        st[IB_HIGH] = _nanmax(st[IB_HIGH], h)
+        st[IB_LOW] = _nanmin(st[IB_LOW], l)
+    if tod <= ASIAN_END_NS:
+        st[ASIAN_HIGH] = _nanmax(st[ASIAN_HIGH], h)
+        st[ASIAN_LOW] = _nanmin(st[ASIAN_LOW], l)
+
+
+@njit(cache=True)
+def _session_kernel(now_ns, o, h, l, c, out):
+    st = new_state()
+    for i in range(now_ns.shape[0]):
+        _session_step(st, now_ns[i], o[i], h[i], l[i], c[i])
+        out[i, :] = st
+
+
+def _wall_clock_ns(index: pd.DatetimeIndex) -> np.ndarray:
+    if not isinstance(index, pd.DatetimeIndex):
+        raise ValueError("Session statistics require a DatetimeIndex.")
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return np.ascontiguousarray(index.as_unit("ns").asi8)
+
+
+def session_stats(g: pd.DataFrame) -> pd.DataFrame:
+    """
+    Causal session statistics for every bar of the (lower-cased) OHLC frame.
+
+    Returns a DataFrame (same index) with one column per SESSION_FIELDS entry;
+    row t only uses bars up to t.
+    """
+    cols = [np.ascontiguousarray(g[k], dtype=np.float64) for k in ("open", "high", "low", "close")]
+    out = np.empty((len(g), N_FIELDS))
+    _session_kernel(_wall_clock_ns(g.index), *cols, out)
+    return pd.DataFrame(out, index=g.index, columns=list(SESSION_FIELDS))
+
+
+class SessionAccumulator:
+    """Live form of session_stats: update(now_ns, o, h, l, c) per bar."""
+
+    def __init__(self):
+        self.state = new_state()
+
+    def update(self, now_ns: int, o: float, h: float, l: float, c: float) -> np.ndarray:
+        _session_step(self.state, now_ns, o, h, l, c)
+        return self.state
+
+    def snapshot(self) -> Dict[str, float]:
+        return {name: float(self.state[k]) for name, k in _F.items()}
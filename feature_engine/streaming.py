@@ -0,0 +1,415 @@
+"""
+Incremental (streaming) building blocks for live feature updates.
+
+A feature module that supports live mode defines `class FeatureStream` (a
+`StreamingFeature`). It is primed once with `init(history)` and then fed one
+bar at a time with `update(bar) -> value`. Memory is bounded by the longest
+window used; each update is O(1) (amortized for the monotonic deques).
+
+The primitives follow the pandas semantics of the batch code they mirror
+(NaNs skipped inside windows, min_periods on the count of valid values,
+ewm(adjust=False) recursion), so a stream reproduces `compute_feature` bar
+for bar up to floating-point rounding.
+"""
+import math
+from collections import deque
+from typing import Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+NAN = float("nan")
+
+OHLCV = ("open", "high", "low", "close", "volume")
+
+
+def _isnan(x: float) -> bool:
+    return x != x
+
+
+def div(a: float, b: float) -> float:
+    """a / b with numpy float semantics (inf / NaN instead of ZeroDivisionError)."""
+    if b == 0.0:
+        if a == 0.0 or _isnan(a):
+            return NAN
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+    return a / b
+
+
+def _bar_columns(history: pd.DataFrame) -> list:
+    # plain Python floats per column: much faster to step through than numpy scalars
+    cols = {str(c).lower(): c for c in history.columns}
+    n = len(history)
+    return [history[cols[k]].to_numpy(float).tolist() if k in cols else [NAN] * n
+            for k in OHLCV]
+
+
+def _wall_clock_ns(ts) -> Optional[int]:
+    if ts is None:
+        return None
+    ts = pd.Timestamp(ts)
+    if ts.tz is not None:
+        ts = ts.tz_localize(None)
+    return ts.value
+
+
+class StreamingFeature:
+    """
+    Base class: subclasses implement reset() and step(o, h, l, c, v).
+
+    Calendar-aware streams set `uses_time = True`; the bar's wall-clock time
+    (ns since epoch, as index.normalize() sees it) is then available to step()
+    as `self.now`.
+    """
+    uses_time = False
+
+    def __init__(self):
+        self.now: Optional[int] = None
+        self.reset()
+
+    def reset(self) -> None:
+        raise NotImplementedError
+
+    def step(self, o: float, h: float, l: float, c: float, v: float) -> float:
+        raise NotImplementedError
+
+    def update(self, bar: Mapping[str, float], timestamp=None) -> float:
+        """
+        Consume one bar (mapping with open/high/low/close/volume keys).
+
+        `timestamp` defaults to `bar.name`, so DataFrame rows carry their time.
+        """
+        if self.uses_time:
+            self.now = _wall_clock_ns(timestamp if timestamp is not None else getattr(bar, "name", None))
+        return self.step(*(float(bar.get(k, NAN)) for k in OHLCV))
+
+    def _replay(self, history: pd.DataFrame):
+        arrays = _bar_columns(history)
+        if not self.uses_time:
+            for bar in zip(*arrays):
+                yield self.step(*bar)
+            return
+        index = history.index
+        if not isinstance(index, pd.DatetimeIndex):
+            raise ValueError(f"{type(self).__name__} requires a DatetimeIndex.")
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        for now, bar in zip(index.as_unit("ns").asi8.tolist(), zip(*arrays)):
+            self.now = now
+            yield self.step(*bar)
+
+    def init(self, history: pd.DataFrame) -> float:
+        """Reset and replay `history`; returns the value for its last bar."""
+        values = self.run(history)
+        return float(values[-1]) if len(values) else NAN
+
+    def run(self, history: pd.DataFrame) -> np.ndarray:
+        """Reset and return the value after every bar of `history`."""
+        self.reset()
+        return self.extend(history)
+
+    def extend(self, history: pd.DataFrame) -> np.ndarray:
+        """Continue from the current state over `history`; value after every bar."""
+        return np.fromiter(self._replay(history), dtype=float, count=len(history))
+
+
+class Lag:
+    """Value from `n` updates ago (NaN until available)."""
+
+    def __init__(self, n: int):
+        self.n = n
+        self.buf: deque = deque(maxlen=n + 1)
+
+    def update(self, x: float) -> float:
+        self.buf.append(x)
+        return self.buf[0] if len(self.buf) == self.n + 1 else NAN
+
+
+class _RollingExtreme:
+    """Monotonic-deque rolling max/min with pandas NaN/min_periods rules."""
+
+    def __init__(self, window: int, min_periods: Optional[int], sign: float):
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self.sign = sign
+        self.i = -1
+        self.valid: deque = deque(maxlen=window)
+        self.count = 0
+        self.dq: deque = deque()
+
+    def update(self, x: float) -> float:
+        self.i += 1
+        if len(self.valid) == self.window and self.valid[0]:
+            self.count -= 1
+        ok = not _isnan(x)
+        self.valid.append(ok)
+        dq = self.dq
+        while dq and dq[0][0] <= self.i - self.window:
+            dq.popleft()
+        if ok:
+            self.count += 1
+            key = self.sign * x
+            while dq and dq[-1][1] <= key:
+                dq.pop()
+            dq.append((self.i, key))
+        if self.count >= self.min_periods and self.count > 0 and dq:
+            return self.sign * dq[0][1]
+        return NAN
+
+
+class RollingMax(_RollingExtreme):
+    def __init__(self, window: int, min_periods: Optional[int] = None):
+        super().__init__(window, min_periods, 1.0)
+
+
+class RollingMin(_RollingExtreme):
+    def __init__(self, window: int, min_periods: Optional[int] = None):
+        super().__init__(window, min_periods, -1.0)
+
+
+class RollingSum:
+    """Compensated running sum over `window` values (pandas rolling().sum())."""
+
+    def __init__(self, window: int, min_periods: Optional[int] = None):
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self.buf: deque = deque(maxlen=window)
+        self.nobs = 0
+        self.total = 0.0
+        self.comp = 0.0
+        self.prev = NAN
+        self.run = 0
+
+    def _add(self, x: float) -> None:
+        y = x - self.comp
+        t = self.total + y
+        self.comp = t - self.total - y
+        self.total = t
+
+    def push(self, x: float) -> None:
+        if len(self.buf) == self.window:
+            old = self.buf[0]
+            if not _isnan(old):
+                self.nobs -= 1
+                self._add(-old)
+        self.buf.append(x)
+        if not _isnan(x):
+            self.run = self.run + 1 if x == self.prev else 1
+            self.prev = x
+            self.nobs += 1
+            self._add(x)
+        if self.nobs == 0:
+            self.total = 0.0
+            self.comp = 0.0
+
+    def update(self, x: float) -> float:
+        self.push(x)
+        if self.nobs >= self.min_periods:
+            if self.nobs and self.run >= self.nobs:
+                return self.prev * self.nobs
+            return self.total if self.nobs else 0.0
+        return NAN
+
+
+class RollingMean(RollingSum):
+    def update(self, x: float) -> float:
+        self.push(x)
+        if self.nobs >= self.min_periods and self.nobs > 0:
+            # a window of identical values averages to exactly that value
+            return self.prev if self.run >= self.nobs else self.total / self.nobs
+        return NAN
+
+
+class RollingStd:
+    """Rolling std (Welford add/remove, pandas rolling().std(ddof))."""
+
+    def __init__(self, window: int, min_periods: Optional[int] = None, ddof: int = 1):
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self.ddof = ddof
+        self.buf: deque = deque(maxlen=window)
+        self.nobs = 0
+        self.mean = 0.0
+        self.ssq = 0.0
+        self.prev = NAN
+        self.run = 0
+
+    def update(self, x: float) -> float:
+        if len(self.buf) == self.window:
+            old = self.buf[0]
+            if not _isnan(old):
+                self.nobs -= 1
+                if self.nobs:
+                    prev = self.mean
+                    self.mean -= (old - self.mean) / self.nobs
+                    self.ssq -= (old - prev) * (old - self.mean)
+                else:
+                    self.mean = 0.0
+                    self.ssq = 0.0
+        self.buf.append(x)
+        if not _isnan(x):
+            # like pandas, a window of identical values has exactly zero spread
+            self.run = self.run + 1 if x == self.prev else 1
+            self.prev = x
+            self.nobs += 1
+            prev = self.mean
+            self.mean += (x - self.mean) / self.nobs
+            self.ssq += (x - prev) * (x - self.mean)
+        if self.nobs >= self.min_periods and self.nobs > self.ddof:
+            if self.nobs == 1 or self.run >= self.nobs:
+                return 0.0
+            return math.sqrt(max(self.ssq / (self.nobs - self.ddof), 0.0))
+        return NAN
+
+
+class Ewm:
+    """pandas ewm(alpha=..., adjust=False, min_periods=...).mean() recursion."""
+
+    def __init__(self, alpha: float, min_periods: int = 0):
+        self.alpha = alpha
+        self.min_periods = min_periods
+        self.weighted = NAN
+        self.old_wt = 1.0
+        self.nobs = 0
+
+    def update(self, x: float) -> float:
+        obs = not _isnan(x)
+        self.nobs += obs
+        if not _isnan(self.weighted):
+            self.old_wt *= 1.0 - self.alpha
+            if obs:
+                if self.weighted != x:
+                    self.weighted = (self.old_wt * self.weighted + self.alpha * x) / (self.old_wt + self.alpha)
+                self.old_wt = 1.0
+        elif obs:
+            self.weighted = x
+        return self.weighted if self.nobs >= self.min_periods else NAN
+
+
+class TrueRange:
+    """max(high-low, |high-prev_close|, |low-prev_close|), NaNs skipped."""
+
+    def __init__(self):
+        self.prev_close = NAN
+
+    def update(self, h: float, l: float, c: float) -> float:
+        pc = self.prev_close
+        self.prev_close = c
+        tr = NAN
+        for x in (h - l, abs(h - pc), abs(l - pc)):
+            if not _isnan(x) and not x <= tr:
+                tr = x
+        return tr
+
+
+class WilderRsi:
+    """RSI with Wilder smoothing: ewm(alpha=1/period, adjust=False, min_periods=period)."""
+
+    def __init__(self, period: int = 14):
+        self.prev = NAN
+        self.gain = Ewm(1.0 / period, period)
+        self.loss = Ewm(1.0 / period, period)
+
+    def update(self, c: float) -> float:
+        delta = c - self.prev
+        self.prev = c
+        avg_gain = self.gain.update(max(delta, 0.0) if not _isnan(delta) else NAN)
+        avg_loss = self.loss.update(max(-delta, 0.0) if not _isnan(delta) else NAN)
+        if _isnan(avg_gain) or _isnan(avg_loss) or avg_loss == 0.0:
+            return NAN
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        return min(max(rsi, 0.0), 100.0)
+
+
+class Adx:
+    """Wilder +DI / -DI / ADX via ewm(alpha=1/period, adjust=False, min_periods=period)."""
+
+    def __init__(self, period: int = 14):
+        alpha = 1.0 / period
+        self.prev_high = NAN
+        self.prev_low = NAN
+        self.tr = TrueRange()
+        self.tr_sm = Ewm(alpha, period)
+        self.plus_sm = Ewm(alpha, period)
+        self.minus_sm = Ewm(alpha, period)
+        self.adx = Ewm(alpha, period)
+
+    def update(self, h: float, l: float, c: float) -> Tuple[float, float, float]:
+        up_move = h - self.prev_high
+        down_move = self.prev_low - l
+        self.prev_high = h
+        self.prev_low = l
+        plus_dm = up_move if (up_move > down_move and up_move > 0) else 0.0
+        minus_dm = down_move if (down_move > up_move and down_move > 0) else 0.0
+
+        tr_sm = self.tr_sm.update(self.tr.update(h, l, c))
+        plus_sm = self.plus_sm.update(plus_dm)
+        minus_sm = self.minus_sm.update(minus_dm)
+        if tr_sm == 0.0:
+            tr_sm = NAN
+        plus_di = 100.0 * (plus_sm / tr_sm)
+        minus_di = 100.0 * (minus_sm / tr_sm)
+        denom = plus_di + minus_di
+        dx = 100.0 * abs(plus_di - minus_di) / denom if denom != 0.0 else NAN
+        return plus_di, minus_di, self.adx.update(dx)
+
+
+class RollingOls:
+    """
+    OLS of y on window-local time x = 0..window-1, updated in O(1) per bar.
+
+    update(y) returns (slope, fitted value at the newest bar, residual std),
+    the residual std being sqrt(var_y * (1 - r^2)) as in the batch code. Sums are kept relative
+    to an anchor value and rebuilt from the ring buffer every `window` bars,
+    which bounds the drift of the running updates.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self.buf: deque = deque(maxlen=window)
+        self.nan_count = 0
+        self.anchor = NAN
+        self.sy = 0.0
+        self.syy = 0.0
+        self.sxy = 0.0
+        self.since_rebuild = 0
+        w = float(window)
+        self.x_mean = (w - 1.0) / 2.0
+        self.var_x = (w * w - 1.0) / 12.0
+
+    def _rebuild(self) -> None:
+        self.anchor = next((y for y in self.buf if not _isnan(y)), 0.0)
+        self.sy = self.syy = self.sxy = 0.0
+        for x, y in enumerate(self.buf):
+            if not _isnan(y):
+                d = y - self.anchor
+                self.sy += d
+                self.syy += d * d
+                self.sxy += (x - self.x_mean) * d
+        self.since_rebuild = 0
+
+    def update(self, y: float) -> Tuple[float, float, float]:
+        full = len(self.buf) == self.window
+        old = self.buf[0] if full else NAN
+        self.buf.append(y)
+        self.nan_count += int(_isnan(y)) - int(full and _isnan(old))
+        self.since_rebuild += 1
+        if not full or self.nan_count or _isnan(old) or self.since_rebuild >= self.window:
+            self._rebuild()
+        else:
+            d_old = old - self.anchor
+            d_new = y - self.anchor
+            # every remaining point moves one step left in local time
+            self.sxy += self.x_mean * d_old - (self.sy - d_old) + self.x_mean * d_new
+            self.sy += d_new - d_old
+            self.syy += d_new * d_new - d_old * d_old
+        if len(self.buf) < self.window or self.nan_count:
+            return NAN, NAN, NAN
+        w = float(self.window)
+        mean_d = self.sy / w
+        cov = self.sxy / w
+        var_y = self.syy / w - mean_d * mean_d
+        slope = cov / self.var_x
+        fitted = self.anchor + mean_d + slope * (w - 1.0 - self.x_mean)
+        resid_std = math.sqrt(max(var_y - cov * slope, 0.0)) if var_y > 0.0 else NAN
+        return slope, fitted, resid_std
@@ -0,0 +1,53 @@
+"""
+Synthetic OHLCV for tests and benchmarks.
+
+Same generator as Stage 1 of Market_Trader.ipynb, with that notebook's
+parameters as defaults and a fixed seed so runs are reproducible.
+"""
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+def make_consecutive_ohlcv(
+    periods: int,
+    start: str = "2022-01-03 09:30",
+    freq: str = "5min",
+    start_price: float = 100000.0,
+    drift_per_bar: float = 0.0005,   # mean log-return per bar (upward drift)
+    vol_per_bar: float = 0.02,       # std of log-returns per bar (volatility)
+    wick_frac: float = 0.5,          # wick size factor relative to body/volatility
+    vol_min: int = 100,
+    vol_max: int = 5000,
+    seed: Optional[int] = 0,
+) -> pd.DataFrame:
+    """Generate a consecutive OHLCV DataFrame where open[t] == close[t-1]."""
+    rng = np.random.default_rng(seed)
+
+    idx = pd.date_range(start, periods=periods, freq=freq)
+
+    # Price path via log-returns ~ N(drift, vol)
+    rets = rng.normal(loc=drift_per_bar, scale=vol_per_bar, size=periods)
+    close = start_price * np.exp(np.cumsum(rets))
+
+    # Consecutive opens
+    open_ = np.empty(periods, dtype=float)
+    open_[0] = start_price
+    open_[1:] = close[:-1]
+
+    # Wicks based on body and volatility
+    body = np.abs(close - open_)
+    wick_scale = wick_frac * (body + (vol_per_bar * 0.5 * close))
+    up_wick = rng.random(periods) * wick_scale
+    dn_wick = rng.random(periods) * wick_scale
+
+    high = np.maximum(open_, close) + up_wick
+    low = np.clip(np.minimum(open_, close) - dn_wick, 1e-9, None)  # keep prices positive
+
+    volume = rng.integers(low=vol_min, high=vol_max, size=periods)
+
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close, "volume": volume},
+        index=idx,
+    )
@@ -0,0 +1,110 @@
+"""
+Higher-timeframe (HTF) bars built from the base bars, and HTF values
+broadcast back onto the base bars.
+
+    "15m", "1h", "4h"   wall-clock buckets aligned to midnight
+    "1d"                calendar days
+    "1w"                Monday-based calendar weeks
+
+`build_htf_bars` cuts the base index into calendar segments
+(feature_engine.calendar) and reduces each one with the compiled segmented
+first/max/min/last/sum kernels: one O(n) pass per column, no resample or
+groupby. HTF bars are labelled with the timestamp of their first base bar.
+
+`HtfBars.broadcast` maps per-HTF-bar values back to the base bars through
+the segment number of every bar: bar i reads the value of HTF bar
+seg_id[i] - lag, i.e. the last *completed* HTF bar for the default lag=1,
+and NaN before the first one. The HTF bar a base bar belongs to is never
+read (its high, low or close still depend on bars that have not printed),
+so the same values are available live, bar by bar. It is a plain take
+along an index map, with no reindex or alignment.
+
+`htf_feature` runs a whole feature module on HTF bars and broadcasts it the
+same way, so a daily or weekly feature costs a pass over a few hundred
+bars rather than over the base timeframe.
+"""
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from . import calendar
+from .calendar import Segments
+from .context import FeatureContext, FrameLike, as_context
+
+TIMEFRAMES: Dict[str, Callable[[pd.DatetimeIndex], Segments]] = {
+    "15m": lambda index: calendar.bucket_segments(index, 15),
+    "1h": lambda index: calendar.bucket_segments(index, 60),
+    "4h": lambda index: calendar.bucket_segments(index, 240),
+    "1d": calendar.day_segments,
+    "1w": calendar.week_segments,
+}
+
+
+def htf_segments(index: pd.DatetimeIndex, timeframe: str) -> Segments:
+    """Segments of `index` for one of TIMEFRAMES."""
+    if timeframe not in TIMEFRAMES:
+        raise ValueError(f"Unknown timeframe {timeframe!r}; expected one of {sorted(TIMEFRAMES)}.")
+    return TIMEFRAMES[timeframe](index)
+
+
+@dataclass(frozen=True)
+class HtfBars:
+    """
+    OHLCV of one higher timeframe.
+
+    frame:    one row per HTF bar (open/high/low/close/volume), indexed by the
+              timestamp of the bar's first base bar
+    segments: the base-bar segmentation the bars were reduced over
+    """
+    timeframe: str
+    frame: pd.DataFrame
+    segments: Segments
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def source_index(self, lag: int = 1) -> np.ndarray:
+        """HTF bar read by every base bar (seg_id - lag); -1 where there is none."""
+        if lag < 1:
+            raise ValueError("lag must be >= 1: the HTF bar in progress is not complete.")
+        source = self.segments.seg_id - lag
+        source[source < 0] = -1
+        return source
+
+    def broadcast(self, values: Union[np.ndarray, pd.Series], lag: int = 1) -> np.ndarray:
+        """Per-HTF-bar `values` as of the last completed HTF bar (lag=1), per base bar."""
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape[0] != len(self):
+            raise ValueError(f"Expected {len(self)} HTF values, got {values.shape[0]}.")
+        source = self.source_index(lag)
+        out = np.take(values, np.maximum(source, 0)) if values.shape[0] else np.full(source.shape, np.nan)
+        out[source < 0] = np.nan
+        return out
+
+
+def build_htf_bars(df: FrameLike, timeframe: str, segments: Optional[Segments] = None) -> HtfBars:
+    """
+    Reduce the base bars of `df` (DatetimeIndex, OHLC and optionally volume)
+    to `timeframe` bars; NaNs are skipped as in groupby. `segments` may pass
+    a precomputed segmentation of df.index.
+    """
+    g = as_context(df)
+    seg = htf_segments(g.index, timeframe) if segments is None else segments
+    columns = {
+        "open": calendar.seg_first(g.array("open"), seg),
+        "high": calendar.seg_max(g.array("high"), seg),
+        "low": calendar.seg_min(g.array("low"), seg),
+        "close": calendar.seg_last(g.array("close"), seg),
+    }
+    if "volume" in g:
+        columns["volume"] = calendar.seg_sum(g.array("volume"), seg)
+    frame = pd.DataFrame(columns, index=g.index[seg.starts[:-1]])
+    return HtfBars(timeframe, frame, seg)
+
+
+def htf_feature(bars: HtfBars, module, lag: int = 1) -> np.ndarray:
+    """`module.compute_feature` run on the HTF bars, broadcast as of the last completed one."""
+    values = module.compute_feature(FeatureContext(bars.frame))
+    return bars.broadcast(values, lag)
@@ -0,0 +1,250 @@
+"""
+Sliding volume-profile engine (POC / VAL / VAH in one pass).
+
+The window keeps its finite (close, volume) pairs in price order, updated by
+one binary insert and one delete per bar. The weighted histogram over
+[window min, window max] is updated incrementally while the window's extremes
+stay put, and only re-binned when an extreme enters or leaves the window.
+Bin assignment mirrors np.histogram (uniform bins, right edge inclusive).
+
+Results are identical to the per-window np.histogram / np.argsort + np.cumsum
+loop they replace, ties included. The incremental bin sums drift from
+np.histogram's (which adds each bin's weights in bar order) by a bounded
+rounding error; whenever the largest bin is within that bound of another bin,
+or of zero, the histogram is rebuilt in bar order before the argmax, so the
+POC is the bin np.argmax would pick. The value-area cumulative sum runs in
+price order, equal prices in bar order; np.argsort does not order equal
+prices stably, which can change the rounding of the cumulative sum. Windows
+with repeated prices where a cumulative sum falls within that rounding bound
+of a value-area threshold are flagged by the kernel and recomputed with
+np.argsort + np.cumsum.
+"""
+from typing import Tuple
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _bin_index(x, first_edge, last_edge, n_bins):
+    # Same index arithmetic as numpy's uniform-bin fast path
+    step = (last_edge - first_edge) / n_bins
+    idx = int(((x - first_edge) / (last_edge - first_edge)) * n_bins)
+    if idx == n_bins:
+        idx -= 1
+    lo = first_edge + idx * step
+    if x < lo:
+        idx -= 1
+    hi = last_edge if idx + 1 == n_bins else first_edge + (idx + 1) * step
+    if x >= hi and idx != n_bins - 1:
+        idx += 1
+    return idx
+
+
+@njit(cache=True)
+def _rebuild(close, volume, start, stop, pmin, pmax, hist):
+    # np.histogram's sums: each bin's weights added in bar order; returns sum |w|
+    hist[:] = 0.0
+    mass = 0.0
+    for k in range(start, stop):
+        ck = close[k]
+        vk = volume[k]
+        if np.isfinite(ck) and np.isfinite(vk):
+            hist[_bin_index(ck, pmin, pmax, hist.shape[0])] += vk
+            mass += abs(vk)
+    return mass
+
+
+@njit(cache=True)
+def _volume_profile_kernel(close, volume, window, n_bins, q_low, q_high, poc, val, vah, recheck):
+    n = close.shape[0]
+    # price-sorted window of finite pairs; `sidx` keeps the bar index so equal
+    # prices stay in arrival order and deletes hit the right element
+    sp = np.empty(window, np.float64)
+    sw = np.empty(window, np.float64)
+    sidx = np.empty(window, np.int64)
+    m = 0
+    hist = np.zeros(n_bins, np.float64)
+    hist_lo = np.nan
+    hist_hi = np.nan
+    # incremental updates since the last rebuild and the sum of |w| they and
+    # the rebuilt bins touched: bounds the drift from np.histogram's sums
+    age = 0
+    mass = 0.0
+    eps = np.finfo(np.float64).eps
+
+    for i in range(n):
+        x = close[i]
+        w = volume[i]
+        out_i = i - window
+        has_in = np.isfinite(x) and np.isfinite(w)
+        has_out = out_i >= 0 and np.isfinite(close[out_i]) and np.isfinite(volume[out_i])
+
+        if has_out:
+            px = close[out_i]
+            lo, hi = 0, m
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if sp[mid] < px:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            while sidx[lo] != out_i:
+                lo += 1
+            for k in range(lo, m - 1):
+                sp[k] = sp[k + 1]
+                sw[k] = sw[k + 1]
+                sidx[k] = sidx[k + 1]
+            m -= 1
+
+        if has_in:
+            lo, hi = 0, m
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if sp[mid] <= x:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            for k in range(m, lo, -1):
+                sp[k] = sp[k - 1]
+                sw[k] = sw[k - 1]
+                sidx[k] = sidx[k - 1]
+            sp[lo] = x
+            sw[lo] = w
+            sidx[lo] = i
+            m += 1
+
+        if i < window - 1:
+            continue
+
+        # ---- POC: weighted histogram over [min, max] of the window ----
+        if m >= 3 and sp[m - 1] > sp[0]:
+            pmin = sp[0]
+            pmax = sp[m - 1]
+            start = i - window + 1
+            if pmin == hist_lo and pmax == hist_hi and age < window:
+                if has_out:
+                    hist[_bin_index(close[out_i], pmin, pmax, n_bins)] -= volume[out_i]
+                    mass += abs(volume[out_i])
+                    age += 1
+                if has_in:
+                    hist[_bin_index(x, pmin, pmax, n_bins)] += w
+                    mass += abs(w)
+                    age += 1
+            else:
+                mass = _rebuild(close, volume, start, i + 1, pmin, pmax, hist)
+                age = 0
+                hist_lo = pmin
+                hist_hi = pmax
+            j = 0
+            for b in range(n_bins):
+                if hist[b] > hist[j]:
+                    j = b
+            if age > 0:
+                # both these sums and np.histogram's are within window * eps * mass
+                # of the exact ones; a near-tie (or a max near zero) is settled in bar order
+                slack = 4.0 * window * eps * mass
+                near = hist[j] <= slack
+                for b in range(n_bins):
+                    if b != j and hist[b] >= hist[j] - slack:
+                        near = True
+                if near:
+                    mass = _rebuild(close, volume, start, i + 1, pmin, pmax, hist)
+                    age = 0
+                    j = 0
+                    for b in range(n_bins):
+                        if hist[b] > hist[j]:
+                            j = b
+            any_pos = hist[j] > 0.0
+            if any_pos:
+                step = (pmax - pmin) / n_bins
+                left = pmin + j * step
+                right = pmax if j + 1 == n_bins else pmin + (j + 1) * step
+                poc[i] = 0.5 * (left + right)
+        else:
+            hist_lo = np.nan
+            hist_hi = np.nan
+
+        # ---- VAL / VAH: weighted quantiles of close (non-negative weights) ----
+        total = 0.0
+        cnt = 0
+        tied = False
+        last = np.nan
+        for k in range(m):
+            if sw[k] >= 0.0:
+                if sp[k] == last:
+                    tied = True
+                total += sw[k]
+                cnt += 1
+                last = sp[k]
+        if cnt < 3 or total <= 0.0:
+            continue
+        thr_low = q_low * total
+        thr_high = q_high * total
+        # np.argsort may order equal prices differently, which moves the cumsum
+        # (and its total) by up to `slack`; a window with a partial sum that
+        # close to a threshold is recomputed outside (see volume_profile)
+        slack = 4.0 * cnt * eps * total
+        csum = 0.0
+        last = np.nan
+        got_low = False
+        for k in range(m):
+            if sw[k] < 0.0:
+                continue
+            csum += sw[k]
+            last = sp[k]
+            if tied and (abs(csum - thr_low) <= slack or abs(csum - thr_high) <= slack):
+                recheck[i] = True
+            if not got_low and csum >= thr_low:
+                val[i] = sp[k]
+                got_low = True
+            if csum >= thr_high:
+                if np.isnan(vah[i]):
+                    vah[i] = sp[k]
+                if not tied or csum > thr_high + slack:
+                    break
+        if not got_low:
+            val[i] = last
+        if np.isnan(vah[i]):
+            vah[i] = last
+
+
+def _value_area(px: np.ndarray, w: np.ndarray, value_area: Tuple[float, float]) -> Tuple[float, float]:
+    # the per-window formulation: weighted quantiles over np.argsort order
+    m = np.isfinite(px) & np.isfinite(w) & (w >= 0)
+    px = px[m]
+    w = w[m]
+    order = np.argsort(px)
+    px = px[order]
+    csum = np.cumsum(w[order])
+    idx = np.searchsorted(csum, np.multiply(value_area, csum[-1]), side="left")
+    idx = np.clip(idx, 0, len(px) - 1)
+    return float(px[idx[0]]), float(px[idx[1]])
+
+def volume_profile(close: np.ndarray, volume: np.ndarray, window: int = 100, bins: int = 50,
+                   value_area: Tuple[float, float] = (0.15, 0.85)
+                   ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Rolling volume profile over `window` bars.
+
+    Returns (poc, val, vah) float64 arrays:
+      poc: center of the max-volume bin of a `bins`-bin histogram of close
+           over the window's [min, max], weighted by volume
+      val / vah: volume-weighted quantiles of close at value_area[0] / [1]
+    The first window-1 values are NaN, as are windows with fewer than three
+    valid bars or no positive volume.
+    """
+    if window < 1 or bins < 1:
+        raise ValueError("window and bins must be positive.")
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    volume = np.ascontiguousarray(volume, dtype=np.float64)
+    n = close.shape[0]
+    poc = np.full(n, np.nan)
+    val = np.full(n, np.nan)
+    vah = np.full(n, np.nan)
+    recheck = np.zeros(n, np.bool_)
+    _volume_profile_kernel(close, volume, window, bins,
+                           float(value_area[0]), float(value_area[1]), poc, val, vah, recheck)
+    for i in np.flatnonzero(recheck):
+        val[i], vah[i] = _value_area(close[i - window + 1:i + 1], volume[i - window + 1:i + 1], value_area)
+    return poc, val, vah
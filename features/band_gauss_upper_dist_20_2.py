@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: band_gauss_upper_dist_20_2
 FEATURE_CODE = "band_gauss_upper_dist_20_2"
+LOOKBACK = 19
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.indicators import bollinger
+from feature_engine.primitives import rolling_moments
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Gaussian/Bollinger Upper Band Distance (20, 2σ)
     Description:
@@ -18,13 +22,12 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     Input/Output/Constraints:
       Standard; vectorized; no look-ahead.
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    ma20 = g["close"].rolling(20, min_periods=20).mean()
-    sd20 = g["close"].rolling(20, min_periods=20).std(ddof=0)  # population std
-    upper = ma20 + 2.0 * sd20
+    # Bollinger(20, 2) over the shared close moments (population std)
+    bands = bollinger(rolling_moments(g, "close"), (20,), num_std=2.0, ddof=0)
+    upper = pd.Series(bands.upper[:, 0], index=g.index)
 
-    s = (g["close"].astype(float) - upper) / g["close"].astype(float)
+    s = (g["close"] - upper) / g["close"]
     s = s.astype(float); s.name = FEATURE_CODE
     return s
\ No newline at end of file
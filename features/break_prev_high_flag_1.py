@@ -1,10 +1,15 @@
 # JUPYTER CELL — feature: break_prev_high_flag_1
 FEATURE_CODE = "break_prev_high_flag_1"
+LOOKBACK = 1
+OUTPUT_KIND = "flag"  # 0 / 1
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.panel import Panel
+from feature_engine.primitives import candle_column
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Break Previous High Flag (1 bar)
     Description:
@@ -12,11 +17,15 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     Formula / method (brief):
       - Check if close_t > high_{t-1}.
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    prev_high = g["high"].shift(1)
-    flag = (g["close"] > prev_high).astype(int)
+    # fused candle scan: close_t > high_{t-1}
+    flag = candle_column(g, FEATURE_CODE).astype(int)
 
     s = pd.Series(flag, index=g.index, name=FEATURE_CODE)
-    return s
\ No newline at end of file
+    return s
+
+
+def compute_panel(panel: Panel) -> pd.DataFrame:
+    """compute_feature for all symbols at once: (T x S) frame, one column per symbol."""
+    return candle_column(panel, FEATURE_CODE).astype(int)
\ No newline at end of file
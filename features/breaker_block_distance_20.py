@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: breaker_block_distance_20
 FEATURE_CODE = "breaker_block_distance_20"
+LOOKBACK = 20
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_max, rolling_min
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Breaker Block Distance (20)
     Idea:
@@ -14,18 +18,15 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       - If short-term direction is down -> use rolling 20-bar low
       Distance is normalized by close.
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    close = g["close"].astype(float)
-    high = g["high"].astype(float)
-    low = g["low"].astype(float)
+    close = g["close"]
 
     dir_sign = np.sign(close - close.shift(1)).fillna(0.0)
-    rh = high.rolling(20, min_periods=20).max()
-    rl = low.rolling(20, min_periods=20).min()
+    prior_rh = rolling_max(g, "high", 20, shift=1)
+    prior_rl = rolling_min(g, "low", 20, shift=1)
 
-    breaker_level = np.where(dir_sign >= 0, rh.shift(1), rl.shift(1))
+    breaker_level = np.where(dir_sign >= 0, prior_rh, prior_rl)
     breaker_level = pd.Series(breaker_level, index=g.index)
 
     dist = (close - breaker_level) / close.replace(0.0, np.nan)
@@ -1,25 +1,27 @@
 # JUPYTER CELL — feature: breaker_retest_flag_20
 FEATURE_CODE = "breaker_retest_flag_20"
+LOOKBACK = 19
+OUTPUT_KIND = "flag"  # 0 / 1
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_max, rolling_min
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Breaker Retest Flag (20)
     Approximation:
       Flag == 1 when close is near a 20-bar extreme
       (interpreted as a retest of a prior breaker zone).
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    close = g["close"].astype(float)
-    high = g["high"].astype(float)
-    low = g["low"].astype(float)
+    close = g["close"]
 
-    rh = high.rolling(20, min_periods=20).max()
-    rl = low.rolling(20, min_periods=20).min()
+    rh = rolling_max(g, "high", 20)
+    rl = rolling_min(g, "low", 20)
 
     tol = 0.001  # 0.1% tolerance around extremum
     near_high = (np.abs(close - rh) / close.replace(0.0, np.nan)) <= tol
@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: channel_reg_lower_dist_50
 FEATURE_CODE = "channel_reg_lower_dist_50"
+LOOKBACK = 49
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_regression
+from feature_engine.streaming import RollingOls, StreamingFeature, div
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Rolling Regression Channel — Lower Distance (50)
     Description:
@@ -18,31 +22,16 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     Input/Output/Constraints:
       Same as channel_reg_upper_dist_50.
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    y = g["close"].astype(float)
-    n = len(g)
+    y = g["close"]
     W = 50
 
-    t = pd.Series(np.arange(n, dtype=float), index=g.index)
-
-    t_mean = t.rolling(W, min_periods=W).mean()
-    y_mean = y.rolling(W, min_periods=W).mean()
-    ty_mean = (t * y).rolling(W, min_periods=W).mean()
-    t2_mean = (t * t).rolling(W, min_periods=W).mean()
-    y2_mean = (y * y).rolling(W, min_periods=W).mean()
-
-    cov_ty = ty_mean - t_mean * y_mean
-    var_t  = t2_mean - t_mean * t_mean
-    var_y  = y2_mean - y_mean * y_mean
-
-    slope = cov_ty / var_t.replace(0.0, np.nan)
-    intercept = y_mean - slope * t_mean
-    reg_line = slope * t + intercept
-
-    r = cov_ty / (np.sqrt(var_t) * np.sqrt(var_y))
-    resid_std = np.sqrt(np.clip(var_y * (1.0 - r * r), a_min=0.0, a_max=None))
+    # Rolling OLS on window-local time: regression line at the current bar and
+    # residual std ≈ sqrt(var_y * (1 - r^2))
+    ols = rolling_regression(g, "close", W)
+    reg_line = pd.Series(ols.fitted, index=g.index)
+    resid_std = pd.Series(ols.resid_std, index=g.index)
 
     m = 1.0
     lower = reg_line - m * resid_std
@@ -50,4 +39,15 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     s = (y - lower) / y
     s = s.astype(float)
     s.name = FEATURE_CODE
-    return s
\ No newline at end of file
+    return s
+
+
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+
+    def reset(self) -> None:
+        self.ols = RollingOls(50)
+
+    def step(self, o, h, l, c, v) -> float:
+        _, reg_line, resid_std = self.ols.update(c)
+        return div(c - (reg_line - 1.0 * resid_std), c)
\ No newline at end of file
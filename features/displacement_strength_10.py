@@ -1,28 +1,27 @@
 # JUPYTER CELL — feature: displacement_strength_10
 FEATURE_CODE = "displacement_strength_10"
+LOOKBACK = 10
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.panel import Panel
+from feature_engine.primitives import candle_column
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Displacement Strength (10)
     Idea:
       Measures impulsiveness of price move vs average volatility:
       strength = |close - close[-1]| / ATR(10)
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    c = g["close"].astype(float)
-    h = g["high"].astype(float)
-    l = g["low"].astype(float)
-    prev_c = c.shift(1)
+    # fused candle scan (true range NaN wherever a leg is, e.g. the first bar)
+    s = candle_column(g, FEATURE_CODE)
+    return s
 
-    tr = (h - l).combine((h - prev_c).abs(), np.maximum).combine((l - prev_c).abs(), np.maximum)
-    atr = tr.rolling(10, min_periods=1).mean().replace(0.0, np.nan)
 
-    s = (c - prev_c).abs() / atr
-    s = s.astype(float)
-    s.name = FEATURE_CODE
-    return s
\ No newline at end of file
+def compute_panel(panel: Panel) -> pd.DataFrame:
+    """compute_feature for all symbols at once: (T x S) frame, one column per symbol."""
+    return candle_column(panel, FEATURE_CODE)
\ No newline at end of file
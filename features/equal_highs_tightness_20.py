@@ -1,26 +1,43 @@
 # JUPYTER CELL — feature: equal_highs_tightness_20
 FEATURE_CODE = "equal_highs_tightness_20"
+LOOKBACK = 19
+PARAM_GRID = {"window": (10, 20, 50, 100, 200)}
+VARIANT_CODE = "equal_highs_tightness_{window}"
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.panel import Panel
+from feature_engine.primitives import rolling_max, rolling_min
+
+def variant_lookback(window: int) -> int:
+    return window - 1
+
+
+def compute_feature(df: FrameLike, window: int = 20) -> pd.Series:
     """
     Equal Highs Tightness (20)
     Measures how tight 20-bar highs are:
       tightness = (max_high_20 - min_high_20) / close
       Lower values = tighter equal-highs zone.
+    window: number of bars (grid: PARAM_GRID; 20 is this code).
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    h = g["high"].astype(float)
-    c = g["close"].astype(float)
+    c = g["close"]
 
-    max_h = h.rolling(20, min_periods=5).max()
-    min_h = h.rolling(20, min_periods=5).min()
+    max_h = rolling_max(g, "high", window, min_periods=5)
+    min_h = rolling_min(g, "high", window, min_periods=5)
 
     tightness = (max_h - min_h) / c.replace(0.0, np.nan)
     s = tightness.astype(float)
     s.name = FEATURE_CODE
-    return s
\ No newline at end of file
+    return s
+
+
+def compute_panel(panel: Panel, window: int = 20) -> pd.DataFrame:
+    """compute_feature for all symbols at once: (T x S) frame, one column per symbol."""
+    max_h = rolling_max(panel, "high", window, min_periods=5)
+    min_h = rolling_min(panel, "high", window, min_periods=5)
+    return (max_h - min_h) / panel["close"].replace(0.0, np.nan)
\ No newline at end of file
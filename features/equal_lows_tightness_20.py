@@ -1,26 +1,36 @@
 # JUPYTER CELL — feature: equal_lows_tightness_20
 FEATURE_CODE = "equal_lows_tightness_20"
+LOOKBACK = 19
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.panel import Panel
+from feature_engine.primitives import rolling_max, rolling_min
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Equal Lows Tightness (20)
     Same idea as highs, for lows:
       tightness = (max_low_20 - min_low_20) / close
       Lower values = tighter support zone.
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    l = g["low"].astype(float)
-    c = g["close"].astype(float)
+    c = g["close"]
 
-    max_l = l.rolling(20, min_periods=5).max()
-    min_l = l.rolling(20, min_periods=5).min()
+    max_l = rolling_max(g, "low", 20, min_periods=5)
+    min_l = rolling_min(g, "low", 20, min_periods=5)
 
     tightness = (max_l - min_l) / c.replace(0.0, np.nan)
     s = tightness.astype(float)
     s.name = FEATURE_CODE
-    return s
\ No newline at end of file
+    return s
+
+
+def compute_panel(panel: Panel) -> pd.DataFrame:
+    """compute_feature for all symbols at once: (T x S) frame, one column per symbol."""
+    max_l = rolling_max(panel, "low", 20, min_periods=5)
+    min_l = rolling_min(panel, "low", 20, min_periods=5)
+    return (max_l - min_l) / panel["close"].replace(0.0, np.nan)
\ No newline at end of file
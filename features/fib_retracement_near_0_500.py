@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: fib_retracement_near_0_500
 FEATURE_CODE = "fib_retracement_near_0_500"
+LOOKBACK = 1
+OUTPUT_KIND = "flag"  # 0 / 1
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_max, rolling_min
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Fibonacci Retracement Near 0.500
     Description:
@@ -14,11 +18,10 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       fib_0_500 = (high - low) * 0.500 + low
       flag = 1 if abs(close - fib_0_500) / close <= ε else 0
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    high = g["high"].rolling(2, min_periods=2).max()
-    low = g["low"].rolling(2, min_periods=2).min()
+    high = rolling_max(g, "high", 2)
+    low = rolling_min(g, "low", 2)
 
     fib_0_500 = (high - low) * 0.500 + low
 
@@ -1,24 +1,35 @@
 # JUPYTER CELL — feature: filt_dema_20
 FEATURE_CODE = "filt_dema_20"
+LOOKBACK = 1000  # EWM warm-up; the dropped history weighs < 1e-30
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.filters import dema
+from feature_engine.streaming import Ewm, StreamingFeature
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Double EMA Filter (20)
     DEMA(20) = 2 * EMA(20) - EMA(EMA(20))
     Causal, no look-ahead smoothing of close.
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
-
-    c = g["close"].astype(float)
+    g = as_context(df)
 
-    ema1 = c.ewm(span=20, adjust=False).mean()
-    ema2 = ema1.ewm(span=20, adjust=False).mean()
-    dema = 2.0 * ema1 - ema2
+    c = g["close"]
 
-    s = dema.astype(float)
+    s = pd.Series(dema(c.to_numpy(), 20), index=g.index)
     s.name = FEATURE_CODE
-    return s
\ No newline at end of file
+    return s
+
+
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+
+    def reset(self) -> None:
+        alpha = 2.0 / (20 + 1.0)
+        self.ema1, self.ema2 = Ewm(alpha), Ewm(alpha)
+
+    def step(self, o, h, l, c, v) -> float:
+        ema1 = self.ema1.update(c)
+        return 2.0 * ema1 - self.ema2.update(ema1)
\ No newline at end of file
@@ -1,34 +1,23 @@
 # JUPYTER CELL — feature: filt_gauss_close_20
 FEATURE_CODE = "filt_gauss_close_20"
+LOOKBACK = 19
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.filters import apply_filter, gaussian
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Gaussian Weighted Moving Average (20, causal)
     Uses a backward-looking Gaussian kernel of length 20 on closes.
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
-    c = g["close"].astype(float)
-
-    window = 20
-    idx = np.arange(window)
-    # center at current bar (0) and decay into the past
-    sigma = window / 4.0
-    weights = np.exp(-0.5 * (idx / sigma) ** 2)
-    weights = weights[::-1]  # bigger weight on most recent
-    weights /= weights.sum()
-
-    def gauss(x: np.ndarray) -> float:
-        if len(x) < window:
-            w = weights[-len(x):]
-        else:
-            w = weights
-        return float(np.sum(x * w))
+    g = as_context(df)
+    c = g["close"]
 
-    s = c.rolling(window, min_periods=3).apply(gauss, raw=True)
+    # sigma = window/4, weights reversed (newest heaviest) and normalized;
+    # warm-up bars use the newest len(x) weights, min_periods=3
+    s = pd.Series(apply_filter(c.to_numpy(), gaussian(20)), index=g.index)
     s = s.astype(float)
     s.name = FEATURE_CODE
     return s
\ No newline at end of file
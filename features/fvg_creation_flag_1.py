@@ -1,10 +1,15 @@
 # JUPYTER CELL — feature: fvg_creation_flag_1
 FEATURE_CODE = "fvg_creation_flag_1"
+LOOKBACK = 1
+OUTPUT_KIND = "flag"  # 0 / 1
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.panel import Panel
+from feature_engine.primitives import candle_column
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Fair Value Gap Creation Flag (1 bar)
     Description:
@@ -12,15 +17,15 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     Formula / method (brief):
       - A gap is formed when the open price is significantly different from the close price.
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    price_gap = abs(g["open"] - g["close"].shift(1))
+    # fused candle scan: abs(open_t - close_{t-1}) > 0.01
+    fvg_flag = candle_column(g, FEATURE_CODE).astype(int)
 
-    # Set threshold for large gap (FVG), e.g., 0.01 or any custom logic
-    threshold = 0.01
+    s = pd.Series(fvg_flag, index=g.index, name=FEATURE_CODE)
+    return s
 
-    fvg_flag = (price_gap > threshold).astype(int)
 
-    s = pd.Series(fvg_flag, index=g.index, name=FEATURE_CODE)
-    return s
\ No newline at end of file
+def compute_panel(panel: Panel) -> pd.DataFrame:
+    """compute_feature for all symbols at once: (T x S) frame, one column per symbol."""
+    return candle_column(panel, FEATURE_CODE).astype(int)
\ No newline at end of file
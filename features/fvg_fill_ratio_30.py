@@ -1,10 +1,16 @@
 # JUPYTER CELL — feature: fvg_fill_ratio_30
 FEATURE_CODE = "fvg_fill_ratio_30"
+LOOKBACK = None  # stateful: carried across chunks by FeatureStream
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from numba import njit
+
+from feature_engine.context import FrameLike, as_context
+from feature_engine.scanner import Scanner, ScannerStream
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     FVG Fill Ratio (30-bar lifetime, single active gap)
 
@@ -37,82 +43,84 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
         fill_ratio_t in [0, 1] for the currently tracked FVG up to time t.
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
-
-    high = g["high"].astype(float).values
-    low  = g["low"].astype(float).values
-
-    n = len(g)
-
-    fill_ratio = np.zeros(n, dtype=float)
-
-    current_gap_low = np.nan
-    current_gap_high = np.nan
-    covered_low = np.nan
-    covered_high = np.nan
-    gap_start_idx = None
-    max_lifetime = 30
-
-    for i in range(n):
-        h = high[i]
-        l = low[i]
-
-        # 1) If there is an active gap, update fill
-        if not np.isnan(current_gap_low):
-            # Overlap between current candle and gap
-            overlap_low = max(l, current_gap_low)
-            overlap_high = min(h, current_gap_high)
-
-            if overlap_high > overlap_low:
-                if np.isnan(covered_low):
-                    covered_low = overlap_low
-                    covered_high = overlap_high
-                else:
-                    covered_low = min(covered_low, overlap_low)
-                    covered_high = max(covered_high, overlap_high)
-
-            gap_size = current_gap_high - current_gap_low
-            if gap_size > 0:
-                if np.isnan(covered_low):
-                    covered_size = 0.0
-                else:
-                    covered_size = max(0.0, covered_high - covered_low)
-                fill_ratio[i] = covered_size / gap_size
-            else:
-                fill_ratio[i] = 0.0
-
-            # Expire if fully filled or too old
-            if gap_start_idx is not None:
-                if (gap_size <= 0) or (covered_size >= gap_size) or (i - gap_start_idx >= max_lifetime):
-                    current_gap_low = np.nan
-                    current_gap_high = np.nan
-                    covered_low = np.nan
-                    covered_high = np.nan
-                    gap_start_idx = None
-
-        # 2) If no active gap, check for a new FVG at this bar
-        if np.isnan(current_gap_low) and i >= 2:
-            h_2 = high[i - 2]
-            l_2 = low[i - 2]
-
-            # Bullish FVG (gap above bar n-2)
-            if l > h_2:
-                current_gap_low = h_2
-                current_gap_high = l
-                gap_start_idx = i
-                covered_low = np.nan
-                covered_high = np.nan
-
-            # Bearish FVG (gap below bar n-2)
-            elif h < l_2:
-                current_gap_low = h
-                current_gap_high = l_2
-                gap_start_idx = i
-                covered_low = np.nan
-                covered_high = np.nan
-
-        # If no gap, fill_ratio[i] stays as previous (default 0.0)
+    g = as_context(df)
+
+    fill_ratio = FVG_FILL.run(g)
 
     s = pd.Series(fill_ratio, index=g.index, name=FEATURE_CODE)
-    return s
\ No newline at end of file
+    return s
+
+
+# Scanner state slots; the last two bars' high/low are kept for the 3-bar pattern
+GAP_LOW, GAP_HIGH, COVERED_LOW, COVERED_HIGH, GAP_START = range(5)
+BAR, HIGH_1, LOW_1, HIGH_2, LOW_2 = range(5, 10)
+MAX_LIFETIME = 30
+
+
+@njit(cache=True)
+def _fvg_fill_step(st, o, h, l, c, v):
+    i = st[BAR]
+    fill_ratio = 0.0  # no active gap
+
+    # 1) If there is an active gap, update fill
+    if not np.isnan(st[GAP_LOW]):
+        # Overlap between current candle and gap (NaN bars give no overlap)
+        overlap_low = st[GAP_LOW] if st[GAP_LOW] > l else l
+        overlap_high = st[GAP_HIGH] if st[GAP_HIGH] < h else h
+
+        if overlap_high > overlap_low:
+            if np.isnan(st[COVERED_LOW]):
+                st[COVERED_LOW] = overlap_low
+                st[COVERED_HIGH] = overlap_high
+            else:
+                st[COVERED_LOW] = min(st[COVERED_LOW], overlap_low)
+                st[COVERED_HIGH] = max(st[COVERED_HIGH], overlap_high)
+
+        gap_size = st[GAP_HIGH] - st[GAP_LOW]
+        covered_size = 0.0
+        if gap_size > 0:
+            if not np.isnan(st[COVERED_LOW]):
+                covered_size = max(0.0, st[COVERED_HIGH] - st[COVERED_LOW])
+            fill_ratio = covered_size / gap_size
+
+        # Expire if fully filled or too old
+        if (gap_size <= 0) or (covered_size >= gap_size) or (i - st[GAP_START] >= MAX_LIFETIME):
+            for k in (GAP_LOW, GAP_HIGH, COVERED_LOW, COVERED_HIGH, GAP_START):
+                st[k] = np.nan
+
+    # 2) If no active gap, check for a new FVG at this bar
+    if np.isnan(st[GAP_LOW]) and i >= 2:
+        h_2 = st[HIGH_2]
+        l_2 = st[LOW_2]
+
+        # Bullish FVG (gap above bar n-2)
+        if l > h_2:
+            st[GAP_LOW] = h_2
+            st[GAP_HIGH] = l
+            st[GAP_START] = i
+
+        # Bearish FVG (gap below bar n-2)
+        elif h < l_2:
+            st[GAP_LOW] = h
+            st[GAP_HIGH] = l_2
+            st[GAP_START] = i
+
+    st[HIGH_2] = st[HIGH_1]
+    st[LOW_2] = st[LOW_1]
+    st[HIGH_1] = h
+    st[LOW_1] = l
+    st[BAR] = i + 1
+    return fill_ratio
+
+
+FVG_FILL = Scanner(
+    ("gap_low", "gap_high", "covered_low", "covered_high", "gap_start",
+     "bar", "high_1", "low_1", "high_2", "low_2"),
+    _fvg_fill_step,
+    initial={"bar": 0.0},
+)
+
+
+class FeatureStream(ScannerStream):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+    scanner = FVG_FILL
\ No newline at end of file
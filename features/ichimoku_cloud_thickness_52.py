@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: ichimoku_cloud_thickness_52
 FEATURE_CODE = "ichimoku_cloud_thickness_52"
+LOOKBACK = 51
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_max, rolling_min
+from feature_engine.streaming import RollingMax, RollingMin, StreamingFeature, div
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Ichimoku Cloud Thickness (lag-aligned, 52)
     Description:
@@ -16,23 +20,38 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       tenkan(9), kijun(26), spanA=(tenkan+kijun)/2; spanB=(hi52+lo52)/2
       thickness = abs(spanA - spanB)/close
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    hi9  = g["high"].rolling(9,  min_periods=9 ).max()
-    lo9  = g["low"] .rolling(9,  min_periods=9 ).min()
+    hi9  = rolling_max(g, "high", 9)
+    lo9  = rolling_min(g, "low", 9)
     tenk = (hi9 + lo9) / 2.0
 
-    hi26 = g["high"].rolling(26, min_periods=26).max()
-    lo26 = g["low"] .rolling(26, min_periods=26).min()
+    hi26 = rolling_max(g, "high", 26)
+    lo26 = rolling_min(g, "low", 26)
     kij  = (hi26 + lo26) / 2.0
 
     span_a = (tenk + kij) / 2.0
-    hi52 = g["high"].rolling(52, min_periods=52).max()
-    lo52 = g["low"] .rolling(52, min_periods=52).min()
+    hi52 = rolling_max(g, "high", 52)
+    lo52 = rolling_min(g, "low", 52)
     span_b = (hi52 + lo52) / 2.0
 
-    thickness = (span_a - span_b).abs() / g["close"].astype(float)
+    thickness = (span_a - span_b).abs() / g["close"]
     thickness = thickness.astype(float)
     thickness.name = FEATURE_CODE
-    return thickness
\ No newline at end of file
+    return thickness
+
+
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+
+    def reset(self) -> None:
+        self.hi9, self.lo9 = RollingMax(9), RollingMin(9)
+        self.hi26, self.lo26 = RollingMax(26), RollingMin(26)
+        self.hi52, self.lo52 = RollingMax(52), RollingMin(52)
+
+    def step(self, o, h, l, c, v) -> float:
+        tenk = (self.hi9.update(h) + self.lo9.update(l)) / 2.0
+        kij = (self.hi26.update(h) + self.lo26.update(l)) / 2.0
+        span_a = (tenk + kij) / 2.0
+        span_b = (self.hi52.update(h) + self.lo52.update(l)) / 2.0
+        return div(abs(span_a - span_b), c)
\ No newline at end of file
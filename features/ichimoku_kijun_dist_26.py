@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: ichimoku_kijun_dist_26
 FEATURE_CODE = "ichimoku_kijun_dist_26"
+LOOKBACK = 25
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_max, rolling_min
+from feature_engine.streaming import RollingMax, RollingMin, StreamingFeature, div
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Ichimoku Kijun Distance (26)
     Description:
@@ -15,13 +19,23 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       kijun = (hi26 + lo26)/2
       dist = (close - kijun)/close
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    hi26 = g["high"].rolling(26, min_periods=26).max()
-    lo26 = g["low"].rolling(26, min_periods=26).min()
+    hi26 = rolling_max(g, "high", 26)
+    lo26 = rolling_min(g, "low", 26)
     kijun = (hi26 + lo26) / 2.0
 
-    s = (g["close"].astype(float) - kijun) / g["close"].astype(float)
+    s = (g["close"] - kijun) / g["close"]
     s = s.astype(float); s.name = FEATURE_CODE
-    return s
\ No newline at end of file
+    return s
+
+
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+
+    def reset(self) -> None:
+        self.hi26, self.lo26 = RollingMax(26), RollingMin(26)
+
+    def step(self, o, h, l, c, v) -> float:
+        kijun = (self.hi26.update(h) + self.lo26.update(l)) / 2.0
+        return div(c - kijun, c)
\ No newline at end of file
@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: ichimoku_span_a_dist_52
 FEATURE_CODE = "ichimoku_span_a_dist_52"
+LOOKBACK = 25
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_max, rolling_min
+from feature_engine.streaming import RollingMax, RollingMin, StreamingFeature, div
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Ichimoku Senkou Span A Distance (lag-aligned)
     Description:
@@ -18,18 +22,31 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       spanA_unshifted = (tenkan + kijun)/2
       dist = (close - spanA_unshifted)/close
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    hi9  = g["high"].rolling(9,  min_periods=9 ).max()
-    lo9  = g["low"] .rolling(9,  min_periods=9 ).min()
+    hi9  = rolling_max(g, "high", 9)
+    lo9  = rolling_min(g, "low", 9)
     tenk = (hi9 + lo9) / 2.0
 
-    hi26 = g["high"].rolling(26, min_periods=26).max()
-    lo26 = g["low"] .rolling(26, min_periods=26).min()
+    hi26 = rolling_max(g, "high", 26)
+    lo26 = rolling_min(g, "low", 26)
     kij  = (hi26 + lo26) / 2.0
 
     span_a = (tenk + kij) / 2.0  # lag-aligned (no forward shift)
-    s = (g["close"].astype(float) - span_a) / g["close"].astype(float)
+    s = (g["close"] - span_a) / g["close"]
     s = s.astype(float); s.name = FEATURE_CODE
-    return s
\ No newline at end of file
+    return s
+
+
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+
+    def reset(self) -> None:
+        self.hi9, self.lo9 = RollingMax(9), RollingMin(9)
+        self.hi26, self.lo26 = RollingMax(26), RollingMin(26)
+
+    def step(self, o, h, l, c, v) -> float:
+        tenk = (self.hi9.update(h) + self.lo9.update(l)) / 2.0
+        kij = (self.hi26.update(h) + self.lo26.update(l)) / 2.0
+        span_a = (tenk + kij) / 2.0
+        return div(c - span_a, c)
\ No newline at end of file
@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: ichimoku_span_b_dist_52
 FEATURE_CODE = "ichimoku_span_b_dist_52"
+LOOKBACK = 51
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_max, rolling_min
+from feature_engine.streaming import RollingMax, RollingMin, StreamingFeature, div
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Ichimoku Senkou Span B Distance (lag-aligned, 52)
     Description:
@@ -17,13 +21,23 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       spanB_unshifted = (hi52 + lo52)/2
       dist = (close - spanB_unshifted)/close
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    hi52 = g["high"].rolling(52, min_periods=52).max()
-    lo52 = g["low"] .rolling(52, min_periods=52).min()
+    hi52 = rolling_max(g, "high", 52)
+    lo52 = rolling_min(g, "low", 52)
     span_b = (hi52 + lo52) / 2.0
 
-    s = (g["close"].astype(float) - span_b) / g["close"].astype(float)
+    s = (g["close"] - span_b) / g["close"]
     s = s.astype(float); s.name = FEATURE_CODE
-    return s
\ No newline at end of file
+    return s
+
+
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+
+    def reset(self) -> None:
+        self.hi52, self.lo52 = RollingMax(52), RollingMin(52)
+
+    def step(self, o, h, l, c, v) -> float:
+        span_b = (self.hi52.update(h) + self.lo52.update(l)) / 2.0
+        return div(c - span_b, c)
\ No newline at end of file
@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: ichimoku_tenkan_dist_9
 FEATURE_CODE = "ichimoku_tenkan_dist_9"
+LOOKBACK = 8
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_max, rolling_min
+from feature_engine.streaming import RollingMax, RollingMin, StreamingFeature, div
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Ichimoku Tenkan Distance (9)
     Description:
@@ -17,13 +21,23 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     Input/Output/Constraints:
       Standard; no look-ahead; vectorized.
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    hi9 = g["high"].rolling(9, min_periods=9).max()
-    lo9 = g["low"].rolling(9, min_periods=9).min()
+    hi9 = rolling_max(g, "high", 9)
+    lo9 = rolling_min(g, "low", 9)
     tenkan = (hi9 + lo9) / 2.0
 
-    s = (g["close"].astype(float) - tenkan) / g["close"].astype(float)
+    s = (g["close"] - tenkan) / g["close"]
     s = s.astype(float); s.name = FEATURE_CODE
-    return s
\ No newline at end of file
+    return s
+
+
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+
+    def reset(self) -> None:
+        self.hi9, self.lo9 = RollingMax(9), RollingMin(9)
+
+    def step(self, o, h, l, c, v) -> float:
+        tenkan = (self.hi9.update(h) + self.lo9.update(l)) / 2.0
+        return div(c - tenkan, c)
\ No newline at end of file
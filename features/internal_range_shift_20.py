@@ -1,25 +1,26 @@
 # JUPYTER CELL — feature: internal_range_shift_20
 FEATURE_CODE = "internal_range_shift_20"
+LOOKBACK = 20
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_max, rolling_min
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Internal Range Shift (20)
     Position of close inside 20-bar range, differenced:
       pos_t = (close - low20) / (high20 - low20)
       shift = pos_t - pos_{t-1}
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    c = g["close"].astype(float)
-    h = g["high"].astype(float)
-    l = g["low"].astype(float)
+    c = g["close"]
 
-    hi20 = h.rolling(20, min_periods=5).max()
-    lo20 = l.rolling(20, min_periods=5).min()
+    hi20 = rolling_max(g, "high", 20, min_periods=5)
+    lo20 = rolling_min(g, "low", 20, min_periods=5)
     rng = (hi20 - lo20).replace(0.0, np.nan)
 
     pos = (c - lo20) / rng
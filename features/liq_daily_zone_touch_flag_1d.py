@@ -1,25 +1,36 @@
 # JUPYTER CELL — feature: liq_daily_zone_touch_flag_1d
 FEATURE_CODE = "liq_daily_zone_touch_flag_1d"
+LOOKBACK = "1D"
+OUTPUT_KIND = "flag"  # 0 / 1
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.calendar import seg_max, seg_min
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import calendar_segments
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Liquidity Zone Daily Touch Flag (1d)
     Description:
       Flags 1 if the close touches the liquidity zone (high-low range) of the prior day.
       Proximity is determined within a small range (ε = 0.01).
+    Requirements:
+      Index must be a DatetimeIndex (calendar days / Monday-based weeks, wall-clock).
     Formula / method (brief):
       daily_high = high of previous day
       daily_low = low of previous day
       flag = 1 if close_t is between (daily_low - ε) and (daily_high + ε)
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
+
+    if not isinstance(g.index, pd.DatetimeIndex):
+        raise ValueError("liq_daily_zone_touch_flag_1d requires a DatetimeIndex.")
 
-    high_prev = g["high"].shift(1)
-    low_prev = g["low"].shift(1)
+    # Prior completed calendar day's high/low, broadcast to every bar of the current day
+    days = calendar_segments(g, "D")
+    high_prev = days.broadcast(days.shift(seg_max(g["high"], days)))
+    low_prev = days.broadcast(days.shift(seg_min(g["low"], days)))
 
     epsilon = 0.01  # proximity range
     flag = ((g["close"] >= low_prev - epsilon) & (g["close"] <= high_prev + epsilon)).astype(int)
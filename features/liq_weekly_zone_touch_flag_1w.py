@@ -1,25 +1,36 @@
 # JUPYTER CELL — feature: liq_weekly_zone_touch_flag_1w
 FEATURE_CODE = "liq_weekly_zone_touch_flag_1w"
+LOOKBACK = "1W"
+OUTPUT_KIND = "flag"  # 0 / 1
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.calendar import seg_max, seg_min
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import calendar_segments
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Liquidity Zone Weekly Touch Flag (1w)
     Description:
       Flags 1 if the close touches the liquidity zone (high-low range) of the prior week.
       Proximity is determined within a small range (ε = 0.01).
+    Requirements:
+      Index must be a DatetimeIndex (calendar days / Monday-based weeks, wall-clock).
     Formula / method (brief):
       weekly_high = high of previous week
       weekly_low = low of previous week
       flag = 1 if close_t is between (weekly_low - ε) and (weekly_high + ε)
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
+
+    if not isinstance(g.index, pd.DatetimeIndex):
+        raise ValueError("liq_weekly_zone_touch_flag_1w requires a DatetimeIndex.")
 
-    high_prev = g["high"].shift(5)  # Assumes 5 trading days per week
-    low_prev = g["low"].shift(5)  # Assumes 5 trading days per week
+    # Prior completed calendar week's high/low, broadcast to every bar of the current week
+    weeks = calendar_segments(g, "W")
+    high_prev = weeks.broadcast(weeks.shift(seg_max(g["high"], weeks)))
+    low_prev = weeks.broadcast(weeks.shift(seg_min(g["low"], weeks)))
 
     epsilon = 0.01  # proximity range
     flag = ((g["close"] >= low_prev - epsilon) & (g["close"] <= high_prev + epsilon)).astype(int)
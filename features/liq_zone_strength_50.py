@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: liq_zone_strength_50
 FEATURE_CODE = "liq_zone_strength_50"
+LOOKBACK = 49
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.moments import RollingMoments
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Liquidity Zone Strength (50)
     Description:
@@ -13,14 +17,16 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     Formula / method (brief):
       - liquidity_strength = sum(volume within range) / (high - low) over the last 50 bars
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
     high = g["high"]
     low = g["low"]
     volume = g["volume"]
 
-    liquidity_strength = (volume * (high - low)).rolling(50, min_periods=50).sum() / (high - low).rolling(50, min_periods=50).sum()
+    bar_range = high - low
+    # numerator and denominator sums from one prefix pass over an (n, 2) matrix
+    sums = RollingMoments(np.column_stack([volume * bar_range, bar_range])).sum(50)
+    liquidity_strength = pd.Series(sums[:, 0] / sums[:, 1], index=g.index)
 
     s = liquidity_strength.astype(float)
     s.name = FEATURE_CODE
@@ -1,10 +1,15 @@
 # JUPYTER CELL — feature: liq_zone_touch_flag_50
 FEATURE_CODE = "liq_zone_touch_flag_50"
+LOOKBACK = 49
+OUTPUT_KIND = "flag"  # 0 / 1
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_max, rolling_min
+from feature_engine.streaming import RollingMax, RollingMin, StreamingFeature
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Liquidity Zone Touch Flag (50)
     Description:
@@ -14,17 +19,27 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       liquidity_zone = high-low for the last 50 bars
       flag = 1 if close_t is within liquidity_zone (+ε) and (-ε)
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
-
-    high = g["high"]
-    low = g["low"]
+    g = as_context(df)
 
-    liquidity_zone_high = high.rolling(50, min_periods=50).max()
-    liquidity_zone_low = low.rolling(50, min_periods=50).min()
+    liquidity_zone_high = rolling_max(g, "high", 50)
+    liquidity_zone_low = rolling_min(g, "low", 50)
 
     epsilon = 0.01  # proximity range
     flag = ((g["close"] >= liquidity_zone_low - epsilon) & (g["close"] <= liquidity_zone_high + epsilon)).astype(int)
 
     s = pd.Series(flag, index=g.index, name=FEATURE_CODE)
-    return s
\ No newline at end of file
+    return s
+
+
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+
+    def reset(self) -> None:
+        self.hh = RollingMax(50)
+        self.ll = RollingMin(50)
+
+    def step(self, o, h, l, c, v) -> float:
+        zone_high = self.hh.update(h)
+        zone_low = self.ll.update(l)
+        epsilon = 0.01
+        return float(zone_low - epsilon <= c <= zone_high + epsilon)
\ No newline at end of file
@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: liquidity_grab_efficiency_10
 FEATURE_CODE = "liquidity_grab_efficiency_10"
+LOOKBACK = 10
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import candle_column
+from feature_engine.streaming import RollingMax, RollingMin, StreamingFeature
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Liquidity Grab Efficiency (10-bar lookback)
 
@@ -20,36 +24,33 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       Zero means no liquidity grab or no efficiency.
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
-
-    high = g["high"].astype(float)
-    low = g["low"].astype(float)
-    close = g["close"].astype(float)
-    open_ = g["open"].astype(float)
-
-    lookback = 10
-
-    # Prior N-bar extremes (shifted to avoid using current bar)
-    prior_high = high.rolling(lookback, min_periods=lookback).max().shift(1)
-    prior_low  = low .rolling(lookback, min_periods=lookback).min().shift(1)
+    g = as_context(df)
 
-    # Conditions for sweeps
-    up_grab   = (high > prior_high) & (close < prior_high)
-    down_grab = (low  < prior_low ) & (close > prior_low)
+    # fused candle scan: prior 10-bar extremes, wick / range, nan_to_num
+    eff = candle_column(g, FEATURE_CODE)
 
-    # Candle range
-    tr = (high - low).replace(0.0, np.nan)
+    return pd.Series(eff, index=g.index, name=FEATURE_CODE)
 
-    upper_body = np.maximum(open_, close)
-    lower_body = np.minimum(open_, close)
 
-    wick_above = (high - upper_body).clip(lower=0.0)
-    wick_below = (lower_body - low).clip(lower=0.0)
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
 
-    eff_up   = np.where(up_grab,   wick_above / tr, 0.0)
-    eff_down = np.where(down_grab, wick_below / tr, 0.0)
+    def reset(self) -> None:
+        self.hh = RollingMax(10)
+        self.ll = RollingMin(10)
+        self.prior_high = self.prior_low = float("nan")
 
-    eff = np.nan_to_num(eff_up + eff_down)
+    def step(self, o, h, l, c, v) -> float:
+        prior_high, prior_low = self.prior_high, self.prior_low
+        self.prior_high = self.hh.update(h)
+        self.prior_low = self.ll.update(l)
 
-    return pd.Series(eff, index=g.index, name=FEATURE_CODE)
\ No newline at end of file
+        tr = h - l
+        if not tr:
+            return 0.0
+        eff = 0.0
+        if h > prior_high and c < prior_high:
+            eff += max(h - max(o, c), 0.0) / tr
+        if l < prior_low and c > prior_low:
+            eff += max(min(o, c) - l, 0.0) / tr
+        return eff if eff == eff else 0.0
\ No newline at end of file
@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: liquidity_rebuild_speed_20
 FEATURE_CODE = "liquidity_rebuild_speed_20"
+LOOKBACK = 24
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_max, rolling_min
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Liquidity Rebuild Speed (20-bar window)
 
@@ -21,18 +25,15 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       Positive values → price is reverting back toward liquidity zones.
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    high = g["high"].astype(float)
-    low = g["low"].astype(float)
-    close = g["close"].astype(float)
+    close = g["close"]
 
     win = 20
     lag = 5
 
-    high20 = high.rolling(win).max()
-    low20  = low .rolling(win).min()
+    high20 = rolling_max(g, "high", win)
+    low20  = rolling_min(g, "low", win)
     mid20  = (high20 + low20) / 2
     range20 = (high20 - low20).replace(0.0, np.nan)
 
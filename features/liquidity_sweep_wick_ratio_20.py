@@ -1,10 +1,24 @@
 # JUPYTER CELL — feature: liquidity_sweep_wick_ratio_20
 FEATURE_CODE = "liquidity_sweep_wick_ratio_20"
+LOOKBACK = 20
+PARAM_GRID = {"window": (10, 20, 50, 100, 200)}
+VARIANT_CODE = "liquidity_sweep_wick_ratio_{window}"
+VARIANT_DEPENDS = ("candle_parts",)  # the default window reads the candle scan instead
 
+import math
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.nodes import node
+from feature_engine.primitives import candle_column, rolling_max, rolling_min
+from feature_engine.streaming import RollingMax, RollingMin, StreamingFeature
+
+def variant_lookback(window: int) -> int:
+    return window
+
+
+def compute_feature(df: FrameLike, window: int = 20) -> pd.Series:
     """
     Liquidity Sweep Wick Ratio (20-bar lookback)
 
@@ -34,26 +48,25 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
 
       Feature:
         liquidity_sweep_wick_ratio_20 = clip(ratio_up + ratio_down, 0, 1)
-    """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+      `window` replaces the 20-bar lookback for the other PARAM_GRID variants.
+    """
 
-    high  = g["high"].astype(float)
-    low   = g["low"].astype(float)
-    open_ = g["open"].astype(float)
-    close = g["close"].astype(float)
+    g = as_context(df)
 
-    lookback = 20
+    if window == 20:
+        # default window: one column of the fused candle scan
+        return candle_column(g, FEATURE_CODE)
 
-    prior_high_20 = high.rolling(lookback).max().shift(1)
-    prior_low_20  = low .rolling(lookback).min().shift(1)
+    high  = g["high"]
+    low   = g["low"]
 
-    upper_body = np.maximum(open_, close)
-    lower_body = np.minimum(open_, close)
+    prior_high_20 = rolling_max(g, "high", window, shift=1)
+    prior_low_20  = rolling_min(g, "low",  window, shift=1)
 
-    wick_above = (high - upper_body).clip(lower=0.0)
-    wick_below = (lower_body - low).clip(lower=0.0)
+    candle = node(g, "candle_parts")
+    wick_above = candle.upper_wick
+    wick_below = candle.lower_wick
 
     up_sweep   = (high > prior_high_20)
     down_sweep = (low  < prior_low_20)
@@ -77,4 +90,33 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     ratio = np.clip(ratio, 0.0, 1.0)
 
     s = pd.Series(ratio, index=g.index, name=FEATURE_CODE)
-    return s
\ No newline at end of file
+    return s
+
+
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+
+    def __init__(self, window: int = 20):
+        self.window = window
+        super().__init__()
+
+    def reset(self) -> None:
+        self.hh = RollingMax(self.window)
+        self.ll = RollingMin(self.window)
+        self.prior_high = self.prior_low = float("nan")
+
+    def step(self, o, h, l, c, v) -> float:
+        prior_high, prior_low = self.prior_high, self.prior_low
+        self.prior_high = self.hh.update(h)
+        self.prior_low = self.ll.update(l)
+
+        # NaN-propagating body bounds, as in the batch (a NaN open or close means no wick)
+        body_nan = o != o or c != c
+        wick_above = h - (math.nan if body_nan else max(o, c))
+        wick_below = (math.nan if body_nan else min(o, c)) - l
+        ratio = 0.0
+        if wick_above > 0 and h > prior_high:
+            ratio += (h - prior_high) / wick_above
+        if wick_below > 0 and l < prior_low:
+            ratio += (prior_low - l) / wick_below
+        return min(max(ratio, 0.0), 1.0)
\ No newline at end of file
@@ -1,10 +1,13 @@
 # JUPYTER CELL — feature: market_structure_break_count_50
 FEATURE_CODE = "market_structure_break_count_50"
+LOOKBACK = 69
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_max, rolling_min
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Market Structure Break Count (50-bar window)
 
@@ -30,18 +33,15 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
         Non-negative float / int count.
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    high  = g["high"].astype(float)
-    low   = g["low"].astype(float)
-    close = g["close"].astype(float)
+    close = g["close"]
 
     lookback_ref = 20
     lookback_count = 50
 
-    prior_high_20 = high.rolling(lookback_ref).max().shift(1)
-    prior_low_20  = low .rolling(lookback_ref).min().shift(1)
+    prior_high_20 = rolling_max(g, "high", lookback_ref, shift=1)
+    prior_low_20  = rolling_min(g, "low",  lookback_ref, shift=1)
 
     bull_break = (close > prior_high_20)
     bear_break = (close < prior_low_20)
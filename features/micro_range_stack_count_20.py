@@ -1,10 +1,15 @@
 # JUPYTER CELL — feature: micro_range_stack_count_20
 FEATURE_CODE = "micro_range_stack_count_20"
+LOOKBACK = 118
+DEPENDS = ("bar_range",)
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.nodes import node
+from feature_engine.order_stats import rolling_quantile
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Micro Range Stack Count (20-bar rolling)
 
@@ -16,17 +21,13 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       - This feature returns the rolling 20-bar sum of micro-range flags.
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
-
-    high = g["high"].astype(float)
-    low = g["low"].astype(float)
+    g = as_context(df)
 
     # True range
-    tr = (high - low).abs()
+    tr = node(g, "bar_range")
 
     # Micro-range threshold (25th percentile)
-    threshold = tr.rolling(100, min_periods=30).quantile(0.25)
+    threshold = pd.Series(rolling_quantile(tr.to_numpy(), 100, 0.25, min_periods=30), index=g.index)
 
     micro_flag = (tr <= threshold).astype(float).fillna(0.0)
 
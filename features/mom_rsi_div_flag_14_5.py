@@ -1,10 +1,17 @@
 # JUPYTER CELL — feature: mom_rsi_div_flag_14_5
 FEATURE_CODE = "mom_rsi_div_flag_14_5"
+LOOKBACK = 1000  # EWM warm-up; the dropped history weighs < 1e-30
+OUTPUT_KIND = "ternary"  # -1 / 0 / +1
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.indicators import wilder_rsi
+from feature_engine.primitives import rolling_max, rolling_min
+from feature_engine.streaming import RollingMax, RollingMin, StreamingFeature, WilderRsi
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     RSI Divergence Flag (RSI-14, lookback 5)
     Description:
@@ -34,28 +41,16 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       Initial NaNs from rolling windows are OK (mapped to 0 by comparisons).
     Constraints:
       - No look-ahead (all comparisons use shifted/rolling past data).
-      - Vectorized; numpy and pandas only.
+      - Vectorized; RSI from the compiled kernel in feature_engine.indicators.
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
-
-    close = g["close"].astype(float)
-    delta = close.diff()
-
-    gain = delta.clip(lower=0.0)
-    loss = (-delta).clip(lower=0.0)
+    g = as_context(df)
 
-    alpha = 1.0 / 14.0
-    avg_gain = gain.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
-    avg_loss = loss.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
-
-    rs = avg_gain / avg_loss.replace(0.0, np.nan)
-    rsi = 100.0 - 100.0 / (1.0 + rs)
-    rsi = rsi.clip(0.0, 100.0)
+    close = g["close"]
+    rsi = pd.Series(wilder_rsi(close, (14,))[:, 0], index=g.index)
 
     L = 5
-    prev_high   = g["close"].shift(1).rolling(L, min_periods=L).max()
-    prev_low    = g["close"].shift(1).rolling(L, min_periods=L).min()
+    prev_high   = rolling_max(g, "close", L, shift=1)
+    prev_low    = rolling_min(g, "close", L, shift=1)
     prev_rsi_hi = rsi.shift(1).rolling(L, min_periods=L).max()
     prev_rsi_lo = rsi.shift(1).rolling(L, min_periods=L).min()
 
@@ -65,4 +60,31 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
 
     flag = np.where(bullish, 1, np.where(bearish, -1, 0)).astype(int)
     s = pd.Series(flag, index=g.index, name=FEATURE_CODE)
-    return s
\ No newline at end of file
+    return s
+
+
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+
+    def reset(self) -> None:
+        L = 5
+        self.rsi = WilderRsi(14)
+        self.close_hi, self.close_lo = RollingMax(L), RollingMin(L)
+        self.rsi_hi, self.rsi_lo = RollingMax(L), RollingMin(L)
+        self.prev_close = self.prev_rsi = float("nan")
+
+    def step(self, o, h, l, c, v) -> float:
+        # windows over close.shift(1) / rsi.shift(1): feed the previous bar
+        prev_high = self.close_hi.update(self.prev_close)
+        prev_low = self.close_lo.update(self.prev_close)
+        prev_rsi_hi = self.rsi_hi.update(self.prev_rsi)
+        prev_rsi_lo = self.rsi_lo.update(self.prev_rsi)
+        rsi = self.rsi.update(c)
+        self.prev_close, self.prev_rsi = c, rsi
+
+        eps = 0.1
+        if c < prev_low and rsi >= prev_rsi_lo + eps:
+            return 1.0
+        if c > prev_high and rsi <= prev_rsi_hi - eps:
+            return -1.0
+        return 0.0
\ No newline at end of file
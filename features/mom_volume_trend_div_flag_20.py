@@ -1,10 +1,13 @@
 # JUPYTER CELL — feature: mom_volume_trend_div_flag_20
 FEATURE_CODE = "mom_volume_trend_div_flag_20"
+LOOKBACK = 19
+OUTPUT_KIND = "flag"  # 0 / 1
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Volume and Trend Divergence Flag (20)
     Description:
@@ -14,8 +17,7 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       - Calculate rolling mean of close and volume over 20 periods.
       - Flag 1 if price and volume trends diverge (one goes up, the other down).
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
     price_rolling_mean = g["close"].rolling(20).mean()
     volume_rolling_mean = g["volume"].rolling(20).mean()
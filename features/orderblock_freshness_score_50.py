@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: orderblock_freshness_score_50
 FEATURE_CODE = "orderblock_freshness_score_50"
+LOOKBACK = 49
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_max, rolling_min
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Orderblock Freshness Score (50-bar proxy)
 
@@ -20,17 +24,14 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       The closer price is to a recent extreme, the "fresher" the zone.
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    high = g["high"].astype(float)
-    low = g["low"].astype(float)
-    close = g["close"].astype(float)
+    close = g["close"]
 
     win = 50
 
-    high50 = high.rolling(win).max()
-    low50  = low .rolling(win).min()
+    high50 = rolling_max(g, "high", win)
+    low50  = rolling_min(g, "low",  win)
     range50 = (high50 - low50).replace(0.0, np.nan)
 
     dist_high = (close - high50).abs()
@@ -1,10 +1,13 @@
 # JUPYTER CELL — feature: pivot_classic_s1_dist_1d
 FEATURE_CODE = "pivot_classic_s1_dist_1d"
+LOOKBACK = "1D"
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import pivot_table
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Classic Pivot S1 distance (previous day)
     Description:
@@ -15,21 +18,11 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       - Compute PP_prev, then S1_prev.
       - dist = (close_t - S1_today)/close_t
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
-    days = g.index.normalize()
-
-    daily = g.assign(__day=days).groupby("__day").agg(
-        high=("high", "max"),
-        low=("low", "min"),
-        close=("close", "last"),
-    )
-    dprev = daily.shift(1)
-    pp = (dprev["high"] + dprev["low"] + dprev["close"]) / 3.0
-    s1_daily = 2.0 * pp - dprev["high"]
+    g = as_context(df)
 
-    s1_intraday = pd.Series(pd.Index(days).map(s1_daily), index=g.index, dtype=float)
+    # Prior-day classic pivots from the shared pivot table
+    pivots = pivot_table(g, "D")
 
-    s = (g["close"].astype(float) - s1_intraday) / g["close"].astype(float)
+    s = pd.Series(pivots.distance(g["close"].to_numpy(float), "classic.s1"), index=g.index)
     s.name = FEATURE_CODE
     return s
\ No newline at end of file
@@ -1,10 +1,13 @@
 # JUPYTER CELL — feature: pivot_confluence_score_1d
 FEATURE_CODE = "pivot_confluence_score_1d"
+LOOKBACK = "1D"
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import pivot_table
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Pivot Confluence Score (classic pivots from previous day)
 
@@ -23,56 +26,21 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     Output is continuous, usually between 0 and ~5.
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
     if not isinstance(g.index, pd.DatetimeIndex):
         raise ValueError("pivot_confluence_score_1d requires a DatetimeIndex.")
 
-    high = g["high"].astype(float)
-    low = g["low"].astype(float)
-    close = g["close"].astype(float)
-
-    # Extract date for grouping
-    dates = g.index.normalize()
-
-    # Daily OHLC
-    daily = pd.DataFrame({"high": high, "low": low, "close": close})
-    daily_ohlc = daily.groupby(dates).agg({"high": "max", "low": "min", "close": "last"})
-
-    prev = daily_ohlc.shift(1)
-
-    prev_high  = prev["high"].reindex(dates).values
-    prev_low   = prev["low"] .reindex(dates).values
-    prev_close = prev["close"].reindex(dates).values
-
-    prev_high  = pd.Series(prev_high,  index=g.index)
-    prev_low   = pd.Series(prev_low,   index=g.index)
-    prev_close = pd.Series(prev_close, index=g.index)
-
-    prev_range = (prev_high - prev_low).replace(0.0, np.nan)
-
-    PP = (prev_high + prev_low + prev_close) / 3
-    R1 = 2*PP - prev_low
-    S1 = 2*PP - prev_high
-    R2 = PP + (prev_high - prev_low)
-    S2 = PP - (prev_high - prev_low)
-
-    def norm_dist(level):
-        d = (close - level).abs() / prev_range
-        return d.replace([np.inf, -np.inf], np.nan)
+    close = g["close"]
 
-    dist_levels = [
-        norm_dist(PP),
-        norm_dist(R1),
-        norm_dist(S1),
-        norm_dist(R2),
-        norm_dist(S2),
-    ]
+    # Prior-day classic levels PP/R1/S1/R2/S2 from the shared pivot table
+    pivots = pivot_table(g, "D")
+    levels = ["classic.pp", "classic.r1", "classic.s1", "classic.r2", "classic.s2"]
 
     alpha = 5.0
 
-    score = sum(np.exp(-alpha * d.fillna(99)) for d in dist_levels)
+    # distance in prior-day ranges; undefined distances count as 99 ranges away
+    score = pivots.confluence(close.to_numpy(), levels, alpha=alpha, fill=99.0)
     score = pd.Series(score, index=g.index).fillna(0.0)
 
     return score.rename(FEATURE_CODE)
\ No newline at end of file
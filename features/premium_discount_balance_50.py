@@ -1,10 +1,15 @@
 # JUPYTER CELL — feature: premium_discount_balance_50
 FEATURE_CODE = "premium_discount_balance_50"
+LOOKBACK = 98
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.moments import RollingMoments
+from feature_engine.primitives import rolling_max, rolling_min
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Premium–Discount Balance (50-bar window)
 
@@ -23,24 +28,23 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
          0 → balanced.
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    high = g["high"].astype(float)
-    low = g["low"].astype(float)
-    close = g["close"].astype(float)
+    close = g["close"]
 
     win = 50
 
-    high50 = high.rolling(win).max()
-    low50  = low .rolling(win).min()
+    high50 = rolling_max(g, "high", win)
+    low50  = rolling_min(g, "low",  win)
     mid50  = (high50 + low50) / 2.0
 
     premium_flag  = (close > mid50).astype(float)
     discount_flag = (close < mid50).astype(float)
 
-    premium_count  = premium_flag.rolling(win, min_periods=1).sum()
-    discount_count = discount_flag.rolling(win, min_periods=1).sum()
+    # both counts from one prefix pass over the (n, 2) flag matrix
+    counts = RollingMoments(np.column_stack([premium_flag, discount_flag])).sum(win, min_periods=1)
+    premium_count  = pd.Series(counts[:, 0], index=g.index)
+    discount_count = pd.Series(counts[:, 1], index=g.index)
 
     balance = (premium_count - discount_count) / float(win)
     balance = balance.replace([np.inf, -np.inf], np.nan).fillna(0.0)
@@ -1,10 +1,15 @@
 # JUPYTER CELL — feature: price_prev_low_dist_1
 FEATURE_CODE = "price_prev_low_dist_1"
+LOOKBACK = 1
+OUTPUT_KIND = "flag"  # 0 / 1
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.panel import Panel
+from feature_engine.primitives import candle_column
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Price Previous Low Distance (1 bar)
     Description:
@@ -14,13 +19,15 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       prev_low = low of previous bar
       flag = 1 if abs(close_t - prev_low) / close_t <= ε else 0
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
-
-    prev_low = g["low"].shift(1)
+    g = as_context(df)
 
-    epsilon = 0.01  # proximity range
-    flag = (abs(g["close"] - prev_low) / g["close"] <= epsilon).astype(int)
+    # fused candle scan: abs(close_t - low_{t-1}) / close_t <= 0.01
+    flag = candle_column(g, FEATURE_CODE).astype(int)
 
     s = pd.Series(flag, index=g.index, name=FEATURE_CODE)
-    return s
\ No newline at end of file
+    return s
+
+
+def compute_panel(panel: Panel) -> pd.DataFrame:
+    """compute_feature for all symbols at once: (T x S) frame, one column per symbol."""
+    return candle_column(panel, FEATURE_CODE).astype(int)
\ No newline at end of file
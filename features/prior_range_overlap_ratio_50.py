@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: prior_range_overlap_ratio_50
 FEATURE_CODE = "prior_range_overlap_ratio_50"
+LOOKBACK = 50
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_max, rolling_min
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Prior Range Overlap Ratio (50-bar window)
 
@@ -19,16 +23,12 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       Output is between 0 and 1 (0 = no overlap, 1 = identical ranges).
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
-
-    high = g["high"].astype(float)
-    low = g["low"].astype(float)
+    g = as_context(df)
 
     win = 50
 
-    high50 = high.rolling(win).max()
-    low50  = low .rolling(win).min()
+    high50 = rolling_max(g, "high", win)
+    low50  = rolling_min(g, "low",  win)
 
     high50_prev = high50.shift(1)
     low50_prev  = low50.shift(1)
@@ -1,10 +1,17 @@
 # JUPYTER CELL — feature: range_breakout_flag_50
 FEATURE_CODE = "range_breakout_flag_50"
+LOOKBACK = 50
+OUTPUT_KIND = "ternary"  # -1 / 0 / +1
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.panel import Panel
+from feature_engine.primitives import rolling_max, rolling_min
+from feature_engine.streaming import RollingMax, RollingMin, StreamingFeature
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Rolling Range Breakout Flag (50)
     Description:
@@ -27,14 +34,13 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       - Vectorized (rolling + numpy where).
       - Uses only numpy and pandas.
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]  # normalize
+    g = as_context(df)
 
     # Prior window (exclude current) via shift(1)
-    prev_high = g["high"].shift(1).rolling(50, min_periods=50).max().astype(float)
-    prev_low  = g["low"].shift(1).rolling(50, min_periods=50).min().astype(float)
+    prev_high = rolling_max(g, "high", 50, shift=1)
+    prev_low  = rolling_min(g, "low",  50, shift=1)
 
-    c = g["close"].astype(float)
+    c = g["close"]
 
     up_break   = c > prev_high
     down_break = c < prev_low
@@ -43,4 +49,28 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     flag = np.where(up_break, 1, np.where(down_break, -1, 0)).astype(int)
 
     s = pd.Series(flag, index=g.index, name=FEATURE_CODE)
-    return s
\ No newline at end of file
+    return s
+
+
+def compute_panel(panel: Panel) -> np.ndarray:
+    """compute_feature for all symbols at once, as an (S, T) array."""
+    prev_high = rolling_max(panel, "high", 50, shift=1)
+    prev_low  = rolling_min(panel, "low",  50, shift=1)
+    c = panel["close"]
+    return np.where(c > prev_high, 1, np.where(c < prev_low, -1, 0)).T
+
+
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+
+    def reset(self) -> None:
+        self.hh = RollingMax(50)
+        self.ll = RollingMin(50)
+        self.prev_high = self.prev_low = float("nan")
+
+    def step(self, o, h, l, c, v) -> float:
+        # prior window excludes the current bar: use last bar's extremes
+        prev_high, prev_low = self.prev_high, self.prev_low
+        self.prev_high = self.hh.update(h)
+        self.prev_low = self.ll.update(l)
+        return 1.0 if c > prev_high else (-1.0 if c < prev_low else 0.0)
\ No newline at end of file
@@ -1,10 +1,21 @@
 # JUPYTER CELL — feature: range_low_dist_50
 FEATURE_CODE = "range_low_dist_50"
+LOOKBACK = 49
+PARAM_GRID = {"window": (10, 20, 50, 100, 200)}
+VARIANT_CODE = "range_low_dist_{window}"
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.panel import Panel
+from feature_engine.primitives import rolling_min
+from feature_engine.streaming import RollingMin, StreamingFeature, div
+
+def variant_lookback(window: int) -> int:
+    return window - 1
+
+
+def compute_feature(df: FrameLike, window: int = 50) -> pd.Series:
     """
     Rolling Range Low Distance (50)
     Description:
@@ -24,15 +35,36 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       - No look-ahead (uses only current and past data).
       - Vectorized (rolling min).
       - Uses only numpy and pandas.
+    Parameters:
+      window: range length in bars (grid: PARAM_GRID; 50 is this code).
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]  # normalize
+    g = as_context(df)
 
-    # Rolling 50-bar lowest low (includes current bar)
-    rl = g["low"].rolling(50, min_periods=50).min().astype(float)
+    # Rolling window-bar lowest low (includes current bar)
+    rl = rolling_min(g, "low", window)
 
     # Relative distance from range-low
-    s = (g["close"].astype(float) - rl) / g["close"].astype(float)
+    s = (g["close"] - rl) / g["close"]
     s = s.astype(float)
     s.name = FEATURE_CODE
-    return s
\ No newline at end of file
+    return s
+
+
+def compute_panel(panel: Panel, window: int = 50) -> pd.DataFrame:
+    """compute_feature for all symbols at once: (T x S) frame, one column per symbol."""
+    rl = rolling_min(panel, "low", window)
+    return (panel["close"] - rl) / panel["close"]
+
+
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+
+    def __init__(self, window: int = 50):
+        self.window = window
+        super().__init__()
+
+    def reset(self) -> None:
+        self.rl = RollingMin(self.window)
+
+    def step(self, o, h, l, c, v) -> float:
+        return div(c - self.rl.update(l), c)
\ No newline at end of file
@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: range_rotation_index_20
 FEATURE_CODE = "range_rotation_index_20"
+LOOKBACK = 39
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_max, rolling_min
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Range Rotation Index (20-bar window)
 
@@ -22,16 +26,13 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
          0 → balanced / choppy.
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    high = g["high"].astype(float)
-    low = g["low"].astype(float)
 
     win = 20
 
-    high20 = high.rolling(win).max()
-    low20  = low .rolling(win).min()
+    high20 = rolling_max(g, "high", win)
+    low20  = rolling_min(g, "low", win)
     mid20  = (high20 + low20) / 2.0
 
     delta_mid = mid20 - mid20.shift(1)
@@ -1,10 +1,15 @@
 # JUPYTER CELL — feature: range_tagging_bias_50
 FEATURE_CODE = "range_tagging_bias_50"
+LOOKBACK = 98
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.moments import RollingMoments
+from feature_engine.primitives import rolling_max, rolling_min
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Range Tagging Bias (50-bar window)
 
@@ -28,17 +33,14 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
          0 → symmetric.
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    high = g["high"].astype(float)
-    low = g["low"].astype(float)
-    close = g["close"].astype(float)
+    close = g["close"]
 
     win = 50
 
-    high50 = high.rolling(win).max()
-    low50  = low .rolling(win).min()
+    high50 = rolling_max(g, "high", win)
+    low50  = rolling_min(g, "low",  win)
     range50 = (high50 - low50).replace(0.0, np.nan)
 
     thresh = 0.10 * range50
@@ -46,8 +48,10 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     high_tag = ((high50 - close) <= thresh).astype(float)
     low_tag  = ((close - low50) <= thresh).astype(float)
 
-    high_count = high_tag.rolling(win, min_periods=1).sum()
-    low_count  = low_tag .rolling(win, min_periods=1).sum()
+    # both counts from one prefix pass over the (n, 2) tag matrix
+    counts = RollingMoments(np.column_stack([high_tag, low_tag])).sum(win, min_periods=1)
+    high_count = pd.Series(counts[:, 0], index=g.index)
+    low_count  = pd.Series(counts[:, 1], index=g.index)
 
     bias = (high_count - low_count) / float(win)
     bias = bias.replace([np.inf, -np.inf], np.nan).fillna(0.0)
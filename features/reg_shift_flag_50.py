@@ -1,10 +1,17 @@
 # JUPYTER CELL — feature: reg_shift_flag_50
 FEATURE_CODE = "reg_shift_flag_50"
+LOOKBACK = 100
+OUTPUT_KIND = "flag"  # 0 / 1
+DEPENDS = ("bar_range",)
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.nodes import node
+from feature_engine.primitives import rolling_max, rolling_min
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Regime Shift Flag (50-bar comparison)
 
@@ -22,23 +29,20 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       If all conditions are met → flag = 1, else 0.
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    high = g["high"].astype(float)
-    low  = g["low"].astype(float)
-    close = g["close"].astype(float)
+    close = g["close"]
 
     win = 50
     eps = 1e-9
 
     # 50-bar range
-    high50 = high.rolling(win).max()
-    low50  = low .rolling(win).min()
+    high50 = rolling_max(g, "high", win)
+    low50  = rolling_min(g, "low",  win)
     range50 = (high50 - low50).replace(0.0, np.nan)
 
     # True range approximation
-    tr = (high - low).abs()
+    tr = node(g, "bar_range")
     tr_mean50 = tr.rolling(win).mean()
 
     close_mean50 = close.rolling(win).mean()
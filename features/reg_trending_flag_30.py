@@ -1,10 +1,15 @@
 # JUPYTER CELL — feature: reg_trending_flag_30
 FEATURE_CODE = "reg_trending_flag_30"
+LOOKBACK = 30
+OUTPUT_KIND = "flag"  # 0 / 1
+DEPENDS = ("bar_range",)
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.nodes import node
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Regime Trending Flag (30-bar window)
 
@@ -25,17 +30,14 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
         Integer flag in {0, 1}.
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    high = g["high"].astype(float)
-    low  = g["low"].astype(float)
-    close = g["close"].astype(float)
+    close = g["close"]
 
     eps = 1e-9
 
     # True range and ATR-like volatility
-    tr = (high - low).abs()
+    tr = node(g, "bar_range")
     atr14 = tr.rolling(14).mean()
 
     # 30-bar slope of close
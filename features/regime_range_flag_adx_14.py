@@ -1,10 +1,16 @@
 # JUPYTER CELL — feature: regime_range_flag_adx_14
 FEATURE_CODE = "regime_range_flag_adx_14"
+LOOKBACK = 1000  # EWM warm-up; the dropped history weighs < 1e-30
+OUTPUT_KIND = "flag"  # 0 / 1
+DEPENDS = ("dmi:14",)
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.nodes import node
+from feature_engine.streaming import Adx, StreamingFeature
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Regime: Range Flag via ADX (14)
     Description:
@@ -12,30 +18,21 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     Method:
       Same ADX pipeline as above; only final condition changes to (ADX < 20).
     """
-    g = df.copy(); g.columns = [str(c).lower() for c in g.columns]
-    h, l, c = g["high"].astype(float), g["low"].astype(float), g["close"].astype(float)
-
-    up_move   = h.diff()
-    down_move = -l.diff()
+    g = as_context(df)
+    # +DI / -DI / ADX with Wilder smoothing (shared "dmi:14" node)
+    plus_di, minus_di, adx = node(g, "dmi:14")
 
-    plus_dm  = np.where((up_move > down_move) & (up_move > 0),  up_move,  0.0)
-    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
-    plus_dm  = pd.Series(plus_dm, index=g.index)
-    minus_dm = pd.Series(minus_dm, index=g.index)
-
-    tr = pd.concat([(h - l), (h - c.shift(1)).abs(), (l - c.shift(1)).abs()], axis=1).max(axis=1)
+    flag = (adx < 20.0).astype(int).fillna(0)
+    s = pd.Series(flag.values, index=g.index, name=FEATURE_CODE)
+    return s
 
-    alpha = 1/14
-    tr_sm     = tr.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
-    plus_sm   = plus_dm.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
-    minus_sm  = minus_dm.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
 
-    plus_di  = 100.0 * (plus_sm  / tr_sm.replace(0.0, np.nan))
-    minus_di = 100.0 * (minus_sm / tr_sm.replace(0.0, np.nan))
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
 
-    dx = 100.0 * (plus_di - minus_di).abs() / (plus_di + minus_di).replace(0.0, np.nan)
-    adx = dx.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
+    def reset(self) -> None:
+        self.adx = Adx(14)
 
-    flag = (adx < 20.0).astype(int).fillna(0)
-    s = pd.Series(flag.values, index=g.index, name=FEATURE_CODE)
-    return s
\ No newline at end of file
+    def step(self, o, h, l, c, v) -> float:
+        plus_di, minus_di, adx = self.adx.update(h, l, c)
+        return float(adx < 20.0)
\ No newline at end of file
@@ -1,10 +1,17 @@
 # JUPYTER CELL — feature: regime_range_flag_bb_20_q20
 FEATURE_CODE = "regime_range_flag_bb_20_q20"
+LOOKBACK = 138
+OUTPUT_KIND = "flag"  # 0 / 1
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.indicators import bollinger
+from feature_engine.order_stats import rolling_quantile
+from feature_engine.primitives import rolling_moments
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Regime: Range Flag via Bollinger Bandwidth (BB(20), below 20th percentile over 120 bars)
     Description:
@@ -19,16 +26,14 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       - No look-ahead (threshold is from rolling past+current window).
       - Vectorized; numpy & pandas only.
     """
-    g = df.copy(); g.columns = [str(c).lower() for c in g.columns]
-    c = g["close"].astype(float)
+    g = as_context(df)
 
-    ma20 = c.rolling(20, min_periods=20).mean()
-    sd20 = c.rolling(20, min_periods=20).std(ddof=0)
-    bbw20 = (4.0 * sd20) / ma20.replace(0.0, np.nan)  # normalized width
+    bands = bollinger(rolling_moments(g, "close"), (20,), num_std=2.0, ddof=0)
+    ma20 = pd.Series(bands.middle[:, 0], index=g.index)
+    bbw20 = (bands.upper[:, 0] - bands.lower[:, 0]) / ma20.replace(0.0, np.nan)  # normalized width
 
     # Rolling 20th percentile over 120 bars
-    # Note: rolling(...).quantile(q) is vectorized and avoids look-ahead.
-    thresh = bbw20.rolling(120, min_periods=120).quantile(0.20, interpolation="linear")
+    thresh = pd.Series(rolling_quantile(bbw20.to_numpy(), 120, 0.20), index=g.index)
 
     flag = (bbw20 <= thresh).astype(int).fillna(0)
     s = pd.Series(flag.values, index=g.index, name=FEATURE_CODE)
@@ -1,10 +1,17 @@
 # JUPYTER CELL — feature: regime_trend_up_flag_slopeatr_50_14
 FEATURE_CODE = "regime_trend_up_flag_slope_50_atr_14"
+LOOKBACK = 1000  # EWM warm-up; the dropped history weighs < 1e-30
+OUTPUT_KIND = "flag"  # 0 / 1
+DEPENDS = ("atr:14",)
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.nodes import node
+from feature_engine.primitives import rolling_regression
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Regime: Uptrend Flag via Regression Slope normalized by ATR (W=50, ATR=14)
     Description:
@@ -18,26 +25,14 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     Notes:
       - Units: slope is price/bar; dividing by ATR (price units) yields per-bar in ATR units.
     """
-    g = df.copy(); g.columns = [str(c).lower() for c in g.columns]
-    y = g["close"].astype(float)
-    n = len(g); W = 50
+    g = as_context(df)
+    W = 50
 
     # Rolling OLS slope
-    t = pd.Series(np.arange(n, dtype=float), index=g.index)
-    t_mean = t.rolling(W, min_periods=W).mean()
-    y_mean = y.rolling(W, min_periods=W).mean()
-    cov = (t*y).rolling(W, min_periods=W).mean() - t_mean*y_mean
-    var = (t*t).rolling(W, min_periods=W).mean() - t_mean*t_mean
-    slope = cov / var.replace(0.0, np.nan)
+    slope = pd.Series(rolling_regression(g, "close", W).slope, index=g.index)
 
-    # ATR(14) — Wilder
-    h, l, c = g["high"].astype(float), g["low"].astype(float), g["close"].astype(float)
-    tr = pd.concat([
-        (h - l),
-        (h - c.shift(1)).abs(),
-        (l - c.shift(1)).abs()
-    ], axis=1).max(axis=1)
-    atr14 = tr.ewm(alpha=1/14, adjust=False, min_periods=14).mean()
+    # ATR(14) — Wilder (shared "atr:14" node)
+    atr14 = node(g, "atr:14")
 
     z = slope / atr14.replace(0.0, np.nan)
     k = 0.05
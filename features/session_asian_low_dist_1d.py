@@ -1,28 +1,47 @@
 # JUPYTER CELL — feature: session_asian_low_dist_1d
 FEATURE_CODE = "session_asian_low_dist_1d"
+LOOKBACK = "1D"
+OUTPUT_KIND = "flag"  # 0 / 1
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import session_state
+from feature_engine.session import SessionAccumulator, PREV_ASIAN_LOW
+from feature_engine.streaming import StreamingFeature, div
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Session Asian Low Distance (1d)
     Description:
       Flags 1 if the close is close to the low of the previous day's Asian session.
       Proximity is determined within a small range (ε = 0.01).
     Formula / method (brief):
-      asian_low = low of previous day's Asian session
+      asian_low = low of the previous calendar day's Asian session
+                   (bars between 00:00 and 04:00 wall-clock time)
       flag = 1 if abs(close_t - asian_low) / close_t <= ε else 0
+      Bars without a previous Asian session get 0.
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
+
+    if not isinstance(g.index, pd.DatetimeIndex):
+        raise ValueError("session_asian_low_dist_1d requires a DatetimeIndex.")
 
-    # Assuming Asian session low is the low of the first few hours of the day,
-    # we'll calculate it from the first 4 hours for this example.
-    asian_session = g.between_time('00:00', '04:00')  # Adjust based on Asian session time
-    asian_low = asian_session["low"].min()
+    asian_low = session_state(g)["prev_asian_low"]
 
     flag = (abs(g["close"] - asian_low) / g["close"] <= 0.01).astype(int)
 
     s = pd.Series(flag, index=g.index, name=FEATURE_CODE)
-    return s
\ No newline at end of file
+    return s
+
+
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+    uses_time = True
+
+    def reset(self) -> None:
+        self.session = SessionAccumulator()
+
+    def step(self, o, h, l, c, v) -> float:
+        st = self.session.update(self.now, o, h, l, c)
+        return float(div(abs(c - st[PREV_ASIAN_LOW]), c) <= 0.01)
\ No newline at end of file
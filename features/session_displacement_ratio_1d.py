@@ -1,65 +1,63 @@
 # JUPYTER CELL — feature: session_displacement_ratio_1d
 FEATURE_CODE = "session_displacement_ratio_1d"
+LOOKBACK = "0D"
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import session_state
+from feature_engine.session import SessionAccumulator, FIRST_CLOSE, HIGH, LOW
+from feature_engine.streaming import StreamingFeature, div
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
-    Session Displacement Ratio (1-day)
+    Session Displacement Ratio (1-day, causal)
 
     Requirements:
       - Index must be a DatetimeIndex.
       - Data is assumed intraday, with multiple bars per calendar day.
 
     Logic:
-      For each calendar day:
-        - open_d  = first close of the day (or open if you replace it)
-        - close_d = last close of the day
-        - high_d  = max high of the day
-        - low_d   = min low of the day
-        - displacement = close_d - open_d
-        - range       = high_d - low_d
-
-      Session-level metric:
-        ratio_d = displacement / (range + eps)
-
-      That daily ratio is then mapped back to all bars of the same day.
+      For each bar t of a calendar day, using only that day's bars up to t:
+        - open_d  = first close of the day
+        - high_t  = running max high of the day
+        - low_t   = running min low of the day
+        - displacement = close_t - open_d
+        - range        = high_t - low_t
+
+      ratio_t = displacement / (range + eps)   (0 where undefined)
+
+      No end-of-day values are broadcast back, so the value is final at bar t.
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
     if not isinstance(g.index, pd.DatetimeIndex):
         raise ValueError("session_displacement_ratio_1d requires a DatetimeIndex.")
 
-    high = g["high"].astype(float)
-    low  = g["low"].astype(float)
-    close = g["close"].astype(float)
-
-    dates = g.index.normalize()
+    st = session_state(g)
 
-    temp = pd.DataFrame({
-        "high": high,
-        "low": low,
-        "close": close,
-        "date": dates,
-    })
+    displacement = g["close"] - st["first_close"]
+    session_range = (st["high"] - st["low"]).replace(0.0, np.nan)
 
-    grouped = temp.groupby("date", sort=False)
+    ratio = displacement / (session_range + 1e-9)
+    ratio = ratio.replace([np.inf, -np.inf], np.nan).fillna(0.0)
 
-    high_d  = grouped["high"].max()
-    low_d   = grouped["low"].min()
-    close_d = grouped["close"].last()
-    open_d  = grouped["close"].first()  # if you have 'open', swap to grouped["open"].first()
+    return ratio.rename(FEATURE_CODE)
 
-    displacement = close_d - open_d
-    session_range = (high_d - low_d).replace(0.0, np.nan)
 
-    ratio_d = displacement / (session_range + 1e-9)
-    ratio_d = ratio_d.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+    uses_time = True
 
-    # Broadcast daily values to intraday index
-    session_ratio = pd.Series(ratio_d.reindex(dates).values, index=g.index)
+    def reset(self) -> None:
+        self.session = SessionAccumulator()
 
-    return session_ratio.rename(FEATURE_CODE)
\ No newline at end of file
+    def step(self, o, h, l, c, v) -> float:
+        st = self.session.update(self.now, o, h, l, c)
+        session_range = st[HIGH] - st[LOW]
+        if not session_range:
+            return 0.0
+        ratio = div(c - st[FIRST_CLOSE], session_range + 1e-9)
+        return ratio if np.isfinite(ratio) else 0.0
\ No newline at end of file
@@ -1,59 +1,64 @@
 # JUPYTER CELL — feature: session_high_low_shift_dir_3d
 FEATURE_CODE = "session_high_low_shift_dir_3d"
+LOOKBACK = "3D"
+OUTPUT_KIND = "ternary"  # -1 / 0 / +1
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import session_state
+from feature_engine.session import SessionAccumulator, HIGH, LOW, PREV_HIGH, PREV_LOW, SHIFT_1, SHIFT_2
+from feature_engine.streaming import StreamingFeature
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
-    Session High–Low Shift Direction (3-day window)
+    Session High–Low Shift Direction (3-day window, causal)
 
     Requirements:
       - Index must be a DatetimeIndex.
       - Data is assumed intraday with multiple bars per calendar day.
 
     Logic:
-      For each calendar day:
-        - high_d = max(high) of the day
-        - low_d  = min(low) of the day
-
-      Then:
-        - 1-day shift score:
-            shift_score_d = ((high_d - high_d.shift(1)) +
-                             (low_d  - low_d.shift(1))) / 2
-        - 3-day smoothed shift:
-            shift_mean3 = rolling_mean(shift_score_d, 3)
-        - Direction:
-            dir_d = sign(shift_mean3)   in {-1, 0, +1}
-
-      That daily direction is broadcast to all intraday bars of the same day.
+      Completed days d:
+        shift_score_d = ((high_d - high_{d-1}) + (low_d - low_{d-1})) / 2
+      Current day, at bar t (running high/low of today so far):
+        shift_score_t = ((high_t - high_{d-1}) + (low_t - low_{d-1})) / 2
+
+      shift_mean3_t = mean of the available values among
+                      shift_score_{d-2}, shift_score_{d-1}, shift_score_t
+      dir_t = sign(shift_mean3_t)   in {-1, 0, +1}
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
     if not isinstance(g.index, pd.DatetimeIndex):
         raise ValueError("session_high_low_shift_dir_3d requires a DatetimeIndex.")
 
-    high = g["high"].astype(float)
-    low  = g["low"].astype(float)
+    st = session_state(g)
 
-    dates = g.index.normalize()
+    # Live 1-day shift of today's running high/low vs. yesterday's
+    shift_live = ((st["high"] - st["prev_high"]) +
+                  (st["low"]  - st["prev_low"])) / 2.0
 
-    temp = pd.DataFrame({"high": high, "low": low, "date": dates})
+    # 3-day smoothed direction
+    shift_mean3 = pd.concat([st["shift_score_2"], st["shift_score_1"], shift_live], axis=1).mean(axis=1)
+    dir_series = np.sign(shift_mean3).fillna(0.0)
 
-    grouped = temp.groupby("date", sort=False)
-    high_d = grouped["high"].max()
-    low_d  = grouped["low"].min()
+    return dir_series.rename(FEATURE_CODE)
 
-    # 1-day shift in highs and lows
-    shift_score = ((high_d - high_d.shift(1)) +
-                   (low_d  - low_d.shift(1))) / 2.0
 
-    # 3-day smoothed direction
-    shift_mean3 = shift_score.rolling(3, min_periods=1).mean()
-    dir_d = np.sign(shift_mean3).fillna(0.0)
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+    uses_time = True
 
-    dir_series = pd.Series(dir_d.reindex(dates).values, index=g.index)
+    def reset(self) -> None:
+        self.session = SessionAccumulator()
 
-    return dir_series.rename(FEATURE_CODE)
\ No newline at end of file
+    def step(self, o, h, l, c, v) -> float:
+        st = self.session.update(self.now, o, h, l, c)
+        live = ((st[HIGH] - st[PREV_HIGH]) + (st[LOW] - st[PREV_LOW])) / 2.0
+        scores = [x for x in (st[SHIFT_2], st[SHIFT_1], live) if x == x]
+        if not scores:
+            return 0.0
+        return float(np.sign(sum(scores) / len(scores)))
\ No newline at end of file
@@ -1,10 +1,17 @@
 # JUPYTER CELL — feature: session_initial_balance_breakout_flag_1d
 FEATURE_CODE = "session_initial_balance_breakout_flag_1d"
+LOOKBACK = "0D"
+OUTPUT_KIND = "flag"  # 0 / 1
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.calendar import NS_PER_DAY
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import session_state
+from feature_engine.session import FIRST_TOD, IB_HIGH, IB_LOW, IB_NS, SessionAccumulator
+from feature_engine.streaming import StreamingFeature
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Session Initial Balance Breakout Flag (1-day)
 
@@ -12,10 +19,10 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       - Index must be a DatetimeIndex.
       - Data is assumed intraday with multiple bars per calendar day.
 
-    Logic (bar-count based Initial Balance):
+    Logic (time-based Initial Balance, causal):
       For each calendar day:
-        - Let n = number of bars in that day.
-        - Initial Balance (IB) = first max(int(0.25 * n), 1) bars.
+        - Initial Balance (IB) = bars within the first hour after the day's
+          first bar (feature_engine.session.IB_NS).
         - IB_high = max(high over IB bars)
         - IB_low  = min(low  over IB bars)
 
@@ -25,42 +32,42 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
           then breakout_flag = 1
           else 0.
 
+      The IB is known once it has ended, so each flag only uses bars up to
+      the current one.
+
       Output:
         Per-bar integer flag in {0, 1}.
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
     if not isinstance(g.index, pd.DatetimeIndex):
         raise ValueError("session_initial_balance_breakout_flag_1d requires a DatetimeIndex.")
 
-    high = g["high"].astype(float)
-    low  = g["low"].astype(float)
-
-    dates = g.index.normalize()
+    high = g["high"]
+    low  = g["low"]
 
-    temp = pd.DataFrame({"high": high, "low": low, "date": dates})
-    grouped = temp.groupby("date", sort=False)
+    state = session_state(g)
 
-    breakout_flag = pd.Series(0, index=g.index, dtype=int)
+    # Bars after IB: at least IB_NS past the day's first bar
+    time_of_day = g.wall_clock_ns % NS_PER_DAY
+    after_ib = (time_of_day - state["first_tod"].to_numpy()) >= IB_NS
 
-    for date_val, grp in grouped:
-        n = len(grp)
-        if n <= 1:
-            continue
+    cond_break = (high > state["ib_high"]) | (low < state["ib_low"])
+    breakout_flag = pd.Series((after_ib & cond_break.to_numpy()).astype(int), index=g.index)
 
-        # IB defined as first 25% of bars in that day
-        ib_count = max(int(round(0.25 * n)), 1)
+    return breakout_flag.rename(FEATURE_CODE)
 
-        ib_slice = grp.iloc[:ib_count]
-        ib_high = ib_slice["high"].max()
-        ib_low  = ib_slice["low"].min()
 
-        # Bars after IB
-        after_ib = grp.iloc[ib_count:]
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+    uses_time = True
 
-        cond_break = (after_ib["high"] > ib_high) | (after_ib["low"] < ib_low)
-        breakout_flag.loc[after_ib.index] = cond_break.astype(int)
+    def reset(self) -> None:
+        self.session = SessionAccumulator()
 
-    return breakout_flag.rename(FEATURE_CODE)
\ No newline at end of file
+    def step(self, o, h, l, c, v) -> float:
+        st = self.session.update(self.now, o, h, l, c)
+        if self.now % NS_PER_DAY - st[FIRST_TOD] < IB_NS:
+            return 0.0
+        return float(h > st[IB_HIGH] or l < st[IB_LOW])
\ No newline at end of file
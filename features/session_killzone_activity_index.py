@@ -1,55 +1,48 @@
 # JUPYTER CELL — feature: session_killzone_activity_index
 FEATURE_CODE = "session_killzone_activity_index"
+LOOKBACK = "0D"
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import session_state
+from feature_engine.session import SessionAccumulator, KZ_RANGE_SUM, RANGE_SUM
+from feature_engine.streaming import StreamingFeature, div
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
-    Session Killzone Activity Index (1-day)
+    Session Killzone Activity Index (1-day, causal)
+
+    Share of the day's bar ranges (|high - low|) printed inside the London
+    (07-10) and New York (13-16) killzones, accumulated from the start of the
+    day up to the current bar:
 
-    Clean, vectorized, and warning-free version.
+        index_t = killzone_range_sum_t / (range_sum_t + eps)
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
     if not isinstance(g.index, pd.DatetimeIndex):
         raise ValueError("session_killzone_activity_index requires a DatetimeIndex.")
 
-    high = g["high"].astype(float)
-    low  = g["low"].astype(float)
-
-    tr = (high - low).abs()
-
-    dates = g.index.normalize()
-    hours = g.index.hour
+    st = session_state(g)
 
-    killzone_mask = (
-        ((hours >= 7) & (hours < 10)) |   # London
-        ((hours >= 13) & (hours < 16))    # New York
-    )
-
-    temp = pd.DataFrame({
-        "tr": tr,
-        "date": dates,
-        "killzone": killzone_mask.astype(bool),
-    })
-
-    grouped = temp.groupby("date", sort=False)
+    eps = 1e-9
+    activity = st["killzone_range_sum"] / (st["range_sum"] + eps)
+    activity = activity.replace([np.inf, -np.inf], np.nan).fillna(0.0)
 
-    # Daily TR sum (vectorized)
-    daily_tr_sum = grouped["tr"].sum()
+    return activity.rename(FEATURE_CODE)
 
-    # Killzone TR sum (vectorized & no warning)
-    kill_tr_sum = temp.loc[temp["killzone"], :].groupby("date")["tr"].sum()
-    kill_tr_sum = kill_tr_sum.reindex(daily_tr_sum.index).fillna(0.0)
 
-    eps = 1e-9
-    activity_d = kill_tr_sum / (daily_tr_sum + eps)
-    activity_d = activity_d.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+    uses_time = True
 
-    # Broadcast to full index
-    activity_series = pd.Series(activity_d.reindex(dates).values, index=g.index)
+    def reset(self) -> None:
+        self.session = SessionAccumulator()
 
-    return activity_series.rename(FEATURE_CODE)
\ No newline at end of file
+    def step(self, o, h, l, c, v) -> float:
+        st = self.session.update(self.now, o, h, l, c)
+        activity = div(st[KZ_RANGE_SUM], st[RANGE_SUM] + 1e-9)
+        return activity if np.isfinite(activity) else 0.0
\ No newline at end of file
@@ -1,10 +1,42 @@
 # JUPYTER CELL — feature: smc_liquidity_void_depth_50
 FEATURE_CODE = "smc_liquidity_void_depth_50"
+LOOKBACK = 50
+PARAM_GRID = {"window": (10, 20, 50, 100, 200)}
+VARIANT_CODE = "smc_liquidity_void_depth_{window}"
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.extrema import RangeExtrema
+from feature_engine.memo import shared
+from feature_engine.primitives import candle_column, rolling_max, rolling_min
+
+def variant_lookback(window: int) -> int:
+    return window
+
+
+def _void_depth_extrema(g: FrameLike) -> RangeExtrema:
+    """Rolling-max table of the per-bar void depth, shared by every window."""
+    high = g["high"]
+    low  = g["low"]
+
+    prev_high = high.shift(1)
+    prev_low  = low.shift(1)
+
+    # Gap up void
+    gap_up = (low > prev_high)
+    gap_up_depth = (low - prev_high).where(gap_up, 0.0)
+
+    # Gap down void
+    gap_down = (high < prev_low)
+    gap_down_depth = (prev_low - high).where(gap_down, 0.0)
+
+    void_depth_bar = np.maximum(gap_up_depth, gap_down_depth).fillna(0.0)
+    return RangeExtrema(void_depth_bar.to_numpy(float))
+
+
+def compute_feature(df: FrameLike, window: int = 50) -> pd.Series:
     """
     SMC Liquidity Void Depth (50-bar window)
 
@@ -27,36 +59,25 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       Output:
         Float in [0, 1+] indicating relative depth of the largest void
         within the last 50 bars.
-    """
-
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
-
-    high = g["high"].astype(float)
-    low  = g["low"].astype(float)
-
-    prev_high = high.shift(1)
-    prev_low  = low.shift(1)
 
-    # Gap up void
-    gap_up = (low > prev_high)
-    gap_up_depth = (low - prev_high).where(gap_up, 0.0)
+      `window` replaces the 50 bars for the other PARAM_GRID variants.
+    """
 
-    # Gap down void
-    gap_down = (high < prev_low)
-    gap_down_depth = (prev_low - high).where(gap_down, 0.0)
+    g = as_context(df)
 
-    void_depth_bar = np.maximum(gap_up_depth, gap_down_depth).fillna(0.0)
+    if window == 50:
+        # default window: one column of the fused candle scan
+        return candle_column(g, FEATURE_CODE)
 
-    win = 50
-    max_void_50 = void_depth_bar.rolling(win).max()
+    max_void = pd.Series(shared(g, ("smc_void_depth",), lambda: _void_depth_extrema(g)).max(window),
+                         index=g.index)
 
-    high50 = high.rolling(win).max()
-    low50  = low .rolling(win).min()
-    range50 = (high50 - low50).replace(0.0, np.nan)
+    high_w = rolling_max(g, "high", window)
+    low_w  = rolling_min(g, "low",  window)
+    range_w = (high_w - low_w).replace(0.0, np.nan)
 
     eps = 1e-9
-    depth_norm = max_void_50 / (range50 + eps)
+    depth_norm = max_void / (range_w + eps)
     depth_norm = depth_norm.replace([np.inf, -np.inf], np.nan).fillna(0.0)
 
     return pd.Series(depth_norm.values, index=g.index, name=FEATURE_CODE)
\ No newline at end of file
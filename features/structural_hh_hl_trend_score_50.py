@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: structural_hh_hl_trend_score_50
 FEATURE_CODE = "structural_hh_hl_trend_score_50"
+LOOKBACK = 50
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.moments import RollingMoments
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Structural HH/HL Trend Score (50-bar window)
 
@@ -26,11 +30,10 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
            0 ~ mixed/choppy.
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    high = g["high"].astype(float)
-    low  = g["low"].astype(float)
+    high = g["high"]
+    low  = g["low"]
 
     prev_high = high.shift(1)
     prev_low  = low.shift(1)
@@ -42,7 +45,7 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     struct_sign = struct_sign.astype(float).fillna(0.0)
 
     win = 50
-    trend_score = struct_sign.rolling(win, min_periods=1).mean()
+    trend_score = pd.Series(RollingMoments(struct_sign.to_numpy()).mean(win, min_periods=1), index=g.index)
     trend_score = trend_score.replace([np.inf, -np.inf], np.nan).fillna(0.0)
 
     return pd.Series(trend_score.values, index=g.index, name=FEATURE_CODE)
\ No newline at end of file
@@ -1,10 +1,13 @@
 # JUPYTER CELL — feature: structure_shift_score_30
 FEATURE_CODE = "structure_shift_score_30"
+LOOKBACK = 60
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Structure Shift Score (30-bar comparison)
 
@@ -26,11 +29,10 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
         - Values near zero → little net structural change over that horizon.
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    high = g["high"].astype(float)
-    low  = g["low"].astype(float)
+    high = g["high"]
+    low  = g["low"]
 
     prev_high = high.shift(1)
     prev_low  = low.shift(1)
@@ -1,10 +1,15 @@
 # JUPYTER CELL — feature: sweep_and_break_flag_20
 FEATURE_CODE = "sweep_and_break_flag_20"
+LOOKBACK = 20
+OUTPUT_KIND = "flag"  # 0 / 1
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_max, rolling_min
+from feature_engine.streaming import RollingMax, RollingMin, StreamingFeature
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Sweep-and-Break Flag (20-bar lookback)
 
@@ -30,18 +35,17 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
         - Then closes with momentum in the opposite direction (break).
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    high  = g["high"].astype(float)
-    low   = g["low"].astype(float)
-    open_ = g["open"].astype(float)
-    close = g["close"].astype(float)
+    high  = g["high"]
+    low   = g["low"]
+    open_ = g["open"]
+    close = g["close"]
 
     lookback = 20
 
-    prior_high_20 = high.rolling(lookback).max().shift(1)
-    prior_low_20  = low .rolling(lookback).min().shift(1)
+    prior_high_20 = rolling_max(g, "high", lookback, shift=1)
+    prior_low_20  = rolling_min(g, "low",  lookback, shift=1)
 
     up_sweep   = (high > prior_high_20)
     down_sweep = (low  < prior_low_20)
@@ -51,4 +55,20 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
 
     flag = (break_down_after_up | break_up_after_down).astype(int).fillna(0)
 
-    return pd.Series(flag.values, index=g.index, name=FEATURE_CODE)
\ No newline at end of file
+    return pd.Series(flag.values, index=g.index, name=FEATURE_CODE)
+
+
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+
+    def reset(self) -> None:
+        self.hh = RollingMax(20)
+        self.ll = RollingMin(20)
+        self.prior_high = self.prior_low = float("nan")
+
+    def step(self, o, h, l, c, v) -> float:
+        prior_high, prior_low = self.prior_high, self.prior_low
+        self.prior_high = self.hh.update(h)
+        self.prior_low = self.ll.update(l)
+        flag = (h > prior_high and c < o) or (l < prior_low and c > o)
+        return float(flag)
\ No newline at end of file
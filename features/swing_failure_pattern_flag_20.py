@@ -1,10 +1,15 @@
 # JUPYTER CELL — feature: swing_failure_pattern_flag_20
 FEATURE_CODE = "swing_failure_pattern_flag_20"
+LOOKBACK = 20
+OUTPUT_KIND = "flag"  # 0 / 1
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_max, rolling_min
+from feature_engine.streaming import RollingMax, RollingMin, StreamingFeature
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Swing Failure Pattern Flag (20-bar lookback)
 
@@ -27,18 +32,17 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       If either bullish or bearish SFP occurs → flag = 1, else 0.
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    high  = g["high"].astype(float)
-    low   = g["low"].astype(float)
-    open_ = g["open"].astype(float)
-    close = g["close"].astype(float)
+    high  = g["high"]
+    low   = g["low"]
+    open_ = g["open"]
+    close = g["close"]
 
     lookback = 20
 
-    prior_high_20 = high.rolling(lookback).max().shift(1)
-    prior_low_20  = low .rolling(lookback).min().shift(1)
+    prior_high_20 = rolling_max(g, "high", lookback, shift=1)
+    prior_low_20  = rolling_min(g, "low",  lookback, shift=1)
 
     # Bearish SFP: sweep above prior high, close back below it, bearish candle
     bearish_sfp = (
@@ -56,4 +60,21 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
 
     flag = (bearish_sfp | bullish_sfp).astype(int).fillna(0)
 
-    return pd.Series(flag.values, index=g.index, name=FEATURE_CODE)
\ No newline at end of file
+    return pd.Series(flag.values, index=g.index, name=FEATURE_CODE)
+
+
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+
+    def reset(self) -> None:
+        self.hh = RollingMax(20)
+        self.ll = RollingMin(20)
+        self.prior_high = self.prior_low = float("nan")
+
+    def step(self, o, h, l, c, v) -> float:
+        prior_high, prior_low = self.prior_high, self.prior_low
+        self.prior_high = self.hh.update(h)
+        self.prior_low = self.ll.update(l)
+        bearish_sfp = h > prior_high and c < prior_high and c < o
+        bullish_sfp = l < prior_low and c > prior_low and c > o
+        return float(bearish_sfp or bullish_sfp)
\ No newline at end of file
@@ -1,10 +1,13 @@
 # JUPYTER CELL — feature: swing_leg_efficiency_ratio_30
 FEATURE_CODE = "swing_leg_efficiency_ratio_30"
+LOOKBACK = 30
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Swing Leg Efficiency Ratio (30-bar window)
 
@@ -20,10 +23,9 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
         - Values near 0 → highly choppy, mean-reverting movement.
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    close = g["close"].astype(float)
+    close = g["close"]
 
     win = 30
     eps = 1e-9
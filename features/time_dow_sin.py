@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: time_dow_sin
 FEATURE_CODE = "time_dow_sin"
+LOOKBACK = 0
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.panel import Panel
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Time-of-Week Sine Encoding (Day of Week)
 
@@ -19,13 +23,21 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       (useful for models that like continuous features).
     """
 
-    g = df.copy()
+    g = as_context(df)
 
     if not isinstance(g.index, pd.DatetimeIndex):
         raise ValueError("time_dow_sin requires a DatetimeIndex.")
 
-    dow = g.index.dayofweek.astype(float)  # Monday=0, Sunday=6
+    dow = g.dayofweek.astype(float)  # Monday=0, Sunday=6
 
     values = np.sin(2.0 * np.pi * dow / 7.0)
 
-    return pd.Series(values, index=g.index, name=FEATURE_CODE)
\ No newline at end of file
+    return pd.Series(values, index=g.index, name=FEATURE_CODE)
+
+
+def compute_panel(panel: Panel) -> np.ndarray:
+    """Depends on the shared index only: computed once and broadcast to every symbol."""
+    if not isinstance(panel.index, pd.DatetimeIndex):
+        raise ValueError("time_dow_sin requires a DatetimeIndex.")
+    dow = panel.index.dayofweek.to_numpy(float)
+    return panel.broadcast(np.sin(2.0 * np.pi * dow / 7.0))
\ No newline at end of file
@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: time_hour_sin
 FEATURE_CODE = "time_hour_sin"
+LOOKBACK = 0
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.panel import Panel
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Time-of-Day Sine Encoding (Hour of Day)
 
@@ -19,12 +23,20 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       This encodes time-of-day as a smooth cyclic feature.
     """
 
-    g = df.copy()
+    g = as_context(df)
 
     if not isinstance(g.index, pd.DatetimeIndex):
         raise ValueError("time_hour_sin requires a DatetimeIndex.")
 
-    hour = g.index.hour.astype(float)
+    hour = g.hour.astype(float)
     values = np.sin(2.0 * np.pi * hour / 24.0)
 
-    return pd.Series(values, index=g.index, name=FEATURE_CODE)
\ No newline at end of file
+    return pd.Series(values, index=g.index, name=FEATURE_CODE)
+
+
+def compute_panel(panel: Panel) -> np.ndarray:
+    """Depends on the shared index only: computed once and broadcast to every symbol."""
+    if not isinstance(panel.index, pd.DatetimeIndex):
+        raise ValueError("time_hour_sin requires a DatetimeIndex.")
+    hour = panel.index.hour.to_numpy(float)
+    return panel.broadcast(np.sin(2.0 * np.pi * hour / 24.0))
\ No newline at end of file
@@ -1,10 +1,15 @@
 # JUPYTER CELL — feature: time_to_close_ratio
 FEATURE_CODE = "time_to_close_ratio"
+LOOKBACK = "0D"
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.panel import Panel
+from feature_engine.primitives import calendar_segments
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Time-to-Close Ratio (per calendar day, bar-count based)
 
@@ -27,28 +32,25 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       This is a bar-count based approximation of "how much of the session is left".
     """
 
-    g = df.copy()
+    g = as_context(df)
 
     if not isinstance(g.index, pd.DatetimeIndex):
         raise ValueError("time_to_close_ratio requires a DatetimeIndex.")
 
-    dates = g.index.normalize()
-    temp = pd.DataFrame({"date": dates})
-    ratios = pd.Series(0.0, index=g.index, name=FEATURE_CODE)
+    days = calendar_segments(g, "D")
+    n = days.broadcast(days.lengths)
+    j = days.position().astype(float)
+
+    denom = np.maximum(1.0, n - 1.0)
+    day_ratios = (denom - j) / denom
+    # Only one bar in a day: we consider it as "at close"
+    day_ratios[n == 1] = 0.0
 
-    # Group by calendar day
-    for date_val, grp_idx in temp.groupby("date").groups.items():
-        idx = grp_idx  # index positions for this day
-        n = len(idx)
-        if n == 1:
-            # Only one bar: we consider it as "at close"
-            ratios.iloc[idx] = 0.0
-            continue
+    ratios = pd.Series(day_ratios, index=g.index, name=FEATURE_CODE)
 
-        j = np.arange(n, dtype=float)
-        denom = max(1.0, float(n - 1))
-        day_ratios = (denom - j) / denom
+    return ratios
 
-        ratios.iloc[idx] = day_ratios
 
-    return ratios
\ No newline at end of file
+def compute_panel(panel: Panel) -> np.ndarray:
+    """Depends on the shared index only: computed once and broadcast to every symbol."""
+    return panel.broadcast(compute_feature(panel.context(0)))
\ No newline at end of file
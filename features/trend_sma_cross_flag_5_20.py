@@ -1,10 +1,15 @@
 # JUPYTER CELL — feature: trend_sma_cross_flag_5_20
 FEATURE_CODE = "trend_sma_cross_flag_5_20"
+LOOKBACK = 20
+OUTPUT_KIND = "ternary"  # -1 / 0 / +1
 
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.panel import Panel
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     SMA Crossover Flag (5 vs 20)
     Description:
@@ -21,8 +26,7 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     Input / Output / Constraints:
       As per base structure; vectorized; no look-ahead.
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
     s5  = g["close"].rolling(5,  min_periods=5).mean()
     s20 = g["close"].rolling(20, min_periods=20).mean()
@@ -33,4 +37,13 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
 
     flag = np.where(cross_up, 1, np.where(cross_down, -1, 0)).astype(int)
     s = pd.Series(flag, index=g.index, name=FEATURE_CODE)
-    return s
\ No newline at end of file
+    return s
+
+
+def compute_panel(panel: Panel) -> np.ndarray:
+    """compute_feature for all symbols at once, as an (S, T) array."""
+    c = panel["close"]
+    d = c.rolling(5, min_periods=5).mean() - c.rolling(20, min_periods=20).mean()
+    cross_up   = (d > 0) & (d.shift(1) <= 0)
+    cross_down = (d < 0) & (d.shift(1) >= 0)
+    return np.where(cross_up, 1, np.where(cross_down, -1, 0)).T
\ No newline at end of file
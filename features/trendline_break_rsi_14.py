@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: trendline_break_rsi_14
 FEATURE_CODE = "trendline_break_rsi_14"
+LOOKBACK = 26
+OUTPUT_KIND = "flag"  # 0 / 1
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.indicators import net_change_rsi
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     RSI Trendline Breakout Flag (14)
     Description:
@@ -13,10 +17,10 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       - Calculate the 14-period RSI.
       - Detect trendline breakout (RSI crosses its rolling mean).
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    rsi_14 = g["close"].rolling(14).apply(lambda x: 100 - (100 / (1 + (x.diff().clip(0).mean() / x.diff().clip(None).mean()))))
+    # windowed RSI: mean gain over mean net change of the 14-close window
+    rsi_14 = pd.Series(net_change_rsi(g["close"], (14,))[:, 0], index=g.index)
 
     rsi_trendline = rsi_14.rolling(14).mean()
 
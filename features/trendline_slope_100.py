@@ -1,10 +1,14 @@
 # JUPYTER CELL — feature: trendline_slope_100
 FEATURE_CODE = "trendline_slope_100"
+LOOKBACK = 99
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_regression
+from feature_engine.streaming import RollingOls, StreamingFeature
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Trendline Slope (100)
     Description:
@@ -12,31 +16,32 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       idea as reg_lin_slope_W, but with W=100; it measures the per-bar trend
       (positive uptrend, negative downtrend).
     Formula / method (brief):
-      slope_t = cov(t,y) / var(t), where cov/var computed via rolling means.
+      slope_t = cov(t,y) / var(t) on window-local time t = 0..W-1, from
+      incrementally updated window sums.
     Input:
       df: DataFrame with DatetimeIndex (ascending), columns:
            open, high, low, close, volume (case-insensitive)
     Output:
       pd.Series (float), same index as df.index, name == FEATURE_CODE.
     Constraints:
-      - No look-ahead; vectorized with rolling means.
+      - No look-ahead; O(1) per bar (shared rolling regression kernel).
       - Numpy & pandas only.
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    y = g["close"].astype(float)
-    n = len(g)
     W = 100
 
-    t = pd.Series(np.arange(n, dtype=float), index=g.index)
-
-    t_mean = t.rolling(W, min_periods=W).mean()
-    y_mean = y.rolling(W, min_periods=W).mean()
-    cov = (t * y).rolling(W, min_periods=W).mean() - t_mean * y_mean
-    var = (t * t).rolling(W, min_periods=W).mean() - t_mean * t_mean
-
-    slope = cov / var.replace(0.0, np.nan)
+    slope = pd.Series(rolling_regression(g, "close", W).slope, index=g.index)
     slope = slope.astype(float)
     slope.name = FEATURE_CODE
-    return slope
\ No newline at end of file
+    return slope
+
+
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+
+    def reset(self) -> None:
+        self.ols = RollingOls(100)
+
+    def step(self, o, h, l, c, v) -> float:
+        return self.ols.update(c)[0]
\ No newline at end of file
@@ -1,10 +1,15 @@
 # JUPYTER CELL — feature: trendline_touch_flag_100
 FEATURE_CODE = "trendline_touch_flag_100"
+LOOKBACK = 99
+OUTPUT_KIND = "flag"  # 0 / 1
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import rolling_regression
+from feature_engine.streaming import RollingOls, StreamingFeature
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Trendline Touch Flag (100)
     Description:
@@ -24,38 +29,33 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
     Output:
       pd.Series (int), values in {0,1}, same index as df.index, name == FEATURE_CODE.
     Constraints:
-      - No look-ahead; vectorized with rolling means.
+      - No look-ahead; O(1) per bar (shared rolling regression kernel).
       - Numpy & pandas only.
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
 
-    y = g["close"].astype(float)
-    n = len(g)
+    y = g["close"]
     W = 100
     tol_mult = 0.25
 
-    t = pd.Series(np.arange(n, dtype=float), index=g.index)
-
-    t_mean = t.rolling(W, min_periods=W).mean()
-    y_mean = y.rolling(W, min_periods=W).mean()
-    ty_mean = (t * y).rolling(W, min_periods=W).mean()
-    t2_mean = (t * t).rolling(W, min_periods=W).mean()
-    y2_mean = (y * y).rolling(W, min_periods=W).mean()
-
-    cov_ty = ty_mean - t_mean * y_mean
-    var_t  = t2_mean - t_mean * t_mean
-    var_y  = y2_mean - y_mean * y_mean
-
-    slope = cov_ty / var_t.replace(0.0, np.nan)
-    intercept = y_mean - slope * t_mean
-    reg_line = slope * t + intercept
+    ols = rolling_regression(g, "close", W)
+    reg_line = pd.Series(ols.fitted, index=g.index)
 
     # residual & residual std
     resid = y - reg_line
-    r = cov_ty / (np.sqrt(var_t) * np.sqrt(var_y))
-    resid_std = np.sqrt(np.clip(var_y * (1.0 - r * r), a_min=0.0, a_max=None))
+    resid_std = pd.Series(ols.resid_std, index=g.index)
 
     flag = (resid.abs() <= (tol_mult * resid_std)).astype(int)
     flag.name = FEATURE_CODE
-    return flag
\ No newline at end of file
+    return flag
+
+
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+
+    def reset(self) -> None:
+        self.ols = RollingOls(100)
+
+    def step(self, o, h, l, c, v) -> float:
+        _, reg_line, resid_std = self.ols.update(c)
+        return float(abs(c - reg_line) <= 0.25 * resid_std)
\ No newline at end of file
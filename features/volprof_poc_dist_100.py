@@ -1,10 +1,13 @@
 # JUPYTER CELL — feature: volprof_poc_dist_100 (robust)
 FEATURE_CODE = "volprof_poc_dist_100"
+LOOKBACK = 99
 
-import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.primitives import volume_profile_levels
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Volume Profile POC distance (100)
     Description:
@@ -21,34 +24,14 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
       pd.Series (float), same index, name == FEATURE_CODE; initial NaNs allowed.
     Constraints:
       - No look-ahead. Uses only current/past data.
-      - Numpy/Pandas only (loop over windows; reliable across pandas versions).
+      - Profile from the shared sliding volume-profile engine (one pass for POC/VAL/VAH).
     """
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
+    g = as_context(df)
     if not {"close","volume"}.issubset(g.columns):
         raise ValueError("DataFrame must contain 'close' and 'volume'.")
 
     c = g["close"].to_numpy(float)
-    v = g["volume"].to_numpy(float)
-    n = len(g); W = 100; BINS = 50
-
-    level = np.full(n, np.nan, float)
-
-    for i in range(W-1, n):
-        cs = c[i-W+1:i+1]
-        vs = v[i-W+1:i+1]
-        m = np.isfinite(cs) & np.isfinite(vs)
-        if m.sum() < 3:
-            continue
-        cs = cs[m]; vs = vs[m]
-        pmin, pmax = cs.min(), cs.max()
-        if not np.isfinite(pmin) or not np.isfinite(pmax) or pmax <= pmin:
-            continue
-        hist, edges = np.histogram(cs, bins=BINS, range=(pmin, pmax), weights=vs)
-        if hist.size == 0 or np.all(hist <= 0):
-            continue
-        j = int(np.argmax(hist))
-        level[i] = 0.5 * (edges[j] + edges[j+1])
+    level = volume_profile_levels(g, window=100, bins=50)[0]
 
     s = (c - level) / c
     s = pd.Series(s, index=g.index, dtype=float, name=FEATURE_CODE)
@@ -1,10 +1,17 @@
 # JUPYTER CELL — feature: wick_rejection_intensity_10
 FEATURE_CODE = "wick_rejection_intensity_10"
+LOOKBACK = 9
 
+import math
 import numpy as np
 import pandas as pd
 
-def compute_feature(df: pd.DataFrame) -> pd.Series:
+from feature_engine.context import FrameLike, as_context
+from feature_engine.moments import RollingMoments
+from feature_engine.primitives import candle_column
+from feature_engine.streaming import RollingMean, RollingStd, StreamingFeature
+
+def compute_feature(df: FrameLike) -> pd.Series:
     """
     Wick Rejection Intensity (10-bar z-score)
 
@@ -34,33 +41,40 @@ def compute_feature(df: pd.DataFrame) -> pd.Series:
         Positive values = unusually large wick relative to the last 10 bars.
     """
 
-    g = df.copy()
-    g.columns = [str(c).lower() for c in g.columns]
-
-    high  = g["high"].astype(float)
-    low   = g["low"].astype(float)
-    open_ = g["open"].astype(float)
-    close = g["close"].astype(float)
+    g = as_context(df)
 
     eps = 1e-9
 
-    upper_body = np.maximum(open_, close)
-    lower_body = np.minimum(open_, close)
-
-    upper_wick = (high - upper_body).clip(lower=0.0)
-    lower_wick = (lower_body - low).clip(lower=0.0)
-
-    wick_size = np.maximum(upper_wick, lower_wick)
-    tr = (high - low).abs()
-
-    raw_intensity = wick_size / (tr + eps)
-    raw_intensity = raw_intensity.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+    # step 1 from the fused candle scan (non-finite -> 0)
+    raw_intensity = candle_column(g, "wick_intensity")
 
     win = 10
-    mean_10 = raw_intensity.rolling(win, min_periods=1).mean()
-    std_10  = raw_intensity.rolling(win, min_periods=1).std(ddof=0)
+    moments = RollingMoments(raw_intensity.to_numpy())
+    mean_10 = pd.Series(moments.mean(win, min_periods=1), index=g.index)
+    std_10  = pd.Series(moments.std(win, min_periods=1, ddof=0), index=g.index)
 
     z_score = (raw_intensity - mean_10) / (std_10 + eps)
     z_score = z_score.replace([np.inf, -np.inf], np.nan).fillna(0.0)
 
-    return pd.Series(z_score.values, index=g.index, name=FEATURE_CODE)
\ No newline at end of file
+    return pd.Series(z_score.values, index=g.index, name=FEATURE_CODE)
+
+
+class FeatureStream(StreamingFeature):
+    """Live counterpart of compute_feature: one O(1) update per bar."""
+
+    def reset(self) -> None:
+        self.mean = RollingMean(10, min_periods=1)
+        self.std = RollingStd(10, min_periods=1, ddof=0)
+
+    def step(self, o, h, l, c, v) -> float:
+        eps = 1e-9
+        # NaN-propagating body bounds and wicks, as in the batch (NaN -> raw 0.0 below)
+        if o != o or c != c or h != h or l != l:
+            wick_size = math.nan
+        else:
+            wick_size = max(max(h - max(o, c), 0.0), max(min(o, c) - l, 0.0))
+        raw = wick_size / (abs(h - l) + eps)
+        if not math.isfinite(raw):
+            raw = 0.0
+        z = (raw - self.mean.update(raw)) / (self.std.update(raw) + eps)
+        return z if math.isfinite(z) else 0.0
\ No newline at end of file
@@ -1,42 +1,30 @@
 import os
 import re
+import sys
 import json
 
+from feature_engine.manifest import MANIFEST_NAME, write_manifest
 
-def extract_features_from_notebook(
-    notebook_path: str = "Market_Trader.ipynb",
-    output_dir: str = "features",
-):
-    """
-    Extracts feature cells into separate .py files.
 
-    - Primary source of filename: FEATURE_CODE = "..."
-    - Fallback: header comment `# JUPYTER CELL — feature: name`
-    """
+HEADER_PATTERN = re.compile(
+    r"#\s*JUPYTER\s+CELL\b.*?feature:\s*([a-zA-Z0-9_]+)",
+    re.IGNORECASE | re.DOTALL,
+)
+FEATURE_CODE_PATTERN = re.compile(
+    r'FEATURE_CODE\s*=\s*["\']([^"\']+)["\']'
+)
+
 
+def _load_notebook(notebook_path):
     if not os.path.exists(notebook_path):
         raise FileNotFoundError(f"Notebook not found: {notebook_path}")
-
-    os.makedirs(output_dir, exist_ok=True)
-
     with open(notebook_path, "r", encoding="utf-8") as f:
-        nb = json.load(f)
-
-    cells = nb.get("cells", [])
-    feature_count = 0
+        return json.load(f)
 
-    # Header pattern (dash can be anything, we allow anything between CELL and feature)
-    header_pattern = re.compile(
-        r"#\s*JUPYTER\s+CELL\b.*?feature:\s*([a-zA-Z0-9_]+)",
-        re.IGNORECASE | re.DOTALL,
-    )
 
-    # FEATURE_CODE pattern
-    feature_code_pattern = re.compile(
-        r'FEATURE_CODE\s*=\s*["\']([^"\']+)["\']'
-    )
-
-    for cell in cells:
+def _feature_cells(nb):
+    """Yield (cell, feature_name, module_code) for every feature cell of `nb`."""
+    for cell in nb.get("cells", []):
         if cell.get("cell_type") != "code":
             continue
 
@@ -51,14 +39,14 @@ def extract_features_from_notebook(
             cell_code = str(source)
 
         # 1) Try to get name from FEATURE_CODE
-        fc_match = feature_code_pattern.search(cell_code)
+        fc_match = FEATURE_CODE_PATTERN.search(cell_code)
         feature_name = None
 
         if fc_match:
             feature_name = fc_match.group(1).strip()
         else:
             # 2) Fallback: header feature name
-            h_match = header_pattern.search(cell_code)
+            h_match = HEADER_PATTERN.search(cell_code)
             if h_match:
                 feature_name = h_match.group(1).strip()
 
@@ -66,15 +54,12 @@ def extract_features_from_notebook(
             # Not a feature cell
             continue
 
-        feature_filename = f"{feature_name}.py"
-        feature_path = os.path.join(output_dir, feature_filename)
-
         cleaned_code = cell_code.strip()
 
         # Ensure FEATURE_CODE exists and matches the chosen name
         if fc_match:
             # Normalize existing FEATURE_CODE
-            cleaned_code = feature_code_pattern.sub(
+            cleaned_code = FEATURE_CODE_PATTERN.sub(
                 f'FEATURE_CODE = "{feature_name}"',
                 cleaned_code,
                 count=1,
@@ -84,17 +69,123 @@ def extract_features_from_notebook(
             prefix = f'FEATURE_CODE = "{feature_name}"\n\n'
             cleaned_code = prefix + cleaned_code
 
+        yield cell, feature_name, cleaned_code
+
+
+def _module_cells(nb):
+    """{feature_name: (cell, module_code)} of `nb`; a later cell with the same name wins."""
+    return {name: (cell, code) for cell, name, code in _feature_cells(nb)}
+
+
+def _read_module(feature_path):
+    if not os.path.exists(feature_path):
+        return None
+    with open(feature_path, "r", encoding="utf-8") as in_f:
+        return in_f.read()
+
+
+def extract_features_from_notebook(
+    notebook_path: str = "Market_Trader.ipynb",
+    output_dir: str = "features",
+):
+    """
+    Extracts feature cells into separate .py files.
+
+    - Primary source of filename: FEATURE_CODE = "..."
+    - Fallback: header comment `# JUPYTER CELL — feature: name`
+    - If several cells share a name, the last one wins.
+    - Files whose content is unchanged are not rewritten.
+    - Afterwards the feature manifest (feature_engine.manifest) is updated;
+      only modules that changed are re-described.
+
+    The cells are the source of the modules: a module edited in place is
+    overwritten by its cell, so edits made under features/ must be copied
+    back first (`sync_notebook_from_features`, `python sepratore.py --sync`).
+    """
+    nb = _load_notebook(notebook_path)
+    os.makedirs(output_dir, exist_ok=True)
+
+    feature_count = 0
+    changed_count = 0
+
+    for feature_name, (_, cleaned_code) in _module_cells(nb).items():
+        feature_path = os.path.join(output_dir, f"{feature_name}.py")
+        feature_count += 1
+
+        if _read_module(feature_path) == cleaned_code:
+            continue
+
         with open(feature_path, "w", encoding="utf-8") as out_f:
             out_f.write(cleaned_code)
 
-        feature_count += 1
-        print(f"✓ Created: {feature_path}")
+        changed_count += 1
+        print(f"✓ Written: {feature_path}")
+
+    print(f"\nDone. Extracted {feature_count} feature file(s) into '{output_dir}' "
+          f"({changed_count} new or changed).")
+
+    manifest = write_manifest(output_dir)
+    print(f"✓ Manifest: {os.path.join(output_dir, MANIFEST_NAME)} ({len(manifest)} feature(s))")
+
+
+def notebook_drift(
+    notebook_path: str = "Market_Trader.ipynb",
+    output_dir: str = "features",
+):
+    """
+    Feature names on which the notebook and `output_dir` disagree: cells
+    whose module is missing or differs from what extraction would write,
+    and modules without a cell.
+    """
+    nb = _load_notebook(notebook_path)
+    drift = []
+    cells = _module_cells(nb)
+    for feature_name, (_, cleaned_code) in cells.items():
+        if _read_module(os.path.join(output_dir, f"{feature_name}.py")) != cleaned_code:
+            drift.append(feature_name)
+    if os.path.isdir(output_dir):
+        for filename in sorted(os.listdir(output_dir)):
+            name, ext = os.path.splitext(filename)
+            if ext == ".py" and not name.startswith("_") and name not in cells:
+                drift.append(name)
+    return drift
+
+
+def sync_notebook_from_features(
+    notebook_path: str = "Market_Trader.ipynb",
+    output_dir: str = "features",
+):
+    """
+    Copies the module sources of `output_dir` back into their feature cells,
+    so extraction reproduces the modules as they are. Returns the names of
+    the cells that changed.
+    """
+    nb = _load_notebook(notebook_path)
+    changed = []
+    for feature_name, (cell, cleaned_code) in _module_cells(nb).items():
+        module_code = _read_module(os.path.join(output_dir, f"{feature_name}.py"))
+        if module_code is None or module_code == cleaned_code:
+            continue
+        cell["source"] = module_code.splitlines(keepends=True)
+        changed.append(feature_name)
+        print(f"✓ Updated cell: {feature_name}")
 
-    print(f"\nDone. Extracted {feature_count} feature file(s) into '{output_dir}'.")
+    if changed:
+        with open(notebook_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(nb, indent=1, ensure_ascii=False) + "\n")
+    return changed
 
 
 if __name__ == "__main__":
-    extract_features_from_notebook(
-        notebook_path="Market_Trader.ipynb",
-        output_dir="features",
-    )
+    if "--check" in sys.argv[1:]:
+        drift = notebook_drift(notebook_path="Market_Trader.ipynb", output_dir="features")
+        for name in drift:
+            print(f"✗ Out of sync: {name}")
+        sys.exit(1 if drift else 0)
+    elif "--sync" in sys.argv[1:]:
+        sync_notebook_from_features(notebook_path="Market_Trader.ipynb", output_dir="features")
+    else:
+        extract_features_from_notebook(
+            notebook_path="Market_Trader.ipynb",
+            output_dir="features",
+        )
@@ -0,0 +1,31 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from feature_engine.synthetic import make_consecutive_ohlcv  # noqa: E402
+from helpers import inject_nans  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def ohlcv() -> pd.DataFrame:
+    return make_consecutive_ohlcv(3000, seed=0, vol_per_bar=0.01)
+
+
+@pytest.fixture(scope="session")
+def ohlcv_nan(ohlcv) -> pd.DataFrame:
+    return inject_nans(ohlcv)
+
+
+@pytest.fixture(scope="session")
+def ohlcv_ties() -> pd.DataFrame:
+    # whole-unit closes and a handful of volume sizes: histogram bins and
+    # value-area cumsums tie all the time
+    df = make_consecutive_ohlcv(20000, seed=3, start_price=2000, drift_per_bar=0.0, vol_per_bar=0.002)
+    df["close"] = df["close"].round()
+    df["volume"] = np.random.default_rng(3).choice([0.0, 0.1, 0.2, 0.3], size=len(df))
+    return df
@@ -0,0 +1,19 @@
+"""Shared test helpers (tests/ is on sys.path via conftest)."""
+import numpy as np
+import pandas as pd
+
+
+def inject_nans(df: pd.DataFrame, per_column: int = 40, seed: int = 3) -> pd.DataFrame:
+    """Copy of `df` with NaNs at random bars of each column separately, plus a fully missing stretch."""
+    rng = np.random.default_rng(seed)
+    out = df.copy()
+    for j in range(out.shape[1]):
+        out.iloc[rng.choice(len(out), per_column, replace=False), j] = np.nan
+    out.iloc[len(out) // 3:len(out) // 3 + 3] = np.nan
+    return out
+
+
+def assert_same(actual, expected, rtol: float = 0.0, atol: float = 0.0) -> None:
+    """Equal values and NaN positions (to `rtol` / `atol` where given)."""
+    np.testing.assert_allclose(np.asarray(actual, dtype=np.float64), np.asarray(expected, dtype=np.float64),
+                               rtol=rtol, atol=atol, equal_nan=True)
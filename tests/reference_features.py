@@ -0,0 +1,1960 @@
+"""
+Reference pandas formulations of the feature modules.
+
+Each function is the body of a module's compute_feature as it was written
+before the module moved onto feature_engine primitives (fused scans,
+sparse tables, compiled kernels, prefix sums): plain pandas / numpy on a
+copy of the frame. test_parity checks the modules against them. Features
+whose definition changed on purpose (causal session statistics, prior
+day / week zones from calendar bars) have no entry.
+"""
+import numpy as np
+import pandas as pd
+
+
+def band_gauss_lower_dist_20_2(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    ma20 = g["close"].rolling(20, min_periods=20).mean()
+    sd20 = g["close"].rolling(20, min_periods=20).std(ddof=0)
+    lower = ma20 - 2 * sd20
+
+    s = (g["close"].astype(float) - lower) / g["close"].astype(float)
+    s = s.astype(float); s.name = "band_gauss_lower_dist_20_2"
+    return s
+
+
+def band_gauss_upper_dist_20_2(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    ma20 = g["close"].rolling(20, min_periods=20).mean()
+    sd20 = g["close"].rolling(20, min_periods=20).std(ddof=0)  # population std
+    upper = ma20 + 2.0 * sd20
+
+    s = (g["close"].astype(float) - upper) / g["close"].astype(float)
+    s = s.astype(float); s.name = "band_gauss_upper_dist_20_2"
+    return s
+
+
+def break_prev_high_flag_1(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    prev_high = g["high"].shift(1)
+    flag = (g["close"] > prev_high).astype(int)
+
+    s = pd.Series(flag, index=g.index, name="break_prev_high_flag_1")
+    return s
+
+
+def break_prev_low_flag_1(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    prev_low = g["low"].shift(1)
+    flag = (g["close"] < prev_low).astype(int)
+
+    s = pd.Series(flag, index=g.index, name="break_prev_low_flag_1")
+    return s
+
+
+def breaker_block_distance_20(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    close = g["close"].astype(float)
+    high = g["high"].astype(float)
+    low = g["low"].astype(float)
+
+    dir_sign = np.sign(close - close.shift(1)).fillna(0.0)
+    rh = high.rolling(20, min_periods=20).max()
+    rl = low.rolling(20, min_periods=20).min()
+
+    breaker_level = np.where(dir_sign >= 0, rh.shift(1), rl.shift(1))
+    breaker_level = pd.Series(breaker_level, index=g.index)
+
+    dist = (close - breaker_level) / close.replace(0.0, np.nan)
+    s = dist.astype(float)
+    s.name = "breaker_block_distance_20"
+    return s
+
+
+def breaker_retest_flag_20(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    close = g["close"].astype(float)
+    high = g["high"].astype(float)
+    low = g["low"].astype(float)
+
+    rh = high.rolling(20, min_periods=20).max()
+    rl = low.rolling(20, min_periods=20).min()
+
+    tol = 0.001  # 0.1% tolerance around extremum
+    near_high = (np.abs(close - rh) / close.replace(0.0, np.nan)) <= tol
+    near_low = (np.abs(close - rl) / close.replace(0.0, np.nan)) <= tol
+
+    flag = (near_high | near_low).astype(int)
+    s = pd.Series(flag, index=g.index, name="breaker_retest_flag_20")
+    return s
+
+
+def candle_engulf_strength_5(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    o = g["open"].astype(float)
+    c = g["close"].astype(float)
+    h = g["high"].astype(float)
+    l = g["low"].astype(float)
+
+    body = (c - o).abs()
+    prev_body = body.shift(1)
+    dir_curr = np.sign(c - o)
+    dir_prev = np.sign(c.shift(1) - o.shift(1))
+
+    engulf_range = (h >= h.shift(1)) & (l <= l.shift(1))
+    opposite_dir = (dir_curr * dir_prev) < 0
+    bigger_body = body > prev_body
+
+    engulf_flag = (engulf_range & opposite_dir & bigger_body).astype(int)
+    max_body_5 = body.rolling(5, min_periods=1).max()
+
+    strength = np.where(engulf_flag == 1, body / max_body_5.replace(0.0, np.nan), 0.0)
+    s = pd.Series(strength, index=g.index, name="candle_engulf_strength_5").astype(float)
+    return s
+
+
+def channel_reg_lower_dist_50(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    y = g["close"].astype(float)
+    n = len(g)
+    W = 50
+
+    t = pd.Series(np.arange(n, dtype=float), index=g.index)
+
+    t_mean = t.rolling(W, min_periods=W).mean()
+    y_mean = y.rolling(W, min_periods=W).mean()
+    ty_mean = (t * y).rolling(W, min_periods=W).mean()
+    t2_mean = (t * t).rolling(W, min_periods=W).mean()
+    y2_mean = (y * y).rolling(W, min_periods=W).mean()
+
+    cov_ty = ty_mean - t_mean * y_mean
+    var_t  = t2_mean - t_mean * t_mean
+    var_y  = y2_mean - y_mean * y_mean
+
+    slope = cov_ty / var_t.replace(0.0, np.nan)
+    intercept = y_mean - slope * t_mean
+    reg_line = slope * t + intercept
+
+    r = cov_ty / (np.sqrt(var_t) * np.sqrt(var_y))
+    resid_std = np.sqrt(np.clip(var_y * (1.0 - r * r), a_min=0.0, a_max=None))
+
+    m = 1.0
+    lower = reg_line - m * resid_std
+
+    s = (y - lower) / y
+    s = s.astype(float)
+    s.name = "channel_reg_lower_dist_50"
+    return s
+
+
+def channel_reg_upper_dist_50(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    y = g["close"].astype(float)
+    n = len(g)
+    W = 50
+
+    # time index as float (global positions 0..n-1)
+    t = pd.Series(np.arange(n, dtype=float), index=g.index)
+
+    # rolling means
+    t_mean = t.rolling(W, min_periods=W).mean()
+    y_mean = y.rolling(W, min_periods=W).mean()
+    ty_mean = (t * y).rolling(W, min_periods=W).mean()
+    t2_mean = (t * t).rolling(W, min_periods=W).mean()
+    y2_mean = (y * y).rolling(W, min_periods=W).mean()
+
+    cov_ty = ty_mean - t_mean * y_mean
+    var_t  = t2_mean - t_mean * t_mean
+    var_y  = y2_mean - y_mean * y_mean
+
+    slope = cov_ty / var_t.replace(0.0, np.nan)
+    intercept = y_mean - slope * t_mean
+    reg_line = slope * t + intercept
+
+    # correlation r and residual std ≈ sqrt(var_y * (1 - r^2))
+    r = cov_ty / (np.sqrt(var_t) * np.sqrt(var_y))
+    resid_std = np.sqrt(np.clip(var_y * (1.0 - r * r), a_min=0.0, a_max=None))
+
+    # channel upper with multiplier m=1.0 (change if desired)
+    m = 1.0
+    upper = reg_line + m * resid_std
+
+    s = (y - upper) / y
+    s = s.astype(float)
+    s.name = "channel_reg_upper_dist_50"
+    return s
+
+
+def displacement_strength_10(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    c = g["close"].astype(float)
+    h = g["high"].astype(float)
+    l = g["low"].astype(float)
+    prev_c = c.shift(1)
+
+    tr = (h - l).combine((h - prev_c).abs(), np.maximum).combine((l - prev_c).abs(), np.maximum)
+    atr = tr.rolling(10, min_periods=1).mean().replace(0.0, np.nan)
+
+    s = (c - prev_c).abs() / atr
+    s = s.astype(float)
+    s.name = "displacement_strength_10"
+    return s
+
+
+def ent_perm_close_30(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+    c = g["close"].astype(float)
+
+    def window_entropy(x: np.ndarray) -> float:
+        if len(x) < 3:
+            return np.nan
+        # Rank discretization
+        ranks = pd.Series(x).rank(method="average").values
+        # Bin into 5 quantile-buckets
+        qs = np.quantile(ranks, [0.2, 0.4, 0.6, 0.8])
+        bins = np.digitize(ranks, qs)
+        counts = np.bincount(bins, minlength=5).astype(float)
+        p = counts / counts.sum() if counts.sum() > 0 else counts
+        p = p[p > 0]
+        if len(p) == 0:
+            return np.nan
+        ent = -np.sum(p * np.log(p))
+        # Max entropy with 5 bins
+        ent_norm = ent / np.log(5.0)
+        return float(ent_norm)
+
+    s = c.rolling(30, min_periods=10).apply(window_entropy, raw=True)
+    s = s.astype(float)
+    s.name = "ent_perm_close_30"
+    return s
+
+
+def equal_highs_tightness_20(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    h = g["high"].astype(float)
+    c = g["close"].astype(float)
+
+    max_h = h.rolling(20, min_periods=5).max()
+    min_h = h.rolling(20, min_periods=5).min()
+
+    tightness = (max_h - min_h) / c.replace(0.0, np.nan)
+    s = tightness.astype(float)
+    s.name = "equal_highs_tightness_20"
+    return s
+
+
+def equal_lows_tightness_20(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    l = g["low"].astype(float)
+    c = g["close"].astype(float)
+
+    max_l = l.rolling(20, min_periods=5).max()
+    min_l = l.rolling(20, min_periods=5).min()
+
+    tightness = (max_l - min_l) / c.replace(0.0, np.nan)
+    s = tightness.astype(float)
+    s.name = "equal_lows_tightness_20"
+    return s
+
+
+def fib_extension_near_1_272(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"].rolling(2, min_periods=2).max()
+    low = g["low"].rolling(2, min_periods=2).min()
+
+    fib_1_272 = (high - low) * 1.272 + low
+
+    epsilon = 0.01  # proximity range, you can adjust this value
+    flag = (abs(g["close"] - fib_1_272) / g["close"] <= epsilon).astype(int)
+
+    s = pd.Series(flag, index=g.index, name="fib_extension_near_1_272")
+    return s
+
+
+def fib_extension_near_1_618(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"].rolling(2, min_periods=2).max()
+    low = g["low"].rolling(2, min_periods=2).min()
+
+    fib_1_618 = (high - low) * 1.618 + low
+
+    epsilon = 0.01  # proximity range, you can adjust this value
+    flag = (abs(g["close"] - fib_1_618) / g["close"] <= epsilon).astype(int)
+
+    s = pd.Series(flag, index=g.index, name="fib_extension_near_1_618")
+    return s
+
+
+def fib_retracement_near_0_500(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"].rolling(2, min_periods=2).max()
+    low = g["low"].rolling(2, min_periods=2).min()
+
+    fib_0_500 = (high - low) * 0.500 + low
+
+    epsilon = 0.01  # proximity range, you can adjust this value
+    flag = (abs(g["close"] - fib_0_500) / g["close"] <= epsilon).astype(int)
+
+    s = pd.Series(flag, index=g.index, name="fib_retracement_near_0_500")
+    return s
+
+
+def fib_retracement_near_0_618(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"].rolling(2, min_periods=2).max()
+    low = g["low"].rolling(2, min_periods=2).min()
+
+    fib_0_618 = (high - low) * 0.618 + low
+
+    epsilon = 0.01  # proximity range, you can adjust this value
+    flag = (abs(g["close"] - fib_0_618) / g["close"] <= epsilon).astype(int)
+
+    s = pd.Series(flag, index=g.index, name="fib_retracement_near_0_618")
+    return s
+
+
+def filt_dema_20(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    c = g["close"].astype(float)
+
+    ema1 = c.ewm(span=20, adjust=False).mean()
+    ema2 = ema1.ewm(span=20, adjust=False).mean()
+    dema = 2.0 * ema1 - ema2
+
+    s = dema.astype(float)
+    s.name = "filt_dema_20"
+    return s
+
+
+def filt_gauss_close_20(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+    c = g["close"].astype(float)
+
+    window = 20
+    idx = np.arange(window)
+    # center at current bar (0) and decay into the past
+    sigma = window / 4.0
+    weights = np.exp(-0.5 * (idx / sigma) ** 2)
+    weights = weights[::-1]  # bigger weight on most recent
+    weights /= weights.sum()
+
+    def gauss(x: np.ndarray) -> float:
+        if len(x) < window:
+            w = weights[-len(x):]
+        else:
+            w = weights
+        return float(np.sum(x * w))
+
+    s = c.rolling(window, min_periods=3).apply(gauss, raw=True)
+    s = s.astype(float)
+    s.name = "filt_gauss_close_20"
+    return s
+
+
+def filt_savgol_11_3(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+    c = g["close"].astype(float)
+
+    def sg_causal(x: np.ndarray) -> float:
+        n = len(x)
+        if n < 5:
+            return float(x[-1])
+        # Fit poly of degree 3 on indices [0..n-1], return fitted value at last index
+        xs = np.arange(n, dtype=float)
+        coeffs = np.polyfit(xs, x, deg=3)
+        val = np.polyval(coeffs, xs[-1])
+        return float(val)
+
+    s = c.rolling(11, min_periods=5).apply(sg_causal, raw=True)
+    s = s.astype(float)
+    s.name = "filt_savgol_11_3"
+    return s
+
+
+def fvg_creation_flag_1(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    price_gap = abs(g["open"] - g["close"].shift(1))
+
+    # Set threshold for large gap (FVG), e.g., 0.01 or any custom logic
+    threshold = 0.01
+
+    fvg_flag = (price_gap > threshold).astype(int)
+
+    s = pd.Series(fvg_flag, index=g.index, name="fvg_creation_flag_1")
+    return s
+
+
+def fvg_fill_ratio_30(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"].astype(float).values
+    low  = g["low"].astype(float).values
+
+    n = len(g)
+
+    fill_ratio = np.zeros(n, dtype=float)
+
+    current_gap_low = np.nan
+    current_gap_high = np.nan
+    covered_low = np.nan
+    covered_high = np.nan
+    gap_start_idx = None
+    max_lifetime = 30
+
+    for i in range(n):
+        h = high[i]
+        l = low[i]
+
+        # 1) If there is an active gap, update fill
+        if not np.isnan(current_gap_low):
+            # Overlap between current candle and gap
+            overlap_low = max(l, current_gap_low)
+            overlap_high = min(h, current_gap_high)
+
+            if overlap_high > overlap_low:
+                if np.isnan(covered_low):
+                    covered_low = overlap_low
+                    covered_high = overlap_high
+                else:
+                    covered_low = min(covered_low, overlap_low)
+                    covered_high = max(covered_high, overlap_high)
+
+            gap_size = current_gap_high - current_gap_low
+            if gap_size > 0:
+                if np.isnan(covered_low):
+                    covered_size = 0.0
+                else:
+                    covered_size = max(0.0, covered_high - covered_low)
+                fill_ratio[i] = covered_size / gap_size
+            else:
+                fill_ratio[i] = 0.0
+
+            # Expire if fully filled or too old
+            if gap_start_idx is not None:
+                if (gap_size <= 0) or (covered_size >= gap_size) or (i - gap_start_idx >= max_lifetime):
+                    current_gap_low = np.nan
+                    current_gap_high = np.nan
+                    covered_low = np.nan
+                    covered_high = np.nan
+                    gap_start_idx = None
+
+        # 2) If no active gap, check for a new FVG at this bar
+        if np.isnan(current_gap_low) and i >= 2:
+            h_2 = high[i - 2]
+            l_2 = low[i - 2]
+
+            # Bullish FVG (gap above bar n-2)
+            if l > h_2:
+                current_gap_low = h_2
+                current_gap_high = l
+                gap_start_idx = i
+                covered_low = np.nan
+                covered_high = np.nan
+
+            # Bearish FVG (gap below bar n-2)
+            elif h < l_2:
+                current_gap_low = h
+                current_gap_high = l_2
+                gap_start_idx = i
+                covered_low = np.nan
+                covered_high = np.nan
+
+        # If no gap, fill_ratio[i] stays as previous (default 0.0)
+
+    s = pd.Series(fill_ratio, index=g.index, name="fvg_fill_ratio_30")
+    return s
+
+
+def ichimoku_cloud_thickness_52(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    hi9  = g["high"].rolling(9,  min_periods=9 ).max()
+    lo9  = g["low"] .rolling(9,  min_periods=9 ).min()
+    tenk = (hi9 + lo9) / 2.0
+
+    hi26 = g["high"].rolling(26, min_periods=26).max()
+    lo26 = g["low"] .rolling(26, min_periods=26).min()
+    kij  = (hi26 + lo26) / 2.0
+
+    span_a = (tenk + kij) / 2.0
+    hi52 = g["high"].rolling(52, min_periods=52).max()
+    lo52 = g["low"] .rolling(52, min_periods=52).min()
+    span_b = (hi52 + lo52) / 2.0
+
+    thickness = (span_a - span_b).abs() / g["close"].astype(float)
+    thickness = thickness.astype(float)
+    thickness.name = "ichimoku_cloud_thickness_52"
+    return thickness
+
+
+def ichimoku_kijun_dist_26(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    hi26 = g["high"].rolling(26, min_periods=26).max()
+    lo26 = g["low"].rolling(26, min_periods=26).min()
+    kijun = (hi26 + lo26) / 2.0
+
+    s = (g["close"].astype(float) - kijun) / g["close"].astype(float)
+    s = s.astype(float); s.name = "ichimoku_kijun_dist_26"
+    return s
+
+
+def ichimoku_span_a_dist_52(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    hi9  = g["high"].rolling(9,  min_periods=9 ).max()
+    lo9  = g["low"] .rolling(9,  min_periods=9 ).min()
+    tenk = (hi9 + lo9) / 2.0
+
+    hi26 = g["high"].rolling(26, min_periods=26).max()
+    lo26 = g["low"] .rolling(26, min_periods=26).min()
+    kij  = (hi26 + lo26) / 2.0
+
+    span_a = (tenk + kij) / 2.0  # lag-aligned (no forward shift)
+    s = (g["close"].astype(float) - span_a) / g["close"].astype(float)
+    s = s.astype(float); s.name = "ichimoku_span_a_dist_52"
+    return s
+
+
+def ichimoku_span_b_dist_52(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    hi52 = g["high"].rolling(52, min_periods=52).max()
+    lo52 = g["low"] .rolling(52, min_periods=52).min()
+    span_b = (hi52 + lo52) / 2.0
+
+    s = (g["close"].astype(float) - span_b) / g["close"].astype(float)
+    s = s.astype(float); s.name = "ichimoku_span_b_dist_52"
+    return s
+
+
+def ichimoku_tenkan_dist_9(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    hi9 = g["high"].rolling(9, min_periods=9).max()
+    lo9 = g["low"].rolling(9, min_periods=9).min()
+    tenkan = (hi9 + lo9) / 2.0
+
+    s = (g["close"].astype(float) - tenkan) / g["close"].astype(float)
+    s = s.astype(float); s.name = "ichimoku_tenkan_dist_9"
+    return s
+
+
+def internal_range_shift_20(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    c = g["close"].astype(float)
+    h = g["high"].astype(float)
+    l = g["low"].astype(float)
+
+    hi20 = h.rolling(20, min_periods=5).max()
+    lo20 = l.rolling(20, min_periods=5).min()
+    rng = (hi20 - lo20).replace(0.0, np.nan)
+
+    pos = (c - lo20) / rng
+    shift = pos - pos.shift(1)
+
+    s = shift.astype(float)
+    s.name = "internal_range_shift_20"
+    return s
+
+
+def liq_zone_strength_50(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"]
+    low = g["low"]
+    volume = g["volume"]
+
+    liquidity_strength = (volume * (high - low)).rolling(50, min_periods=50).sum() / (high - low).rolling(50, min_periods=50).sum()
+
+    s = liquidity_strength.astype(float)
+    s.name = "liq_zone_strength_50"
+    return s
+
+
+def liq_zone_touch_flag_50(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"]
+    low = g["low"]
+
+    liquidity_zone_high = high.rolling(50, min_periods=50).max()
+    liquidity_zone_low = low.rolling(50, min_periods=50).min()
+
+    epsilon = 0.01  # proximity range
+    flag = ((g["close"] >= liquidity_zone_low - epsilon) & (g["close"] <= liquidity_zone_high + epsilon)).astype(int)
+
+    s = pd.Series(flag, index=g.index, name="liq_zone_touch_flag_50")
+    return s
+
+
+def liquidity_grab_efficiency_10(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"].astype(float)
+    low = g["low"].astype(float)
+    close = g["close"].astype(float)
+    open_ = g["open"].astype(float)
+
+    lookback = 10
+
+    # Prior N-bar extremes (shifted to avoid using current bar)
+    prior_high = high.rolling(lookback, min_periods=lookback).max().shift(1)
+    prior_low  = low .rolling(lookback, min_periods=lookback).min().shift(1)
+
+    # Conditions for sweeps
+    up_grab   = (high > prior_high) & (close < prior_high)
+    down_grab = (low  < prior_low ) & (close > prior_low)
+
+    # Candle range
+    tr = (high - low).replace(0.0, np.nan)
+
+    upper_body = np.maximum(open_, close)
+    lower_body = np.minimum(open_, close)
+
+    wick_above = (high - upper_body).clip(lower=0.0)
+    wick_below = (lower_body - low).clip(lower=0.0)
+
+    eff_up   = np.where(up_grab,   wick_above / tr, 0.0)
+    eff_down = np.where(down_grab, wick_below / tr, 0.0)
+
+    eff = np.nan_to_num(eff_up + eff_down)
+
+    return pd.Series(eff, index=g.index, name="liquidity_grab_efficiency_10")
+
+
+def liquidity_rebuild_speed_20(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"].astype(float)
+    low = g["low"].astype(float)
+    close = g["close"].astype(float)
+
+    win = 20
+    lag = 5
+
+    high20 = high.rolling(win).max()
+    low20  = low .rolling(win).min()
+    mid20  = (high20 + low20) / 2
+    range20 = (high20 - low20).replace(0.0, np.nan)
+
+    dist_norm = (close - mid20).abs() / range20
+    dist_norm = dist_norm.clip(0.0, 1.0)
+
+    speed = dist_norm.shift(lag) - dist_norm
+    speed = speed.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+
+    return pd.Series(speed, index=g.index, name="liquidity_rebuild_speed_20")
+
+
+def liquidity_sweep_wick_ratio_20(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high  = g["high"].astype(float)
+    low   = g["low"].astype(float)
+    open_ = g["open"].astype(float)
+    close = g["close"].astype(float)
+
+    lookback = 20
+
+    prior_high_20 = high.rolling(lookback).max().shift(1)
+    prior_low_20  = low .rolling(lookback).min().shift(1)
+
+    upper_body = np.maximum(open_, close)
+    lower_body = np.minimum(open_, close)
+
+    wick_above = (high - upper_body).clip(lower=0.0)
+    wick_below = (lower_body - low).clip(lower=0.0)
+
+    up_sweep   = (high > prior_high_20)
+    down_sweep = (low  < prior_low_20)
+
+    outside_up   = (high - prior_high_20).where(up_sweep, 0.0).clip(lower=0.0)
+    outside_down = (prior_low_20 - low).where(down_sweep, 0.0).clip(lower=0.0)
+
+    ratio_up = np.where(
+        wick_above > 0,
+        outside_up / wick_above,
+        0.0,
+    )
+
+    ratio_down = np.where(
+        wick_below > 0,
+        outside_down / wick_below,
+        0.0,
+    )
+
+    ratio = ratio_up + ratio_down
+    ratio = np.clip(ratio, 0.0, 1.0)
+
+    s = pd.Series(ratio, index=g.index, name="liquidity_sweep_wick_ratio_20")
+    return s
+
+
+def market_structure_break_count_50(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high  = g["high"].astype(float)
+    low   = g["low"].astype(float)
+    close = g["close"].astype(float)
+
+    lookback_ref = 20
+    lookback_count = 50
+
+    prior_high_20 = high.rolling(lookback_ref).max().shift(1)
+    prior_low_20  = low .rolling(lookback_ref).min().shift(1)
+
+    bull_break = (close > prior_high_20)
+    bear_break = (close < prior_low_20)
+
+    break_flag = (bull_break | bear_break).astype(float).fillna(0.0)
+
+    break_count_50 = break_flag.rolling(lookback_count, min_periods=1).sum()
+
+    return pd.Series(break_count_50.values, index=g.index, name="market_structure_break_count_50")
+
+
+def micro_range_stack_count_20(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"].astype(float)
+    low = g["low"].astype(float)
+
+    # True range
+    tr = (high - low).abs()
+
+    # Micro-range threshold (25th percentile)
+    threshold = tr.rolling(100, min_periods=30).quantile(0.25)
+
+    micro_flag = (tr <= threshold).astype(float).fillna(0.0)
+
+    # Count of micro ranges over last 20 bars
+    count = micro_flag.rolling(20, min_periods=1).sum()
+
+    return pd.Series(count, index=g.index, name="micro_range_stack_count_20")
+
+
+def mom_rsi_div_flag_14_5(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    close = g["close"].astype(float)
+    delta = close.diff()
+
+    gain = delta.clip(lower=0.0)
+    loss = (-delta).clip(lower=0.0)
+
+    alpha = 1.0 / 14.0
+    avg_gain = gain.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
+    avg_loss = loss.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
+
+    rs = avg_gain / avg_loss.replace(0.0, np.nan)
+    rsi = 100.0 - 100.0 / (1.0 + rs)
+    rsi = rsi.clip(0.0, 100.0)
+
+    L = 5
+    prev_high   = g["close"].shift(1).rolling(L, min_periods=L).max()
+    prev_low    = g["close"].shift(1).rolling(L, min_periods=L).min()
+    prev_rsi_hi = rsi.shift(1).rolling(L, min_periods=L).max()
+    prev_rsi_lo = rsi.shift(1).rolling(L, min_periods=L).min()
+
+    eps = 0.1  # tiny tolerance
+    bearish = (close > prev_high) & (rsi <= (prev_rsi_hi - eps))
+    bullish = (close < prev_low)  & (rsi >= (prev_rsi_lo + eps))
+
+    flag = np.where(bullish, 1, np.where(bearish, -1, 0)).astype(int)
+    s = pd.Series(flag, index=g.index, name="mom_rsi_div_flag_14_5")
+    return s
+
+
+def mom_volume_trend_div_flag_20(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    price_rolling_mean = g["close"].rolling(20).mean()
+    volume_rolling_mean = g["volume"].rolling(20).mean()
+
+    # Identify divergence
+    price_up = g["close"] > price_rolling_mean
+    volume_up = g["volume"] > volume_rolling_mean
+
+    divergence = (price_up != volume_up).astype(int)
+
+    s = pd.Series(divergence, index=g.index, name="mom_volume_trend_div_flag_20")
+    return s
+
+
+def orderblock_freshness_score_50(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"].astype(float)
+    low = g["low"].astype(float)
+    close = g["close"].astype(float)
+
+    win = 50
+
+    high50 = high.rolling(win).max()
+    low50  = low .rolling(win).min()
+    range50 = (high50 - low50).replace(0.0, np.nan)
+
+    dist_high = (close - high50).abs()
+    dist_low  = (close - low50).abs()
+
+    nearest_dist = pd.concat([dist_high, dist_low], axis=1).min(axis=1)
+
+    base = nearest_dist / range50
+    score = (1.0 - base).clip(0.0, 1.0).fillna(0.0)
+
+    return pd.Series(score, index=g.index, name="orderblock_freshness_score_50")
+
+
+def pivot_classic_pp_dist_1d(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]  # normalize
+    days = g.index.normalize()
+
+    # Daily OHLC (based on intraday)
+    daily = g.assign(__day=days).groupby("__day").agg(
+        high=("high", "max"),
+        low=("low", "min"),
+        close=("close", "last"),
+    )
+
+    # Previous-day pivots
+    daily_prev = daily.shift(1)
+    pp_daily = (daily_prev["high"] + daily_prev["low"] + daily_prev["close"]) / 3.0
+
+    # Map each intraday bar's day -> that day's PP (from previous day)
+    pp_intraday = pd.Series(pd.Index(days).map(pp_daily), index=g.index, dtype=float)
+
+    s = (g["close"].astype(float) - pp_intraday) / g["close"].astype(float)
+    s.name = "pivot_classic_pp_dist_1d"
+    return s
+
+
+def pivot_classic_r1_dist_1d(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+    days = g.index.normalize()
+
+    daily = g.assign(__day=days).groupby("__day").agg(
+        high=("high", "max"),
+        low=("low", "min"),
+        close=("close", "last"),
+    )
+    dprev = daily.shift(1)
+    pp = (dprev["high"] + dprev["low"] + dprev["close"]) / 3.0
+    r1_daily = 2.0 * pp - dprev["low"]
+
+    r1_intraday = pd.Series(pd.Index(days).map(r1_daily), index=g.index, dtype=float)
+
+    s = (g["close"].astype(float) - r1_intraday) / g["close"].astype(float)
+    s.name = "pivot_classic_r1_dist_1d"
+    return s
+
+
+def pivot_classic_r2_dist_1d(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+    days = g.index.normalize()
+
+    daily = g.assign(__day=days).groupby("__day").agg(
+        high=("high", "max"),
+        low=("low", "min"),
+        close=("close", "last"),
+    )
+    dprev = daily.shift(1)
+    pp = (dprev["high"] + dprev["low"] + dprev["close"]) / 3.0
+    r2_daily = pp + (dprev["high"] - dprev["low"])
+
+    r2_intraday = pd.Series(pd.Index(days).map(r2_daily), index=g.index, dtype=float)
+
+    s = (g["close"].astype(float) - r2_intraday) / g["close"].astype(float)
+    s.name = "pivot_classic_r2_dist_1d"
+    return s
+
+
+def pivot_classic_s1_dist_1d(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+    days = g.index.normalize()
+
+    daily = g.assign(__day=days).groupby("__day").agg(
+        high=("high", "max"),
+        low=("low", "min"),
+        close=("close", "last"),
+    )
+    dprev = daily.shift(1)
+    pp = (dprev["high"] + dprev["low"] + dprev["close"]) / 3.0
+    s1_daily = 2.0 * pp - dprev["high"]
+
+    s1_intraday = pd.Series(pd.Index(days).map(s1_daily), index=g.index, dtype=float)
+
+    s = (g["close"].astype(float) - s1_intraday) / g["close"].astype(float)
+    s.name = "pivot_classic_s1_dist_1d"
+    return s
+
+
+def pivot_classic_s2_dist_1d(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+    days = g.index.normalize()
+
+    daily = g.assign(__day=days).groupby("__day").agg(
+        high=("high", "max"),
+        low=("low", "min"),
+        close=("close", "last"),
+    )
+    dprev = daily.shift(1)
+    pp = (dprev["high"] + dprev["low"] + dprev["close"]) / 3.0
+    s2_daily = pp - (dprev["high"] - dprev["low"])
+
+    s2_intraday = pd.Series(pd.Index(days).map(s2_daily), index=g.index, dtype=float)
+
+    s = (g["close"].astype(float) - s2_intraday) / g["close"].astype(float)
+    s.name = "pivot_classic_s2_dist_1d"
+    return s
+
+
+def pivot_confluence_score_1d(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    if not isinstance(g.index, pd.DatetimeIndex):
+        raise ValueError("pivot_confluence_score_1d requires a DatetimeIndex.")
+
+    high = g["high"].astype(float)
+    low = g["low"].astype(float)
+    close = g["close"].astype(float)
+
+    # Extract date for grouping
+    dates = g.index.normalize()
+
+    # Daily OHLC
+    daily = pd.DataFrame({"high": high, "low": low, "close": close})
+    daily_ohlc = daily.groupby(dates).agg({"high": "max", "low": "min", "close": "last"})
+
+    prev = daily_ohlc.shift(1)
+
+    prev_high  = prev["high"].reindex(dates).values
+    prev_low   = prev["low"] .reindex(dates).values
+    prev_close = prev["close"].reindex(dates).values
+
+    prev_high  = pd.Series(prev_high,  index=g.index)
+    prev_low   = pd.Series(prev_low,   index=g.index)
+    prev_close = pd.Series(prev_close, index=g.index)
+
+    prev_range = (prev_high - prev_low).replace(0.0, np.nan)
+
+    PP = (prev_high + prev_low + prev_close) / 3
+    R1 = 2*PP - prev_low
+    S1 = 2*PP - prev_high
+    R2 = PP + (prev_high - prev_low)
+    S2 = PP - (prev_high - prev_low)
+
+    def norm_dist(level):
+        d = (close - level).abs() / prev_range
+        return d.replace([np.inf, -np.inf], np.nan)
+
+    dist_levels = [
+        norm_dist(PP),
+        norm_dist(R1),
+        norm_dist(S1),
+        norm_dist(R2),
+        norm_dist(S2),
+    ]
+
+    alpha = 5.0
+
+    score = sum(np.exp(-alpha * d.fillna(99)) for d in dist_levels)
+    score = pd.Series(score, index=g.index).fillna(0.0)
+
+    return score.rename("pivot_confluence_score_1d")
+
+
+def premium_discount_balance_50(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"].astype(float)
+    low = g["low"].astype(float)
+    close = g["close"].astype(float)
+
+    win = 50
+
+    high50 = high.rolling(win).max()
+    low50  = low .rolling(win).min()
+    mid50  = (high50 + low50) / 2.0
+
+    premium_flag  = (close > mid50).astype(float)
+    discount_flag = (close < mid50).astype(float)
+
+    premium_count  = premium_flag.rolling(win, min_periods=1).sum()
+    discount_count = discount_flag.rolling(win, min_periods=1).sum()
+
+    balance = (premium_count - discount_count) / float(win)
+    balance = balance.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+
+    return pd.Series(balance.values, index=g.index, name="premium_discount_balance_50")
+
+
+def price_prev_high_dist_1(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    prev_high = g["high"].shift(1)
+
+    epsilon = 0.01  # proximity range
+    flag = (abs(g["close"] - prev_high) / g["close"] <= epsilon).astype(int)
+
+    s = pd.Series(flag, index=g.index, name="price_prev_high_dist_1")
+    return s
+
+
+def price_prev_low_dist_1(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    prev_low = g["low"].shift(1)
+
+    epsilon = 0.01  # proximity range
+    flag = (abs(g["close"] - prev_low) / g["close"] <= epsilon).astype(int)
+
+    s = pd.Series(flag, index=g.index, name="price_prev_low_dist_1")
+    return s
+
+
+def prior_range_overlap_ratio_50(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"].astype(float)
+    low = g["low"].astype(float)
+
+    win = 50
+
+    high50 = high.rolling(win).max()
+    low50  = low .rolling(win).min()
+
+    high50_prev = high50.shift(1)
+    low50_prev  = low50.shift(1)
+
+    # Intersection
+    inter_low  = np.maximum(low50, low50_prev)
+    inter_high = np.minimum(high50, high50_prev)
+    intersection = (inter_high - inter_low).clip(lower=0.0)
+
+    # Union
+    union_low  = np.minimum(low50, low50_prev)
+    union_high = np.maximum(high50, high50_prev)
+    union = (union_high - union_low).clip(lower=0.0)
+
+    ratio = intersection / union.replace(0.0, np.nan)
+    ratio = ratio.clip(0.0, 1.0).fillna(0.0)
+
+    return pd.Series(ratio.values, index=g.index, name="prior_range_overlap_ratio_50")
+
+
+def range_breakout_flag_50(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]  # normalize
+
+    # Prior window (exclude current) via shift(1)
+    prev_high = g["high"].shift(1).rolling(50, min_periods=50).max().astype(float)
+    prev_low  = g["low"].shift(1).rolling(50, min_periods=50).min().astype(float)
+
+    c = g["close"].astype(float)
+
+    up_break   = c > prev_high
+    down_break = c < prev_low
+
+    # Map to {-1, 0, +1}; NaNs in prev_* yield False in comparisons -> 0
+    flag = np.where(up_break, 1, np.where(down_break, -1, 0)).astype(int)
+
+    s = pd.Series(flag, index=g.index, name="range_breakout_flag_50")
+    return s
+
+
+def range_high_dist_50(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]  # normalize
+
+    # Rolling 50-bar highest high (includes current bar)
+    rh = g["high"].rolling(50, min_periods=50).max().astype(float)
+
+    # Relative distance from range-high
+    s = (g["close"].astype(float) - rh) / g["close"].astype(float)
+    s = s.astype(float)
+    s.name = "range_high_dist_50"
+    return s
+
+
+def range_low_dist_50(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]  # normalize
+
+    # Rolling 50-bar lowest low (includes current bar)
+    rl = g["low"].rolling(50, min_periods=50).min().astype(float)
+
+    # Relative distance from range-low
+    s = (g["close"].astype(float) - rl) / g["close"].astype(float)
+    s = s.astype(float)
+    s.name = "range_low_dist_50"
+    return s
+
+
+def range_rotation_index_20(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"].astype(float)
+    low = g["low"].astype(float)
+
+    win = 20
+
+    high20 = high.rolling(win).max()
+    low20  = low .rolling(win).min()
+    mid20  = (high20 + low20) / 2.0
+
+    delta_mid = mid20 - mid20.shift(1)
+
+    sign_rot = np.sign(delta_mid).fillna(0.0)
+
+    rotation_index = sign_rot.rolling(win, min_periods=1).mean()
+    rotation_index = rotation_index.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+
+    return pd.Series(rotation_index.values, index=g.index, name="range_rotation_index_20")
+
+
+def range_tagging_bias_50(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"].astype(float)
+    low = g["low"].astype(float)
+    close = g["close"].astype(float)
+
+    win = 50
+
+    high50 = high.rolling(win).max()
+    low50  = low .rolling(win).min()
+    range50 = (high50 - low50).replace(0.0, np.nan)
+
+    thresh = 0.10 * range50
+
+    high_tag = ((high50 - close) <= thresh).astype(float)
+    low_tag  = ((close - low50) <= thresh).astype(float)
+
+    high_count = high_tag.rolling(win, min_periods=1).sum()
+    low_count  = low_tag .rolling(win, min_periods=1).sum()
+
+    bias = (high_count - low_count) / float(win)
+    bias = bias.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+
+    return pd.Series(bias.values, index=g.index, name="range_tagging_bias_50")
+
+
+def reg_shift_flag_50(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"].astype(float)
+    low  = g["low"].astype(float)
+    close = g["close"].astype(float)
+
+    win = 50
+    eps = 1e-9
+
+    # 50-bar range
+    high50 = high.rolling(win).max()
+    low50  = low .rolling(win).min()
+    range50 = (high50 - low50).replace(0.0, np.nan)
+
+    # True range approximation
+    tr = (high - low).abs()
+    tr_mean50 = tr.rolling(win).mean()
+
+    close_mean50 = close.rolling(win).mean()
+
+    trend50 = (close - close.shift(win)) / (range50 + eps)
+    vol50   = tr_mean50 / (close_mean50.abs() + eps)
+
+    regime = trend50 * vol50
+
+    # Compare with regime 50 bars ago
+    regime_prev = regime.shift(win)
+
+    # Conditions for a regime shift
+    mag_thresh = 0.02
+    diff_thresh = 0.05
+
+    cond_mag = (regime.abs() > mag_thresh) & (regime_prev.abs() > mag_thresh)
+    cond_sign = (np.sign(regime) != np.sign(regime_prev))
+    cond_jump = (regime - regime_prev).abs() > diff_thresh
+
+    flag = (cond_mag & cond_sign & cond_jump).astype(int).fillna(0)
+
+    return pd.Series(flag.values, index=g.index, name="reg_shift_flag_50")
+
+
+def reg_trending_flag_30(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"].astype(float)
+    low  = g["low"].astype(float)
+    close = g["close"].astype(float)
+
+    eps = 1e-9
+
+    # True range and ATR-like volatility
+    tr = (high - low).abs()
+    atr14 = tr.rolling(14).mean()
+
+    # 30-bar slope of close
+    slope30 = (close - close.shift(30)) / 30.0
+
+    norm_slope = slope30.abs() / (atr14 + eps)
+
+    # Threshold can be tuned based on asset / timeframe
+    threshold = 0.5
+    flag = (norm_slope > threshold).astype(int).fillna(0)
+
+    return pd.Series(flag.values, index=g.index, name="reg_trending_flag_30")
+
+
+def regime_range_flag_adx_14(df: pd.DataFrame) -> pd.Series:
+    g = df.copy(); g.columns = [str(c).lower() for c in g.columns]
+    h, l, c = g["high"].astype(float), g["low"].astype(float), g["close"].astype(float)
+
+    up_move   = h.diff()
+    down_move = -l.diff()
+
+    plus_dm  = np.where((up_move > down_move) & (up_move > 0),  up_move,  0.0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+    plus_dm  = pd.Series(plus_dm, index=g.index)
+    minus_dm = pd.Series(minus_dm, index=g.index)
+
+    tr = pd.concat([(h - l), (h - c.shift(1)).abs(), (l - c.shift(1)).abs()], axis=1).max(axis=1)
+
+    alpha = 1/14
+    tr_sm     = tr.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
+    plus_sm   = plus_dm.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
+    minus_sm  = minus_dm.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
+
+    plus_di  = 100.0 * (plus_sm  / tr_sm.replace(0.0, np.nan))
+    minus_di = 100.0 * (minus_sm / tr_sm.replace(0.0, np.nan))
+
+    dx = 100.0 * (plus_di - minus_di).abs() / (plus_di + minus_di).replace(0.0, np.nan)
+    adx = dx.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
+
+    flag = (adx < 20.0).astype(int).fillna(0)
+    s = pd.Series(flag.values, index=g.index, name="regime_range_flag_adx_14")
+    return s
+
+
+def regime_range_flag_bb_20_q20(df: pd.DataFrame) -> pd.Series:
+    g = df.copy(); g.columns = [str(c).lower() for c in g.columns]
+    c = g["close"].astype(float)
+
+    ma20 = c.rolling(20, min_periods=20).mean()
+    sd20 = c.rolling(20, min_periods=20).std(ddof=0)
+    bbw20 = (4.0 * sd20) / ma20.replace(0.0, np.nan)  # normalized width
+
+    # Rolling 20th percentile over 120 bars
+    # Note: rolling(...).quantile(q) is vectorized and avoids look-ahead.
+    thresh = bbw20.rolling(120, min_periods=120).quantile(0.20, interpolation="linear")
+
+    flag = (bbw20 <= thresh).astype(int).fillna(0)
+    s = pd.Series(flag.values, index=g.index, name="regime_range_flag_bb_20_q20")
+    return s
+
+
+def regime_trend_down_flag_adx_14(df: pd.DataFrame) -> pd.Series:
+    g = df.copy(); g.columns = [str(c).lower() for c in g.columns]
+    h, l, c = g["high"].astype(float), g["low"].astype(float), g["close"].astype(float)
+
+    up_move   = h.diff()
+    down_move = -l.diff()
+
+    plus_dm  = np.where((up_move > down_move) & (up_move > 0),  up_move,  0.0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+    plus_dm  = pd.Series(plus_dm, index=g.index)
+    minus_dm = pd.Series(minus_dm, index=g.index)
+
+    tr = pd.concat([(h - l), (h - c.shift(1)).abs(), (l - c.shift(1)).abs()], axis=1).max(axis=1)
+
+    alpha = 1/14
+    tr_sm     = tr.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
+    plus_sm   = plus_dm.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
+    minus_sm  = minus_dm.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
+
+    plus_di  = 100.0 * (plus_sm  / tr_sm.replace(0.0, np.nan))
+    minus_di = 100.0 * (minus_sm / tr_sm.replace(0.0, np.nan))
+
+    dx = 100.0 * (plus_di - minus_di).abs() / (plus_di + minus_di).replace(0.0, np.nan)
+    adx = dx.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
+
+    flag = ((adx >= 20.0) & (minus_di > plus_di)).astype(int).fillna(0)
+    s = pd.Series(flag.values, index=g.index, name="regime_trend_down_flag_adx_14")
+    return s
+
+
+def regime_trend_down_flag_slope_50_atr_14(df: pd.DataFrame) -> pd.Series:
+    g = df.copy(); g.columns = [str(c).lower() for c in g.columns]
+    y = g["close"].astype(float)
+    n = len(g); W = 50
+
+    t = pd.Series(np.arange(n, dtype=float), index=g.index)
+    t_mean = t.rolling(W, min_periods=W).mean()
+    y_mean = y.rolling(W, min_periods=W).mean()
+    cov = (t*y).rolling(W, min_periods=W).mean() - t_mean*y_mean
+    var = (t*t).rolling(W, min_periods=W).mean() - t_mean*t_mean
+    slope = cov / var.replace(0.0, np.nan)
+
+    h, l, c = g["high"].astype(float), g["low"].astype(float), g["close"].astype(float)
+    tr = pd.concat([
+        (h - l),
+        (h - c.shift(1)).abs(),
+        (l - c.shift(1)).abs()
+    ], axis=1).max(axis=1)
+    atr14 = tr.ewm(alpha=1/14, adjust=False, min_periods=14).mean()
+
+    z = slope / atr14.replace(0.0, np.nan)
+    k = 0.05
+    flag = (z <= -k).astype(int).fillna(0)
+    s = pd.Series(flag.values, index=g.index, name="regime_trend_down_flag_slope_50_atr_14")
+    return s
+
+
+def regime_trend_up_flag_adx_14(df: pd.DataFrame) -> pd.Series:
+    g = df.copy(); g.columns = [str(c).lower() for c in g.columns]
+    h, l, c = g["high"].astype(float), g["low"].astype(float), g["close"].astype(float)
+
+    up_move   = h.diff()
+    down_move = -l.diff()
+
+    plus_dm  = np.where((up_move > down_move) & (up_move > 0),  up_move,  0.0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+    plus_dm  = pd.Series(plus_dm, index=g.index)
+    minus_dm = pd.Series(minus_dm, index=g.index)
+
+    tr = pd.concat([(h - l), (h - c.shift(1)).abs(), (l - c.shift(1)).abs()], axis=1).max(axis=1)
+
+    alpha = 1/14
+    tr_sm     = tr.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
+    plus_sm   = plus_dm.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
+    minus_sm  = minus_dm.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
+
+    plus_di  = 100.0 * (plus_sm  / tr_sm.replace(0.0, np.nan))
+    minus_di = 100.0 * (minus_sm / tr_sm.replace(0.0, np.nan))
+
+    dx = 100.0 * (plus_di - minus_di).abs() / (plus_di + minus_di).replace(0.0, np.nan)
+    adx = dx.ewm(alpha=alpha, adjust=False, min_periods=14).mean()
+
+    flag = ((adx >= 20.0) & (plus_di > minus_di)).astype(int).fillna(0)
+    s = pd.Series(flag.values, index=g.index, name="regime_trend_up_flag_adx_14")
+    return s
+
+
+def regime_trend_up_flag_slope_50_atr_14(df: pd.DataFrame) -> pd.Series:
+    g = df.copy(); g.columns = [str(c).lower() for c in g.columns]
+    y = g["close"].astype(float)
+    n = len(g); W = 50
+
+    # Rolling OLS slope
+    t = pd.Series(np.arange(n, dtype=float), index=g.index)
+    t_mean = t.rolling(W, min_periods=W).mean()
+    y_mean = y.rolling(W, min_periods=W).mean()
+    cov = (t*y).rolling(W, min_periods=W).mean() - t_mean*y_mean
+    var = (t*t).rolling(W, min_periods=W).mean() - t_mean*t_mean
+    slope = cov / var.replace(0.0, np.nan)
+
+    # ATR(14) — Wilder
+    h, l, c = g["high"].astype(float), g["low"].astype(float), g["close"].astype(float)
+    tr = pd.concat([
+        (h - l),
+        (h - c.shift(1)).abs(),
+        (l - c.shift(1)).abs()
+    ], axis=1).max(axis=1)
+    atr14 = tr.ewm(alpha=1/14, adjust=False, min_periods=14).mean()
+
+    z = slope / atr14.replace(0.0, np.nan)
+    k = 0.05
+    flag = (z >= k).astype(int).fillna(0)
+    s = pd.Series(flag.values, index=g.index, name="regime_trend_up_flag_slope_50_atr_14")
+    return s
+
+
+def smc_liquidity_void_depth_50(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"].astype(float)
+    low  = g["low"].astype(float)
+
+    prev_high = high.shift(1)
+    prev_low  = low.shift(1)
+
+    # Gap up void
+    gap_up = (low > prev_high)
+    gap_up_depth = (low - prev_high).where(gap_up, 0.0)
+
+    # Gap down void
+    gap_down = (high < prev_low)
+    gap_down_depth = (prev_low - high).where(gap_down, 0.0)
+
+    void_depth_bar = np.maximum(gap_up_depth, gap_down_depth).fillna(0.0)
+
+    win = 50
+    max_void_50 = void_depth_bar.rolling(win).max()
+
+    high50 = high.rolling(win).max()
+    low50  = low .rolling(win).min()
+    range50 = (high50 - low50).replace(0.0, np.nan)
+
+    eps = 1e-9
+    depth_norm = max_void_50 / (range50 + eps)
+    depth_norm = depth_norm.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+
+    return pd.Series(depth_norm.values, index=g.index, name="smc_liquidity_void_depth_50")
+
+
+def structural_hh_hl_trend_score_50(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"].astype(float)
+    low  = g["low"].astype(float)
+
+    prev_high = high.shift(1)
+    prev_low  = low.shift(1)
+
+    up_struct   = ((high > prev_high) & (low > prev_low)).astype(int)
+    down_struct = ((high < prev_high) & (low < prev_low)).astype(int) * -1
+
+    struct_sign = up_struct + down_struct
+    struct_sign = struct_sign.astype(float).fillna(0.0)
+
+    win = 50
+    trend_score = struct_sign.rolling(win, min_periods=1).mean()
+    trend_score = trend_score.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+
+    return pd.Series(trend_score.values, index=g.index, name="structural_hh_hl_trend_score_50")
+
+
+def structure_shift_score_30(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high = g["high"].astype(float)
+    low  = g["low"].astype(float)
+
+    prev_high = high.shift(1)
+    prev_low  = low.shift(1)
+
+    up_struct   = ((high > prev_high) & (low > prev_low)).astype(int)
+    down_struct = ((high < prev_high) & (low < prev_low)).astype(int) * -1
+
+    struct_sign = (up_struct + down_struct).astype(float).fillna(0.0)
+
+    win = 30
+
+    bias_30 = struct_sign.rolling(win, min_periods=1).mean()
+    shift_score = bias_30 - bias_30.shift(win)
+
+    shift_score = shift_score.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+
+    return pd.Series(shift_score.values, index=g.index, name="structure_shift_score_30")
+
+
+def sweep_and_break_flag_20(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high  = g["high"].astype(float)
+    low   = g["low"].astype(float)
+    open_ = g["open"].astype(float)
+    close = g["close"].astype(float)
+
+    lookback = 20
+
+    prior_high_20 = high.rolling(lookback).max().shift(1)
+    prior_low_20  = low .rolling(lookback).min().shift(1)
+
+    up_sweep   = (high > prior_high_20)
+    down_sweep = (low  < prior_low_20)
+
+    break_down_after_up = up_sweep & (close < open_)
+    break_up_after_down = down_sweep & (close > open_)
+
+    flag = (break_down_after_up | break_up_after_down).astype(int).fillna(0)
+
+    return pd.Series(flag.values, index=g.index, name="sweep_and_break_flag_20")
+
+
+def swing_failure_pattern_flag_20(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high  = g["high"].astype(float)
+    low   = g["low"].astype(float)
+    open_ = g["open"].astype(float)
+    close = g["close"].astype(float)
+
+    lookback = 20
+
+    prior_high_20 = high.rolling(lookback).max().shift(1)
+    prior_low_20  = low .rolling(lookback).min().shift(1)
+
+    # Bearish SFP: sweep above prior high, close back below it, bearish candle
+    bearish_sfp = (
+        (high > prior_high_20) &
+        (close < prior_high_20) &
+        (close < open_)
+    )
+
+    # Bullish SFP: sweep below prior low, close back above it, bullish candle
+    bullish_sfp = (
+        (low < prior_low_20) &
+        (close > prior_low_20) &
+        (close > open_)
+    )
+
+    flag = (bearish_sfp | bullish_sfp).astype(int).fillna(0)
+
+    return pd.Series(flag.values, index=g.index, name="swing_failure_pattern_flag_20")
+
+
+def swing_leg_efficiency_ratio_30(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    close = g["close"].astype(float)
+
+    win = 30
+    eps = 1e-9
+
+    # Net move over 30 bars
+    net_move = (close - close.shift(win)).abs()
+
+    # Step-wise absolute changes
+    step_change = close.diff().abs()
+
+    # Rolling sum of absolute changes over 30 bars
+    path_sum = step_change.rolling(win, min_periods=1).sum()
+
+    efficiency = net_move / (path_sum + eps)
+    efficiency = efficiency.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+
+    return pd.Series(efficiency.values, index=g.index, name="swing_leg_efficiency_ratio_30")
+
+
+def time_dow_sin(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+
+    if not isinstance(g.index, pd.DatetimeIndex):
+        raise ValueError("time_dow_sin requires a DatetimeIndex.")
+
+    dow = g.index.dayofweek.astype(float)  # Monday=0, Sunday=6
+
+    values = np.sin(2.0 * np.pi * dow / 7.0)
+
+    return pd.Series(values, index=g.index, name="time_dow_sin")
+
+
+def time_hour_sin(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+
+    if not isinstance(g.index, pd.DatetimeIndex):
+        raise ValueError("time_hour_sin requires a DatetimeIndex.")
+
+    hour = g.index.hour.astype(float)
+    values = np.sin(2.0 * np.pi * hour / 24.0)
+
+    return pd.Series(values, index=g.index, name="time_hour_sin")
+
+
+def time_to_close_ratio(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+
+    if not isinstance(g.index, pd.DatetimeIndex):
+        raise ValueError("time_to_close_ratio requires a DatetimeIndex.")
+
+    dates = g.index.normalize()
+    temp = pd.DataFrame({"date": dates})
+    ratios = pd.Series(0.0, index=g.index, name="time_to_close_ratio")
+
+    # Group by calendar day
+    for date_val, grp_idx in temp.groupby("date").groups.items():
+        idx = grp_idx  # index positions for this day
+        n = len(idx)
+        if n == 1:
+            # Only one bar: we consider it as "at close"
+            ratios.iloc[idx] = 0.0
+            continue
+
+        j = np.arange(n, dtype=float)
+        denom = max(1.0, float(n - 1))
+        day_ratios = (denom - j) / denom
+
+        ratios.iloc[idx] = day_ratios
+
+    return ratios
+
+
+def trend_sma_cross_flag_5_20(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    s5  = g["close"].rolling(5,  min_periods=5).mean()
+    s20 = g["close"].rolling(20, min_periods=20).mean()
+    d = s5 - s20
+
+    cross_up   = (d > 0) & (d.shift(1) <= 0)
+    cross_down = (d < 0) & (d.shift(1) >= 0)
+
+    flag = np.where(cross_up, 1, np.where(cross_down, -1, 0)).astype(int)
+    s = pd.Series(flag, index=g.index, name="trend_sma_cross_flag_5_20")
+    return s
+
+
+def trendline_break_rsi_14(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    rsi_14 = g["close"].rolling(14).apply(lambda x: 100 - (100 / (1 + (x.diff().clip(0).mean() / x.diff().clip(None).mean()))))
+
+    rsi_trendline = rsi_14.rolling(14).mean()
+
+    breakout = (rsi_14 > rsi_trendline).astype(int)
+
+    s = pd.Series(breakout, index=g.index, name="trendline_break_rsi_14")
+    return s
+
+
+def trendline_slope_100(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    y = g["close"].astype(float)
+    n = len(g)
+    W = 100
+
+    t = pd.Series(np.arange(n, dtype=float), index=g.index)
+
+    t_mean = t.rolling(W, min_periods=W).mean()
+    y_mean = y.rolling(W, min_periods=W).mean()
+    cov = (t * y).rolling(W, min_periods=W).mean() - t_mean * y_mean
+    var = (t * t).rolling(W, min_periods=W).mean() - t_mean * t_mean
+
+    slope = cov / var.replace(0.0, np.nan)
+    slope = slope.astype(float)
+    slope.name = "trendline_slope_100"
+    return slope
+
+
+def trendline_touch_flag_100(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    y = g["close"].astype(float)
+    n = len(g)
+    W = 100
+    tol_mult = 0.25
+
+    t = pd.Series(np.arange(n, dtype=float), index=g.index)
+
+    t_mean = t.rolling(W, min_periods=W).mean()
+    y_mean = y.rolling(W, min_periods=W).mean()
+    ty_mean = (t * y).rolling(W, min_periods=W).mean()
+    t2_mean = (t * t).rolling(W, min_periods=W).mean()
+    y2_mean = (y * y).rolling(W, min_periods=W).mean()
+
+    cov_ty = ty_mean - t_mean * y_mean
+    var_t  = t2_mean - t_mean * t_mean
+    var_y  = y2_mean - y_mean * y_mean
+
+    slope = cov_ty / var_t.replace(0.0, np.nan)
+    intercept = y_mean - slope * t_mean
+    reg_line = slope * t + intercept
+
+    # residual & residual std
+    resid = y - reg_line
+    r = cov_ty / (np.sqrt(var_t) * np.sqrt(var_y))
+    resid_std = np.sqrt(np.clip(var_y * (1.0 - r * r), a_min=0.0, a_max=None))
+
+    flag = (resid.abs() <= (tol_mult * resid_std)).astype(int)
+    flag.name = "trendline_touch_flag_100"
+    return flag
+
+
+def volprof_poc_dist_100(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+    if not {"close","volume"}.issubset(g.columns):
+        raise ValueError("DataFrame must contain 'close' and 'volume'.")
+
+    c = g["close"].to_numpy(float)
+    v = g["volume"].to_numpy(float)
+    n = len(g); W = 100; BINS = 50
+
+    level = np.full(n, np.nan, float)
+
+    for i in range(W-1, n):
+        cs = c[i-W+1:i+1]
+        vs = v[i-W+1:i+1]
+        m = np.isfinite(cs) & np.isfinite(vs)
+        if m.sum() < 3:
+            continue
+        cs = cs[m]; vs = vs[m]
+        pmin, pmax = cs.min(), cs.max()
+        if not np.isfinite(pmin) or not np.isfinite(pmax) or pmax <= pmin:
+            continue
+        hist, edges = np.histogram(cs, bins=BINS, range=(pmin, pmax), weights=vs)
+        if hist.size == 0 or np.all(hist <= 0):
+            continue
+        j = int(np.argmax(hist))
+        level[i] = 0.5 * (edges[j] + edges[j+1])
+
+    s = (c - level) / c
+    s = pd.Series(s, index=g.index, dtype=float, name="volprof_poc_dist_100")
+    return s
+
+
+def volprof_vah_dist_100(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+    if not {"close","volume"}.issubset(g.columns):
+        raise ValueError("DataFrame must contain 'close' and 'volume'.")
+
+    def _wq(px: np.ndarray, w: np.ndarray, q: float) -> float:
+        m = np.isfinite(px) & np.isfinite(w) & (w >= 0)
+        px = px[m]; w = w[m]
+        if px.size < 3 or w.sum() <= 0:
+            return np.nan
+        order = np.argsort(px)
+        px = px[order]; w = w[order]
+        csum = np.cumsum(w)
+        thr = q * csum[-1]
+        i = int(np.searchsorted(csum, thr, side="left"))
+        i = min(max(i, 0), len(px)-1)
+        return float(px[i])
+
+    c = g["close"].to_numpy(float)
+    v = g["volume"].to_numpy(float)
+    n = len(g); W = 100
+
+    level = np.full(n, np.nan, float)
+    for i in range(W-1, n):
+        cs = c[i-W+1:i+1]
+        vs = v[i-W+1:i+1]
+        level[i] = _wq(cs, vs, 0.85)
+
+    s = (c - level) / c
+    s = pd.Series(s, index=g.index, dtype=float, name="volprof_vah_dist_100")
+    return s
+
+
+def volprof_val_dist_100(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+    if not {"close","volume"}.issubset(g.columns):
+        raise ValueError("DataFrame must contain 'close' and 'volume'.")
+
+    def _wq(px: np.ndarray, w: np.ndarray, q: float) -> float:
+        m = np.isfinite(px) & np.isfinite(w) & (w >= 0)
+        px = px[m]; w = w[m]
+        if px.size < 3 or w.sum() <= 0:
+            return np.nan
+        order = np.argsort(px)
+        px = px[order]; w = w[order]
+        csum = np.cumsum(w)
+        thr = q * csum[-1]
+        i = int(np.searchsorted(csum, thr, side="left"))
+        i = min(max(i, 0), len(px)-1)
+        return float(px[i])
+
+    c = g["close"].to_numpy(float)
+    v = g["volume"].to_numpy(float)
+    n = len(g); W = 100
+
+    level = np.full(n, np.nan, float)
+    for i in range(W-1, n):
+        cs = c[i-W+1:i+1]
+        vs = v[i-W+1:i+1]
+        level[i] = _wq(cs, vs, 0.15)
+
+    s = (c - level) / c
+    s = pd.Series(s, index=g.index, dtype=float, name="volprof_val_dist_100")
+    return s
+
+
+def wick_rejection_intensity_10(df: pd.DataFrame) -> pd.Series:
+    g = df.copy()
+    g.columns = [str(c).lower() for c in g.columns]
+
+    high  = g["high"].astype(float)
+    low   = g["low"].astype(float)
+    open_ = g["open"].astype(float)
+    close = g["close"].astype(float)
+
+    eps = 1e-9
+
+    upper_body = np.maximum(open_, close)
+    lower_body = np.minimum(open_, close)
+
+    upper_wick = (high - upper_body).clip(lower=0.0)
+    lower_wick = (lower_body - low).clip(lower=0.0)
+
+    wick_size = np.maximum(upper_wick, lower_wick)
+    tr = (high - low).abs()
+
+    raw_intensity = wick_size / (tr + eps)
+    raw_intensity = raw_intensity.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+
+    win = 10
+    mean_10 = raw_intensity.rolling(win, min_periods=1).mean()
+    std_10  = raw_intensity.rolling(win, min_periods=1).std(ddof=0)
+
+    z_score = (raw_intensity - mean_10) / (std_10 + eps)
+    z_score = z_score.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+
+    return pd.Series(z_score.values, index=g.index, name="wick_rejection_intensity_10")
+
+
+REFERENCE = {
+    "band_gauss_lower_dist_20_2": band_gauss_lower_dist_20_2,
+    "band_gauss_upper_dist_20_2": band_gauss_upper_dist_20_2,
+    "break_prev_high_flag_1": break_prev_high_flag_1,
+    "break_prev_low_flag_1": break_prev_low_flag_1,
+    "breaker_block_distance_20": breaker_block_distance_20,
+    "breaker_retest_flag_20": breaker_retest_flag_20,
+    "candle_engulf_strength_5": candle_engulf_strength_5,
+    "channel_reg_lower_dist_50": channel_reg_lower_dist_50,
+    "channel_reg_upper_dist_50": channel_reg_upper_dist_50,
+    "displacement_strength_10": displacement_strength_10,
+    "ent_perm_close_30": ent_perm_close_30,
+    "equal_highs_tightness_20": equal_highs_tightness_20,
+    "equal_lows_tightness_20": equal_lows_tightness_20,
+    "fib_extension_near_1_272": fib_extension_near_1_272,
+    "fib_extension_near_1_618": fib_extension_near_1_618,
+    "fib_retracement_near_0_500": fib_retracement_near_0_500,
+    "fib_retracement_near_0_618": fib_retracement_near_0_618,
+    "filt_dema_20": filt_dema_20,
+    "filt_gauss_close_20": filt_gauss_close_20,
+    "filt_savgol_11_3": filt_savgol_11_3,
+    "fvg_creation_flag_1": fvg_creation_flag_1,
+    "fvg_fill_ratio_30": fvg_fill_ratio_30,
+    "ichimoku_cloud_thickness_52": ichimoku_cloud_thickness_52,
+    "ichimoku_kijun_dist_26": ichimoku_kijun_dist_26,
+    "ichimoku_span_a_dist_52": ichimoku_span_a_dist_52,
+    "ichimoku_span_b_dist_52": ichimoku_span_b_dist_52,
+    "ichimoku_tenkan_dist_9": ichimoku_tenkan_dist_9,
+    "internal_range_shift_20": internal_range_shift_20,
+    "liq_zone_strength_50": liq_zone_strength_50,
+    "liq_zone_touch_flag_50": liq_zone_touch_flag_50,
+    "liquidity_grab_efficiency_10": liquidity_grab_efficiency_10,
+    "liquidity_rebuild_speed_20": liquidity_rebuild_speed_20,
+    "liquidity_sweep_wick_ratio_20": liquidity_sweep_wick_ratio_20,
+    "market_structure_break_count_50": market_structure_break_count_50,
+    "micro_range_stack_count_20": micro_range_stack_count_20,
+    "mom_rsi_div_flag_14_5": mom_rsi_div_flag_14_5,
+    "mom_volume_trend_div_flag_20": mom_volume_trend_div_flag_20,
+    "orderblock_freshness_score_50": orderblock_freshness_score_50,
+    "pivot_classic_pp_dist_1d": pivot_classic_pp_dist_1d,
+    "pivot_classic_r1_dist_1d": pivot_classic_r1_dist_1d,
+    "pivot_classic_r2_dist_1d": pivot_classic_r2_dist_1d,
+    "pivot_classic_s1_dist_1d": pivot_classic_s1_dist_1d,
+    "pivot_classic_s2_dist_1d": pivot_classic_s2_dist_1d,
+    "pivot_confluence_score_1d": pivot_confluence_score_1d,
+    "premium_discount_balance_50": premium_discount_balance_50,
+    "price_prev_high_dist_1": price_prev_high_dist_1,
+    "price_prev_low_dist_1": price_prev_low_dist_1,
+    "prior_range_overlap_ratio_50": prior_range_overlap_ratio_50,
+    "range_breakout_flag_50": range_breakout_flag_50,
+    "range_high_dist_50": range_high_dist_50,
+    "range_low_dist_50": range_low_dist_50,
+    "range_rotation_index_20": range_rotation_index_20,
+    "range_tagging_bias_50": range_tagging_bias_50,
+    "reg_shift_flag_50": reg_shift_flag_50,
+    "reg_trending_flag_30": reg_trending_flag_30,
+    "regime_range_flag_adx_14": regime_range_flag_adx_14,
+    "regime_range_flag_bb_20_q20": regime_range_flag_bb_20_q20,
+    "regime_trend_down_flag_adx_14": regime_trend_down_flag_adx_14,
+    "regime_trend_down_flag_slope_50_atr_14": regime_trend_down_flag_slope_50_atr_14,
+    "regime_trend_up_flag_adx_14": regime_trend_up_flag_adx_14,
+    "regime_trend_up_flag_slope_50_atr_14": regime_trend_up_flag_slope_50_atr_14,
+    "smc_liquidity_void_depth_50": smc_liquidity_void_depth_50,
+    "structural_hh_hl_trend_score_50": structural_hh_hl_trend_score_50,
+    "structure_shift_score_30": structure_shift_score_30,
+    "sweep_and_break_flag_20": sweep_and_break_flag_20,
+    "swing_failure_pattern_flag_20": swing_failure_pattern_flag_20,
+    "swing_leg_efficiency_ratio_30": swing_leg_efficiency_ratio_30,
+    "time_dow_sin": time_dow_sin,
+    "time_hour_sin": time_hour_sin,
+    "time_to_close_ratio": time_to_close_ratio,
+    "trend_sma_cross_flag_5_20": trend_sma_cross_flag_5_20,
+    "trendline_break_rsi_14": trendline_break_rsi_14,
+    "trendline_slope_100": trendline_slope_100,
+    "trendline_touch_flag_100": trendline_touch_flag_100,
+    "volprof_poc_dist_100": volprof_poc_dist_100,
+    "volprof_vah_dist_100": volprof_vah_dist_100,
+    "volprof_val_dist_100": volprof_val_dist_100,
+    "wick_rejection_intensity_10": wick_rejection_intensity_10,
+}
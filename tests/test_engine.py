@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from feature_engine import (compute_features_chunked, compute_features_parallel, compute_scope,
+                            default_registry, shared)
+from feature_engine.benchmark import DEFAULT_SIZES, benchmark_frame
+from feature_engine.cache import input_fingerprint
+from feature_engine.context import as_context
+from feature_engine.memo import active_cache
+
+
+@pytest.fixture(scope="module")
+def in_memory(ohlcv):
+    return default_registry.compute(ohlcv)
+
+
+@pytest.mark.parametrize("chunk_rows", [700, 1000])
+def test_chunked_matches_in_memory(ohlcv, in_memory, tmp_path, chunk_rows):
+    matrix, names = in_memory
+    chunked, chunked_names = compute_features_chunked(ohlcv, tmp_path / "features.npy", chunk_rows=chunk_rows)
+    assert chunked_names == names
+    for j, code in enumerate(names):
+        np.testing.assert_array_equal(chunked[:, j], matrix[:, j], err_msg=code)
+
+
+def test_parallel_matches_serial(ohlcv, in_memory):
+    matrix, names = in_memory
+    parallel, parallel_names, timings = compute_features_parallel(ohlcv, processes=2)
+    assert parallel_names == names
+    assert set(timings) == set(names)
+    np.testing.assert_array_equal(parallel, matrix)
+
+
+def test_parallel_fills_every_column_of_a_repeated_code(ohlcv):
+    codes = ["break_prev_high_flag_1", "band_gauss_upper_dist_20_2", "break_prev_high_flag_1"]
+    matrix, names = default_registry.compute(ohlcv, codes)
+    parallel, parallel_names, timings = compute_features_parallel(ohlcv, codes, processes=2)
+    assert parallel_names == names == codes
+    assert set(timings) == set(codes)
+    np.testing.assert_array_equal(parallel, matrix)
+
+
+def test_memo_is_keyed_on_the_frame_buffers(ohlcv):
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return len(calls)
+
+    edited = ohlcv.copy()
+    edited.iloc[10, 3] += 1.0
+    with compute_scope(ohlcv) as cache:
+        assert active_cache(ohlcv) is cache
+        assert active_cache(ohlcv.iloc[:]) is cache  # a shallow view shares the buffers
+        assert active_cache(edited) is None           # same length and index endpoints, other data
+        assert active_cache(pd.DataFrame(ohlcv.to_numpy(), index=ohlcv.index, columns=ohlcv.columns)) is None
+        assert shared(ohlcv, "key", factory) == shared(ohlcv, "key", factory) == 1
+        assert shared(edited, "key", factory) == 2
+
+
+def test_benchmark_frame_stays_finite_at_the_largest_size():
+    df = benchmark_frame(max(DEFAULT_SIZES))
+    close = df["close"].to_numpy()
+    assert np.isfinite(np.square(close)).all()
+    assert close.max() / close.min() < 1e3
+
+
+def test_input_fingerprint_hashes_index_dtype_and_values(ohlcv):
+    frame = ohlcv.iloc[:50].reset_index(drop=True)
+    labels = [frame.set_axis(index) for index in (
+        pd.RangeIndex(50), pd.Index(np.arange(50, dtype=np.float64)),
+        pd.Index([str(i) for i in range(50)]), pd.Index([str(i) for i in range(1, 51)]),
+    )]
+    assert len({input_fingerprint(as_context(df)) for df in labels}) == len(labels)
+    assert input_fingerprint(as_context(labels[2])) == input_fingerprint(as_context(labels[2].copy()))
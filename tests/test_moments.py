@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from feature_engine.extrema import RangeExtrema
+from feature_engine.moments import RollingMoments
+from helpers import assert_same
+
+
+@pytest.fixture(scope="module")
+def values():
+    rng = np.random.default_rng(7)
+    x = 1e5 + np.cumsum(rng.normal(0.0, 50.0, 2000))
+    x[rng.choice(2000, 60, replace=False)] = np.nan
+    x[700:730] = np.nan
+    x[[100, 1500]] = [np.inf, -np.inf]
+    return x
+
+
+@pytest.mark.parametrize("window, min_periods", [(1, None), (5, None), (20, None), (20, 1), (50, 10), (300, 0)])
+def test_rolling_moments_match_pandas(values, window, min_periods):
+    moments = RollingMoments(values)
+    roll = pd.Series(values).rolling(window, min_periods=min_periods)
+
+    assert_same(moments.sum(window, min_periods), roll.sum(), rtol=1e-12, atol=1e-6)
+    assert_same(moments.mean(window, min_periods), roll.mean(), rtol=1e-12)
+    for ddof in (0, 1):
+        assert_same(moments.std(window, min_periods, ddof=ddof), roll.std(ddof=ddof), rtol=1e-6, atol=1e-6)
+        assert_same(moments.var(window, min_periods, ddof=ddof), roll.var(ddof=ddof), rtol=1e-6, atol=1e-6)
+
+
+def test_flat_window_has_zero_variance(values):
+    # pandas' add/remove recurrence leaves a residue here; the prefix sums do not
+    x = values.copy()
+    x[900:950] = 1e5
+    moments = RollingMoments(x)
+    np.testing.assert_array_equal(moments.var(20)[920:950], 0.0)
+    np.testing.assert_array_equal(moments.mean(20)[920:950], 1e5)
+    assert np.isnan(moments.zscore(20)[920:950]).all()
+
+
+def test_rolling_zscore_matches_pandas(values):
+    s = pd.Series(values)
+    expected = (s - s.rolling(20).mean()) / s.rolling(20).std()
+    finite = np.isfinite(values)
+    assert_same(RollingMoments(values).zscore(20)[finite], expected[finite], rtol=1e-6, atol=1e-9)
+
+
+def test_integer_series_are_exact():
+    flags = (np.random.default_rng(1).random(5000) < 0.3).astype(float)
+    moments = RollingMoments(flags)
+    roll = pd.Series(flags).rolling(50, min_periods=1)
+    np.testing.assert_array_equal(moments.sum(50, 1), roll.sum())
+    np.testing.assert_array_equal(moments.mean(50, 1), roll.mean())
+
+
+def test_rolling_moments_2d_matches_columns(values):
+    panel = np.column_stack([values, values[::-1], np.arange(values.shape[0], dtype=float)])
+    both = RollingMoments(panel)
+    for j in range(panel.shape[1]):
+        single = RollingMoments(panel[:, j])
+        np.testing.assert_array_equal(both.mean(30)[:, j], single.mean(30))
+        np.testing.assert_array_equal(both.std(30, ddof=0)[:, j], single.std(30, ddof=0))
+
+
+@pytest.mark.parametrize("window, min_periods", [(1, None), (2, None), (7, None), (50, None), (50, 5), (257, 1)])
+def test_range_extrema_match_pandas(values, window, min_periods):
+    finite = np.where(np.isinf(values), np.nan, values)
+    extrema = RangeExtrema(finite)
+    roll = pd.Series(finite).rolling(window, min_periods=min_periods)
+    np.testing.assert_array_equal(extrema.max(window, min_periods), roll.max())
+    np.testing.assert_array_equal(extrema.min(window, min_periods), roll.min())
+
+
+def test_range_extrema_2d_matches_pandas(values):
+    frame = pd.DataFrame({"a": values, "b": values[::-1]}).replace([np.inf, -np.inf], np.nan)
+    extrema = RangeExtrema(frame.to_numpy())
+    np.testing.assert_array_equal(extrema.max(20), frame.rolling(20).max().to_numpy())
+    np.testing.assert_array_equal(extrema.min(20, 3), frame.rolling(20, min_periods=3).min().to_numpy())
@@ -0,0 +1,32 @@
+import json
+import shutil
+from pathlib import Path
+
+import sepratore
+from feature_engine.manifest import load_manifest
+
+ROOT = Path(__file__).resolve().parent.parent
+NOTEBOOK = ROOT / "Market_Trader.ipynb"
+FEATURES = ROOT / "features"
+
+
+def test_notebook_and_features_agree():
+    assert sepratore.notebook_drift(str(NOTEBOOK), str(FEATURES)) == []
+
+
+def test_manifest_is_current():
+    assert load_manifest(FEATURES) is not None
+
+
+def test_sync_writes_module_edits_back(tmp_path):
+    notebook = tmp_path / NOTEBOOK.name
+    features = tmp_path / "features"
+    shutil.copy(NOTEBOOK, notebook)
+    shutil.copytree(FEATURES, features)
+    name = next(iter(sepratore._module_cells(json.loads(notebook.read_text(encoding="utf-8")))))
+
+    module = features / f"{name}.py"
+    module.write_text(module.read_text(encoding="utf-8") + "\n# edited", encoding="utf-8")
+    assert sepratore.notebook_drift(str(notebook), str(features)) == [name]
+    assert sepratore.sync_notebook_from_features(str(notebook), str(features)) == [name]
+    assert sepratore.notebook_drift(str(notebook), str(features)) == []
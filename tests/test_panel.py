@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from feature_engine import default_registry
+from feature_engine.panel import Panel, compute_panel_features
+from feature_engine.synthetic import make_consecutive_ohlcv
+from helpers import inject_nans
+
+PANEL_CODES = [code for code in default_registry.codes
+               if hasattr(default_registry.get(code), "compute_panel")]
+
+
+@pytest.fixture(scope="module")
+def frames():
+    a = make_consecutive_ohlcv(1500, seed=1, vol_per_bar=0.01)
+    b = inject_nans(make_consecutive_ohlcv(1500, seed=2, vol_per_bar=0.005))
+    c = make_consecutive_ohlcv(1200, seed=3, vol_per_bar=0.02).iloc[200:]  # starts later, misses bars
+    return {"a": a, "b": b, "c": c.drop(c.index[300:340])}
+
+
+@pytest.fixture(scope="module")
+def panel(frames):
+    return Panel.from_frames(frames)
+
+
+def per_symbol(frames, panel, code):
+    module = default_registry.get(code)
+    return np.stack([np.asarray(module.compute_feature(frames[sym].reindex(panel.index)), dtype=np.float64)
+                     for sym in panel.symbols])
+
+
+def test_panel_codes_found():
+    assert len(PANEL_CODES) >= 15
+
+
+@pytest.mark.parametrize("code", PANEL_CODES)
+def test_compute_panel_matches_per_symbol(code, frames, panel):
+    tensor, _ = compute_panel_features(panel, [code])
+    np.testing.assert_array_equal(tensor[:, :, 0], per_symbol(frames, panel, code).astype(np.float32))
+
+
+def test_panel_build_matches_per_symbol_build(frames, panel):
+    tensor, names = compute_panel_features(panel)
+    for k, sym in enumerate(panel.symbols):
+        matrix, _ = default_registry.compute(frames[sym].reindex(panel.index), names)
+        np.testing.assert_array_equal(tensor[k], matrix)
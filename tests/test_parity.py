@@ -0,0 +1,32 @@
+import pytest
+
+from feature_engine import default_registry
+from helpers import assert_same
+from reference_features import REFERENCE
+
+
+@pytest.mark.parametrize("frame", ["ohlcv", "ohlcv_nan"])
+@pytest.mark.parametrize("code", sorted(REFERENCE))
+def test_feature_matches_reference(code, frame, request):
+    df = request.getfixturevalue(frame)
+    expected = REFERENCE[code](df.copy())
+    actual = default_registry.get(code).compute_feature(df)
+
+    assert len(actual) == len(df)
+    assert actual.index.equals(df.index)
+    # compensated / compiled rewrites may differ from pandas in the last bits only
+    assert_same(actual, expected, rtol=1e-8, atol=1e-12)
+
+
+@pytest.mark.parametrize("code", sorted(c for c in REFERENCE if c.startswith("volprof_")))
+def test_volume_profile_matches_reference_on_ties(code, ohlcv_ties):
+    expected = REFERENCE[code](ohlcv_ties.copy())
+    actual = default_registry.get(code).compute_feature(ohlcv_ties)
+
+    # ties in the histogram argmax and the value-area cumsum break as numpy's do
+    assert_same(actual, expected)
+
+
+def test_reference_covers_the_library():
+    assert len(REFERENCE) >= 75
+    assert set(REFERENCE) <= set(default_registry.codes)
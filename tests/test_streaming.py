@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+
+from helpers import assert_same
+from feature_engine import default_registry
+
+
+@pytest.mark.parametrize("frame", ["ohlcv", "ohlcv_nan"])
+@pytest.mark.parametrize("code", default_registry.streaming_codes)
+def test_stream_matches_batch(code, frame, request):
+    df = request.getfixturevalue(frame)
+    half = len(df) // 2
+    batch = default_registry.get(code).compute_feature(df)
+
+    stream = default_registry.stream(code, df.iloc[:half])
+    primed = stream.run(df.iloc[:half])
+    live = [stream.update(bar) for _, bar in df.iloc[half:].iterrows()]
+
+    assert_same(np.r_[primed, live], batch, rtol=1e-7, atol=1e-9)